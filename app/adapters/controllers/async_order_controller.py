@@ -0,0 +1,181 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.adapters.controllers.order_controller import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NDJSON_RESPONSE, \
+    PAYMENT_STATUS_MAX_WAIT_SECONDS, PAYMENT_STATUS_WAIT_DESCRIPTION, _ndjson_response, _payment_status_response, \
+    order_board_feed
+from app.adapters.dependencies.auth import get_current_user_async
+from app.adapters.gateways.coupon import AsyncCouponRepository
+from app.adapters.gateways.order import AsyncOrderRepository
+from app.adapters.gateways.payment import AsyncPaymentRepository
+from app.adapters.gateways.product import AsyncProductRepository
+from app.adapters.notifiers.order_board_feed import OrderBoardFeed, get_order_event_publisher
+from app.adapters.notifiers.payment_status_notifier import PaymentStatusNotifier, get_payment_status_notifier
+from app.adapters.presenters.conditional_response import validator_headers, is_not_modified, \
+    not_modified_response
+from app.adapters.presenters.json_response import json_response
+from app.adapters.presenters.order.order_presenter import OrderPresenter
+from app.core.entities.payment import Payment
+from app.core.schemas.order_schemas import OrderIn, OrderOut, OrderPageOut
+from app.core.usecases.orders.create_order_service import AsyncCreateOrderService
+from app.core.usecases.orders.list_order_service import ListOrdersService, ListOrdersByStatusService, \
+    ListOrdersByClientService, AsyncListOrdersService, AsyncGetOrderByIdService, AsyncListOrdersByStatusService, \
+    AsyncListOrdersByClientService
+from app.core.usecases.orders.place_order_service import AsyncPlaceOrderService
+from app.core.usecases.orders.update_order_service import AsyncUpdateOrderStatusService
+from app.core.usecases.payment.create_payment_service import AsyncPaymentService
+from app.core.usecases.payment.get_payment_status_service import AsyncGetPaymentStatusService
+from app.core.usecases.payment.wait_payment_status_service import WaitPaymentStatusService
+from app.devices.db.connection import get_async_db_session, get_session_factory
+from app.devices.db.unit_of_work import SqlAlchemyAsyncUnitOfWork, get_async_unit_of_work
+from app.shared.enums.order_status import OrderStatus
+
+# Mesmas rotas do `order_controller`, servidas pela pilha assíncrona quando DB_ASYNC=true.
+# O NDJSON (`stream=true`) e o feed SSE continuam com as implementações do módulo síncrono:
+# ambos já abrem a própria sessão fora da requisição.
+router = APIRouter()
+
+@router.post("/orders", response_model=OrderOut, status_code=201)
+async def create_order(
+    order_in: OrderIn,
+    uow: SqlAlchemyAsyncUnitOfWork = Depends(get_async_unit_of_work),
+    user: Optional[dict] = Depends(get_current_user_async),
+    event_publisher: OrderBoardFeed = Depends(get_order_event_publisher),
+):
+    """Cria um novo pedido"""
+    db = uow.session
+    # Preço e estoque do pedido vêm do banco, nunca do cache do catálogo
+    service = AsyncPlaceOrderService(
+        uow,
+        AsyncCreateOrderService(AsyncOrderRepository(db), AsyncProductRepository(db), AsyncCouponRepository(db)),
+        AsyncPaymentService(AsyncPaymentRepository(db)),
+        event_publisher,
+    )
+    client_id = None if user is None else user["user_id"]
+    try:
+        order = await service.execute(order_in, client_id=client_id)
+        return OrderPresenter.present(order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/orders", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+async def list_orders(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: AsyncSession = Depends(get_async_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista os pedidos em andamento, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersService(repo).stream())
+    service = AsyncListOrdersService(AsyncOrderRepository(db))
+    try:
+        return json_response(OrderPresenter.present_page_json(await service.execute_page(limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+router.add_api_route(
+    "/orders/board/feed",
+    order_board_feed,
+    methods=["GET"],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Eventos do painel (SSE)"}},
+)
+
+@router.get("/orders/{order_id}", response_model=OrderOut)
+async def get_order_by_id(
+    order_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db_session)
+):
+    """Busca um pedido pelo ID. Suporta If-None-Match/If-Modified-Since (304)."""
+    service = AsyncGetOrderByIdService(AsyncOrderRepository(db))
+    version = await service.version(order_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    headers = validator_headers(version, order_id)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+    order = await service.execute(order_id)
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return OrderPresenter.present(order)
+
+@router.get("/orders/status/{status}", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+async def list_orders_by_status(
+    status: OrderStatus,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: AsyncSession = Depends(get_async_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista pedidos por status, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersByStatusService(repo).stream(status))
+    service = AsyncListOrdersByStatusService(AsyncOrderRepository(db))
+    try:
+        return json_response(OrderPresenter.present_page_json(await service.execute_page(status, limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/orders/client/{client_id}", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+async def list_orders_by_client(
+    client_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: AsyncSession = Depends(get_async_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista pedidos de um cliente específico, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersByClientService(repo).stream(client_id))
+    service = AsyncListOrdersByClientService(AsyncOrderRepository(db))
+    try:
+        return json_response(OrderPresenter.present_page_json(await service.execute_page(client_id, limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/orders/{order_id}/status", response_model=OrderOut)
+async def update_order_status(
+    order_id: int,
+    new_status: OrderStatus,
+    db: AsyncSession = Depends(get_async_db_session),
+    event_publisher: OrderBoardFeed = Depends(get_order_event_publisher),
+):
+    service = AsyncUpdateOrderStatusService(AsyncOrderRepository(db), AsyncPaymentRepository(db), event_publisher)
+    try:
+        updated_order = await service.execute(order_id, new_status)
+        return OrderPresenter.present(updated_order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/orders/{order_id}/payment_status")
+async def get_payment_status(
+    order_id: int,
+    wait: float = Query(0, ge=0, le=PAYMENT_STATUS_MAX_WAIT_SECONDS, description=PAYMENT_STATUS_WAIT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db_session),
+    notifier: PaymentStatusNotifier = Depends(get_payment_status_notifier),
+):
+    """
+    Retorna o status de pagamento do pedido informado.
+    """
+    get_status = AsyncGetPaymentStatusService(AsyncPaymentRepository(db))
+
+    async def read_payment(order_id: int) -> Payment:
+        try:
+            return await get_status.execute(order_id)
+        finally:
+            # Encerra a transação de leitura: a conexão volta ao pool durante a espera
+            await db.rollback()
+
+    service = WaitPaymentStatusService(read_payment, notifier)
+    try:
+        payment = await service.execute(order_id, wait)
+        return _payment_status_response(payment)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.controllers.product_controller import CATALOG_BODY, DEACTIVATE_MISSING_DESCRIPTION, _read_catalog
+from app.adapters.gateways.product import AsyncProductRepository
+from app.adapters.presenters.conditional_response import validator_headers, is_not_modified, \
+    not_modified_response
+from app.adapters.presenters.json_response import json_response
+from app.adapters.presenters.products.product_presenter import ProductPresenter
+from app.core.schemas.product_schemas import ProductIn, ProductOut, ProductCatalogDiffOut
+from app.core.usecases.products.create_product_service import AsyncCreateProductService
+from app.core.usecases.products.delete_product_service import AsyncDeleteProductService
+from app.core.usecases.products.list_products_service import AsyncListProductsService, \
+    AsyncListProductsByCategoryService, AsyncGetMenuService
+from app.core.usecases.products.update_product_service import AsyncUpdateProductService
+from app.core.usecases.products.upsert_product_catalog_service import AsyncUpsertProductCatalogService
+from app.devices.db.connection import get_async_db_session
+from app.shared.enums.categorys import CategoryEnum
+
+# Mesmas rotas do `product_controller`, servidas pela pilha assíncrona quando DB_ASYNC=true.
+router = APIRouter()
+
+@router.get("/products", response_model=List[ProductOut])
+async def list_products(request: Request, db: AsyncSession = Depends(get_async_db_session)):
+    """Lista todos os produtos. Suporta If-None-Match/If-Modified-Since (304)."""
+    service = AsyncListProductsService(AsyncProductRepository(db, cached=True))
+    headers = validator_headers(await service.version())
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_list_json(await service.execute()), headers)
+
+@router.get("/products/menu", response_model=Dict[CategoryEnum, List[ProductOut]])
+async def get_menu(request: Request, db: AsyncSession = Depends(get_async_db_session)):
+    """Cardápio completo agrupado por categoria, em uma única consulta. Suporta 304."""
+    service = AsyncGetMenuService(AsyncProductRepository(db, cached=True))
+    headers = validator_headers(await service.version())
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_menu_json(await service.execute()), headers)
+
+@router.get("/products/category/{category}", response_model=List[ProductOut])
+async def list_products_by_category(
+    category: CategoryEnum, request: Request, db: AsyncSession = Depends(get_async_db_session)
+):
+    """Lista produtos por categoria. Suporta If-None-Match/If-Modified-Since (304)."""
+    service = AsyncListProductsByCategoryService(AsyncProductRepository(db, cached=True))
+    headers = validator_headers(await service.version(category.value))
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_list_json(await service.execute(category.value)), headers)
+
+@router.post("/products", response_model=ProductOut, status_code=201)
+async def create_product(product_in: ProductIn, db: AsyncSession = Depends(get_async_db_session)):
+    """Cria um novo produto"""
+    service = AsyncCreateProductService(AsyncProductRepository(db))
+
+    try:
+        product = await service.execute(product_in)
+        return ProductPresenter.present(product)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/products/bulk", response_model=ProductCatalogDiffOut, openapi_extra=CATALOG_BODY)
+async def bulk_upsert_products(
+    request: Request,
+    deactivate_missing: bool = Query(True, description=DEACTIVATE_MISSING_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    Cria ou atualiza, pelo nome, todos os produtos do catálogo em uma única transação
+    e retorna o resumo das alterações (criados, atualizados, inalterados e desativados).
+    """
+    products = await _read_catalog(request)
+    service = AsyncUpsertProductCatalogService(AsyncProductRepository(db))
+
+    try:
+        diff = await service.execute(products, deactivate_missing)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProductPresenter.present_catalog_diff(diff)
+
+@router.put("/products/{product_id}", response_model=ProductOut)
+async def update_product(product_id: int, product_in: ProductIn, db: AsyncSession = Depends(get_async_db_session)):
+    """Atualiza um produto existente"""
+    service = AsyncUpdateProductService(AsyncProductRepository(db))
+
+    try:
+        updated_product = await service.execute(product_id, product_in)
+        return ProductPresenter.present(updated_product)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.delete("/products/{product_id}", status_code=204)
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_async_db_session)):
+    """Deleta um produto"""
+    service = AsyncDeleteProductService(AsyncProductRepository(db))
+
+    try:
+        await service.execute(product_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return
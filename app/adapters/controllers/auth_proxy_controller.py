@@ -1,14 +1,16 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.adapters.gateways.auth_provider import get_auth_provider
 from app.adapters.presenters.client.client_identify_presenter import ClientIdentifyPresenter
+from app.core.ports.auth_provider_port import AuthProviderPort
 from app.core.schemas.client_schemas import ClientIdentifyOut
 from app.core.usecases.clients.auth_proxy_service import AuthProxyService
 
 router = APIRouter()
 
 @router.get("/clients/auth/{cpf}", response_model=ClientIdentifyOut)
-async def get_client_cognito(cpf: str):
-    service = AuthProxyService()
+async def get_client_cognito(cpf: str, auth_provider: AuthProviderPort = Depends(get_auth_provider)):
+    service = AuthProxyService(auth_provider)
     try:
         jwt_token = await service.execute(cpf)
     except ValueError as e:
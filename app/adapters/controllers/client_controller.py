@@ -1,20 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+import tempfile
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from typing import List
 from sqlalchemy.orm import Session
 
-from app.adapters.gateways.client import ClientRepository
+from app.adapters.gateways.client import ClientRepository, ThreadPoolClientRepository
+from app.adapters.gateways.client_import import ClientCopyImporter
 from app.adapters.presenters.client.client_identify_presenter import ClientIdentifyPresenter
 from app.adapters.presenters.client.client_presenter import ClientPresenter
 from app.adapters.presenters.client.clients_presenter import ClientsPresenter
-from app.core.schemas.client_schemas import ClientOut, ClientIn, ClientsOut, ClientIdentifyOut, ClientUpdateIn
-from app.core.usecases.clients.create_client_service import CreateClientService
+from app.core.ports.password_hasher_port import PasswordHasherPort
+from app.core.schemas.client_schemas import ClientOut, ClientIn, ClientsOut, ClientIdentifyOut, ClientUpdateIn, \
+    ClientLoginIn
+from app.core.usecases.clients.create_client_service import AsyncCreateClientService
 from app.core.usecases.clients.identify_client_service import IdentifyClientService
+from app.core.usecases.clients.import_clients_service import ImportClientsService
 from app.core.usecases.clients.list_clients_service import ListClientsService
-from app.core.usecases.clients.update_client_service import UpdateClientService
+from app.core.usecases.clients.login_client_service import AsyncLoginClientService
+from app.core.usecases.clients.update_client_service import AsyncUpdateClientService, UpdateClientService
 from app.devices.db.connection import get_db_session
+from app.shared.handles.password_hasher import get_password_hasher
 
 router = APIRouter()
 
+# Acima disso o arquivo enviado (e o relatório) sai da memória para um arquivo temporário
+IMPORT_SPOOL_MAX_BYTES = 1024 * 1024
+
 @router.post(
     "/clients",
     response_model=ClientOut,
@@ -32,18 +46,91 @@ router = APIRouter()
         },
     },
 )
-def create_client(client_in: ClientIn, db: Session = Depends(get_db_session)):
+async def create_client(
+    client_in: ClientIn,
+    db: Session = Depends(get_db_session),
+    password_hasher: PasswordHasherPort = Depends(get_password_hasher),
+):
     """
-    Cria um cliente no sistema.
+    Cria um cliente no sistema. A senha é gravada como hash bcrypt.
+    Rota assíncrona: o hash é aguardado no pool do bcrypt sem ocupar o threadpool.
     """
-    service = CreateClientService(ClientRepository(db))
+    service = AsyncCreateClientService(ThreadPoolClientRepository(db), password_hasher)
 
     try:
-        client = service.execute(client_in)
+        client = await service.execute(client_in)
         return ClientPresenter.present(client)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post(
+    "/clients/import",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Relatório CSV (line, cpf, email, error) com as linhas rejeitadas",
+            "content": {"text/csv": {}},
+        },
+        400: {
+            "description": "Bad Request",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Colunas obrigatórias ausentes: email."
+                    }
+                }
+            },
+        },
+    },
+)
+async def import_clients(request: Request, db: Session = Depends(get_db_session)):
+    """
+    Importa clientes em massa a partir de um CSV (UTF-8) enviado no corpo da requisição,
+    com as colunas cpf, name e email. Linhas válidas são cadastradas (sem senha) e as
+    rejeitadas voltam no relatório CSV da resposta; os totais vão nos headers
+    X-Import-Received, X-Import-Imported e X-Import-Rejected.
+    """
+    upload = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES)
+    report = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES)
+    # O relatório passa a ser da resposta só quando a importação termina; antes disso, é fechado aqui
+    report_returned = False
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.write, chunk)
+        upload.seek(0)
+
+        csv_file = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        service = ImportClientsService(ClientCopyImporter(db))
+        report_text = io.TextIOWrapper(report, encoding="utf-8", newline="", write_through=True)
+        summary = await run_in_threadpool(service.execute, csv_file, report_text)
+        report_text.detach()
+        report.seek(0)
+        report_returned = True
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="O arquivo deve estar em UTF-8.")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except csv.Error as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"CSV malformado: {e}")
+    finally:
+        upload.close()
+        if not report_returned:
+            report.close()
+
+    def report_lines():
+        with report:
+            yield from report
+
+    return StreamingResponse(
+        report_lines(),
+        media_type="text/csv",
+        headers={
+            "X-Import-Received": str(summary.received),
+            "X-Import-Imported": str(summary.imported),
+            "X-Import-Rejected": str(summary.rejected),
+        },
+    )
+
 @router.get("/clients", response_model=List[ClientsOut])
 def list_clients(db: Session = Depends(get_db_session)):
     """
@@ -67,16 +154,39 @@ def get_client_by_cpf(cpf: str, db: Session = Depends(get_db_session)):
     return ClientIdentifyPresenter.present(jwt)
 
 
+@router.post("/clients/login", response_model=ClientIdentifyOut)
+async def login_client(
+    credentials: ClientLoginIn,
+    db: Session = Depends(get_db_session),
+    password_hasher: PasswordHasherPort = Depends(get_password_hasher),
+):
+    """
+    Autentica o cliente por CPF e senha e retorna um JWT.
+    """
+    service = AsyncLoginClientService(ThreadPoolClientRepository(db), password_hasher)
+    try:
+        jwt = await service.execute(credentials.cpf, credentials.password)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+    return ClientIdentifyPresenter.present(jwt)
+
+
 @router.put("/clients/{cpf}", response_model=ClientOut)
-def update_client(cpf: str, client_in: ClientUpdateIn, db: Session = Depends(get_db_session)):
+async def update_client(
+    cpf: str,
+    client_in: ClientUpdateIn,
+    db: Session = Depends(get_db_session),
+    password_hasher: PasswordHasherPort = Depends(get_password_hasher),
+):
     """
     Atualiza os dados de um cliente.
     """
-    service = UpdateClientService(ClientRepository(db))
+    service = AsyncUpdateClientService(ThreadPoolClientRepository(db), password_hasher)
 
     try:
         updates = {key: value for key, value in client_in.dict(exclude_unset=True).items()}
-        updated_client = service.execute(cpf=cpf, updates=updates)
+        updated_client = await service.execute(cpf=cpf, updates=updates)
         return ClientPresenter.present(updated_client)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -85,11 +195,15 @@ def update_client(cpf: str, client_in: ClientUpdateIn, db: Session = Depends(get
 
 
 @router.delete("/clients/{cpf}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_client(cpf: str, db: Session = Depends(get_db_session)):
+def delete_client(
+    cpf: str,
+    db: Session = Depends(get_db_session),
+    password_hasher: PasswordHasherPort = Depends(get_password_hasher),
+):
     """
     Desativa o cliente pelo CPF.
     """
-    service = UpdateClientService(ClientRepository(db))
+    service = UpdateClientService(ClientRepository(db), password_hasher)
 
     try:
         service.execute(cpf=cpf, updates={"active": False})  # Apenas passa o dicionário
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date, datetime, time
+
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.adapters.gateways.coupon import CouponRepository
+from app.adapters.presenters.conditional_response import validator_headers, is_not_modified, \
+    not_modified_response
+from app.adapters.presenters.json_response import json_response
 from app.adapters.presenters.coupon.coupon_presenter import CouponPresenter
 from app.core.entities.coupon import Coupon
 from app.core.usecases.coupon.create_coupon_service import CreateCouponService
@@ -24,10 +29,19 @@ def create_coupon(coupon_in: CouponIn, db: Session = Depends(get_db_session)):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/coupons", response_model=List[CouponOut])
-def list_coupons_valid(db: Session = Depends(get_db_session)):
+def list_coupons_valid(request: Request, db: Session = Depends(get_db_session)):
+    """Lista os cupons válidos. Suporta If-None-Match/If-Modified-Since (304)."""
     service = ListCouponService(CouponRepository(db))
+    # A lista muda com a data (cupons expiram) mesmo sem alteração nos registros
+    today = date.today()
+    version = service.version()
+    start_of_day = datetime.combine(today, time.min).astimezone()
+    last_modified = max(version.updated_at, start_of_day) if version.updated_at else start_of_day
+    headers = validator_headers(version, today.isoformat(), last_modified=last_modified)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
     try:
-        return CouponPresenter.present_list(service.execute())
+        return json_response(CouponPresenter.present_list_json(service.execute()), headers)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -35,7 +49,7 @@ def list_coupons_valid(db: Session = Depends(get_db_session)):
 def list_coupons_all(db: Session = Depends(get_db_session)):
     service = ListCouponService(CouponRepository(db))
     try:
-        return CouponPresenter.present_list(service.execute_all())
+        return json_response(CouponPresenter.present_list_json(service.execute_all()))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
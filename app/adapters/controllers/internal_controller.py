@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends
+
+from app.adapters.dependencies.auth import token_cache
+from app.adapters.dependencies.internal import require_internal_token
+from app.adapters.gateways.auth_provider import auth_provider
+from app.adapters.gateways.cached_client import client_id_cache
+from app.adapters.gateways.cached_product import product_catalog_cache
+from app.adapters.notifiers.payment_status_notifier import payment_status_notifier
+from app.adapters.presenters.payment.qr_code_presenter import qr_image_cache
+from app.devices.db.connection import engine, async_engine
+from app.devices.db.pool import pool_stats
+
+# Rotas operacionais; não aparecem na documentação pública, devem ficar fora do ingress
+# e exigem o token interno (X-Internal-Token) mesmo assim
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+@router.get("/db/pool")
+def get_db_pool_stats():
+    """
+    Estatísticas dos pools de conexão deste processo (síncrono e assíncrono):
+    tamanho, conexões em uso e livres, overflow (negativo enquanto há folga no pool),
+    histograma do tempo de espera no checkout (ms) e do tempo de vida das conexões fechadas (s).
+    """
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.pool),
+    }
+
+@router.get("/cache/products")
+def get_product_cache_stats():
+    """Entradas, acertos (hits), faltas (misses) e remoções por limite do cache de produtos deste processo."""
+    return product_catalog_cache.stats()
+
+@router.get("/cache/qrcodes")
+def get_qr_code_cache_stats():
+    """Entradas, acertos e remoções do cache de imagens de QR Code deste processo."""
+    return qr_image_cache.stats()
+
+@router.get("/cache/auth")
+def get_auth_cache_stats():
+    """Estatísticas (inclusive taxa de acerto) dos caches de autenticação: tokens verificados e CPF -> id do cliente."""
+    return {
+        "tokens": token_cache.stats(),
+        "client_ids": client_id_cache.stats(),
+    }
+
+@router.get("/auth-proxy")
+def get_auth_proxy_stats():
+    """Estado do disjuntor e cache de tokens do serviço externo de autenticação."""
+    return {
+        "circuit": auth_provider.breaker.stats(),
+        "tokens": auth_provider.cache.stats(),
+    }
+
+@router.get("/payments/waiting")
+def get_payment_waiting_stats():
+    """Requisições aguardando (long-poll) o status de pagamento neste processo e o backend de avisos."""
+    return payment_status_notifier.stats()
@@ -1,82 +1,252 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional, Callable, Iterator
 
 from app.adapters.dependencies.auth import get_current_user
 from app.adapters.gateways.coupon import CouponRepository
 from app.adapters.gateways.order import OrderRepository
 from app.adapters.gateways.payment import PaymentRepository
 from app.adapters.gateways.product import ProductRepository
+from app.adapters.notifiers.order_board_feed import OrderBoardFeed, get_order_event_publisher, RESYNC
+from app.adapters.notifiers.payment_status_notifier import PaymentStatusNotifier, get_payment_status_notifier
+from app.adapters.presenters.conditional_response import validator_headers, is_not_modified, \
+    not_modified_response
+from app.adapters.presenters.json_response import json_response
 from app.adapters.presenters.order.order_presenter import OrderPresenter
-from app.core.schemas.order_schemas import OrderIn, OrderOut
+from app.core.entities.order import Order
+from app.core.entities.payment import Payment
+from app.core.schemas.order_schemas import OrderIn, OrderOut, OrderPageOut
 from app.core.schemas.payment_schemas import PaymentStatusResponse
 from app.core.usecases.orders.create_order_service import CreateOrderService
+from app.core.usecases.orders.place_order_service import PlaceOrderService
 from app.core.usecases.orders.list_order_service import ListOrdersService, GetOrderByIdService, \
     ListOrdersByStatusService, ListOrdersByClientService
 from app.core.usecases.orders.update_order_service import UpdateOrderStatusService
 from app.core.usecases.payment.create_payment_service import PaymentService
 from app.core.usecases.payment.get_payment_status_service import GetPaymentStatusService
-from app.devices.db.connection import get_db_session
+from app.core.usecases.payment.wait_payment_status_service import WaitPaymentStatusService
+from app.devices.db.connection import get_db_session, get_session_factory
+from app.devices.db.unit_of_work import SqlAlchemyUnitOfWork, get_unit_of_work
+from app.shared.enums.order_event_type import OrderEventType
 from app.shared.enums.order_status import OrderStatus
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+BOARD_HEARTBEAT_SECONDS = 15
+
+# Long-poll do status de pagamento (quiosque aguardando a leitura do QR code)
+PAYMENT_STATUS_MAX_WAIT_SECONDS = 30
+PAYMENT_STATUS_WAIT_DESCRIPTION = (
+    "Segundos que a requisição aguarda enquanto o pagamento estiver pendente; "
+    "responde assim que o webhook alterar o status"
+)
+
+NDJSON_RESPONSE = {
+    200: {
+        "content": {"application/x-ndjson": {}},
+        "description": "Com `stream=true`, um pedido (`OrderOut`) por linha, sem paginação.",
+    }
+}
+
+
+def _ndjson_response(session_factory, fetch: Callable[[OrderRepository], Iterator[Order]]) -> StreamingResponse:
+    """
+    Transmite os pedidos como NDJSON a partir de um cursor no servidor.
+    A sessão é aberta dentro do gerador porque a de `get_db_session` já estará
+    fechada quando o corpo começar a ser enviado.
+    """
+    def generate():
+        db = session_factory()
+        try:
+            buffer = bytearray()
+            for order in fetch(OrderRepository(db)):
+                buffer += OrderPresenter.present_ndjson(order)
+                if len(buffer) >= NDJSON_CHUNK_SIZE:
+                    yield bytes(buffer)
+                    buffer.clear()
+            if buffer:
+                yield bytes(buffer)
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _sse(version: int, event: str, data: str) -> str:
+    return f"id: {version}\nevent: {event}\ndata: {data}\n\n"
+
+
+def _board_snapshot(session_factory) -> str:
+    """Pedidos em andamento na ordem do painel, serializados para o evento de snapshot."""
+    db = session_factory()
+    try:
+        orders = ListOrdersService(OrderRepository(db)).execute()
+    finally:
+        db.close()
+    return json.dumps({"orders": [OrderPresenter.present(order).model_dump(mode="json") for order in orders]})
+
 @router.post("/orders", response_model=OrderOut, status_code=201)
 def create_order(
     order_in: OrderIn,
-    db: Session = Depends(get_db_session),
-    user: Optional[dict] = Depends(get_current_user)
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    user: Optional[dict] = Depends(get_current_user),
+    event_publisher: OrderBoardFeed = Depends(get_order_event_publisher),
 ):
     """Cria um novo pedido"""
+    db = uow.session
     order_repo = OrderRepository(db)
+    # Preço e estoque do pedido vêm do banco, nunca do cache do catálogo
     product_repo = ProductRepository(db)
     coupon_repo = CouponRepository(db)
     payment_repo = PaymentRepository(db)
-    service = CreateOrderService(order_repo, product_repo, coupon_repo)
-    payment_service = PaymentService(payment_repo)
+    service = PlaceOrderService(
+        uow,
+        CreateOrderService(order_repo, product_repo, coupon_repo),
+        PaymentService(payment_repo),
+        event_publisher,
+    )
     client_id = None if user is None else user["user_id"]
     try:
         order = service.execute(order_in, client_id=client_id)
-        _ = payment_service.execute(order)
         return OrderPresenter.present(order)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/orders", response_model=List[OrderOut])
-def list_orders(db: Session = Depends(get_db_session)):
-    """Lista todos os pedidos"""
+@router.get("/orders", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+def list_orders(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: Session = Depends(get_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista os pedidos em andamento, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersService(repo).stream())
     service = ListOrdersService(OrderRepository(db))
-    return OrderPresenter.present_list(service.execute())
+    try:
+        return json_response(OrderPresenter.present_page_json(service.execute_page(limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get(
+    "/orders/board/feed",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Eventos do painel (SSE)"}},
+)
+async def order_board_feed(
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    feed: OrderBoardFeed = Depends(get_order_event_publisher),
+    session_factory=Depends(get_session_factory),
+):
+    """
+    Feed do painel da cozinha via Server-Sent Events.
+
+    Envia um evento `snapshot` com os pedidos em andamento e depois apenas os
+    deltas (`created`, `status_changed`, `removed`), cada um com uma versão
+    crescente no campo `id`. Ao reconectar com `Last-Event-ID` o painel recebe
+    só os eventos perdidos; se eles não estiverem mais disponíveis, um novo snapshot.
+    Os deltas podem repetir o que já está no snapshot e devem ser aplicados de forma idempotente.
+    """
+    last_version = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+    async def stream():
+        subscription, version, missed = feed.subscribe(last_version)
+        try:
+            if missed is None:
+                yield _sse(version, OrderEventType.SNAPSHOT.value, await run_in_threadpool(_board_snapshot, session_factory))
+            else:
+                for event in missed:
+                    yield _sse(*event)
+
+            while not await request.is_disconnected():
+                event = await subscription.get(BOARD_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                elif event is RESYNC:
+                    version = feed.version
+                    yield _sse(version, OrderEventType.SNAPSHOT.value, await run_in_threadpool(_board_snapshot, session_factory))
+                else:
+                    yield _sse(*event)
+        finally:
+            feed.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/orders/{order_id}", response_model=OrderOut)
-def get_order_by_id(order_id: int, db: Session = Depends(get_db_session)):
-    """Busca um pedido pelo ID"""
+def get_order_by_id(order_id: int, request: Request, response: Response, db: Session = Depends(get_db_session)):
+    """Busca um pedido pelo ID. Suporta If-None-Match/If-Modified-Since (304)."""
     service = GetOrderByIdService(OrderRepository(db))
+    version = service.version(order_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    headers = validator_headers(version, order_id)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    response.headers.update(headers)
     order = service.execute(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return OrderPresenter.present(order)
 
-@router.get("/orders/status/{status}", response_model=List[OrderOut])
-def list_orders_by_status(status: OrderStatus, db: Session = Depends(get_db_session)):
-    """Lista pedidos por status"""
+@router.get("/orders/status/{status}", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+def list_orders_by_status(
+    status: OrderStatus,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: Session = Depends(get_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista pedidos por status, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersByStatusService(repo).stream(status))
     service = ListOrdersByStatusService(OrderRepository(db))
-    return OrderPresenter.present_list(service.execute(status))
+    try:
+        return json_response(OrderPresenter.present_page_json(service.execute_page(status, limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/orders/client/{client_id}", response_model=List[OrderOut])
-def list_orders_by_client(client_id: int, db: Session = Depends(get_db_session)):
-    """Lista pedidos de um cliente específico"""
+@router.get("/orders/client/{client_id}", response_model=OrderPageOut, responses=NDJSON_RESPONSE)
+def list_orders_by_client(
+    client_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = Query(False, description="Transmite todos os pedidos em NDJSON"),
+    db: Session = Depends(get_db_session),
+    session_factory=Depends(get_session_factory),
+):
+    """Lista pedidos de um cliente específico, paginados por cursor"""
+    if stream:
+        return _ndjson_response(session_factory, lambda repo: ListOrdersByClientService(repo).stream(client_id))
     service = ListOrdersByClientService(OrderRepository(db))
-    return OrderPresenter.present_list(service.execute(client_id))
+    try:
+        return json_response(OrderPresenter.present_page_json(service.execute_page(client_id, limit, cursor)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/orders/{order_id}/status", response_model=OrderOut)
 def update_order_status(
     order_id: int,
     new_status: OrderStatus,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    event_publisher: OrderBoardFeed = Depends(get_order_event_publisher),
 ):
-    service = UpdateOrderStatusService(OrderRepository(db),PaymentRepository(db))
+    service = UpdateOrderStatusService(OrderRepository(db), PaymentRepository(db), event_publisher)
     try:
         updated_order = service.execute(order_id, new_status)
         return OrderPresenter.present(updated_order)
@@ -84,21 +254,36 @@ def update_order_status(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/orders/{order_id}/payment_status")
-def get_payment_status(order_id: int, db: Session = Depends(get_db_session)):
+async def get_payment_status(
+    order_id: int,
+    wait: float = Query(0, ge=0, le=PAYMENT_STATUS_MAX_WAIT_SECONDS, description=PAYMENT_STATUS_WAIT_DESCRIPTION),
+    session_factory=Depends(get_session_factory),
+    notifier: PaymentStatusNotifier = Depends(get_payment_status_notifier),
+):
     """
     Retorna o status de pagamento do pedido informado.
     """
-    payment_repo = PaymentRepository(db)
-    service = GetPaymentStatusService(payment_repo)
+    def read_payment(order_id: int) -> Payment:
+        # Sessão curta por leitura: nenhuma conexão fica presa durante a espera
+        db = session_factory()
+        try:
+            return GetPaymentStatusService(PaymentRepository(db)).execute(order_id)
+        finally:
+            db.close()
+
+    service = WaitPaymentStatusService(lambda order_id: run_in_threadpool(read_payment, order_id), notifier)
     try:
-        payment = service.execute(order_id)
-        return PaymentStatusResponse(
-            order_id=payment.order_id,
-            payment_status=payment.status,
-            qr_code=payment.qr_code,
-            amount=payment.amount,
-            payment_date=payment.payment_date,
-            description=payment.description,
-        )
+        payment = await service.execute(order_id, wait)
+        return _payment_status_response(payment)
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+
+def _payment_status_response(payment: Payment) -> PaymentStatusResponse:
+    return PaymentStatusResponse(
+        order_id=payment.order_id,
+        payment_status=payment.status,
+        qr_code=payment.qr_code,
+        amount=payment.amount,
+        payment_date=payment.payment_date,
+        description=payment.description,
+    )
\ No newline at end of file
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.adapters.gateways.payment import PaymentRepository
+from app.adapters.presenters.conditional_response import is_not_modified, not_modified_response
+from app.adapters.presenters.payment.qr_code_presenter import QR_MEDIA_TYPES, QrCodePresenter, qr_image_cache
+from app.core.usecases.payment.get_payment_status_service import GetPaymentStatusService
+from app.devices.db.connection import get_db_session
+
+router = APIRouter()
+
+# O QR de um pagamento é imutável; privado porque identifica a cobrança do cliente
+QR_CACHE_CONTROL = "private, max-age=86400, immutable"
+
+QR_RESPONSES = {
+    200: {
+        "content": {media_type: {} for media_type in QR_MEDIA_TYPES.values()},
+        "description": "QR Code da cobrança PIX do pedido",
+    }
+}
+
+
+@router.get("/orders/{order_id}/payment_qrcode", response_class=Response, responses=QR_RESPONSES)
+def get_payment_qr_code(
+    order_id: int,
+    request: Request,
+    fmt: str = Query("png", alias="format", pattern="^(png|svg|matrix)$"),
+    scale: int = Query(8, ge=1, le=20, description="Pixels por módulo (PNG/SVG)"),
+    db: Session = Depends(get_db_session),
+):
+    """
+    QR Code da cobrança PIX do pedido, renderizado no servidor (PNG, SVG ou matriz).
+    As imagens ficam em cache por pedido; com If-None-Match responde 304.
+    """
+    key = (order_id, fmt, scale)
+    image = qr_image_cache.get(key)
+    if image is None:
+        try:
+            payment = GetPaymentStatusService(PaymentRepository(db)).execute(order_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        if not payment.qr_code:
+            raise HTTPException(status_code=404, detail="Pagamento sem QR Code.")
+        image = QrCodePresenter.render(payment.qr_code, fmt, scale)
+        qr_image_cache.set(key, image)
+
+    headers = {"ETag": image.etag, "Cache-Control": QR_CACHE_CONTROL}
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return Response(content=image.body, media_type=image.media_type, headers=headers)
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Header
 from sqlalchemy.orm import Session
 
+from app.adapters.notifiers.payment_status_notifier import PaymentStatusNotifier, get_payment_status_notifier
 from app.adapters.presenters.payment.payment_presenter import PaymentPresenter
-from app.core.schemas.payment_schemas import PaymentWebhookRequest
+from app.core.schemas.payment_schemas import (
+    PaymentWebhookBatchRequest,
+    PaymentWebhookBatchResponse,
+    PaymentWebhookRequest,
+)
+from app.core.usecases.payment.apply_payment_status_batch_service import ApplyPaymentStatusBatchService
 from app.core.usecases.payment.update_payment_status_service import UpdatePaymentStatusService
 from app.devices.db.connection import get_db_session
 from app.adapters.gateways.payment import PaymentRepository
@@ -10,17 +18,43 @@ from app.adapters.gateways.payment import PaymentRepository
 router = APIRouter()
 
 @router.post("/webhooks/payment")
-def payment_webhook(payload: PaymentWebhookRequest, db: Session = Depends(get_db_session)):
+def payment_webhook(
+    payload: PaymentWebhookRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    db: Session = Depends(get_db_session),
+    notifier: PaymentStatusNotifier = Depends(get_payment_status_notifier),
+):
     """
     Webhook para receber a confirmação de pagamento.
     O payload deve conter o order_id, o novo status de pagamento e opcionalmente uma descrição.
+    A chave de idempotência (no payload ou no header `Idempotency-Key`) faz com que
+    entregas repetidas retornem o pagamento atual sem reaplicar a mudança.
     """
     payment_repo = PaymentRepository(db)
-    service = UpdatePaymentStatusService(payment_repo)
+    service = UpdatePaymentStatusService(payment_repo, notifier)
     try:
         updated_payment = service.execute(
-            payload.order_id, payload.payment_status, payload.description
+            payload.order_id, payload.payment_status, payload.description,
+            payload.idempotency_key or idempotency_key,
         )
         return PaymentPresenter.present(updated_payment)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+@router.post("/webhooks/payment/batch", response_model=PaymentWebhookBatchResponse)
+def payment_webhook_batch(
+    payload: PaymentWebhookBatchRequest,
+    db: Session = Depends(get_db_session),
+    notifier: PaymentStatusNotifier = Depends(get_payment_status_notifier),
+):
+    """
+    Recebe várias notificações de pagamento (no máximo uma por pedido) e as aplica
+    em uma única transação. Retorna, por pedido, `updated`, `duplicate` (chave de
+    idempotência já aplicada) ou `not_found` (pedido sem pagamento).
+    """
+    service = ApplyPaymentStatusBatchService(PaymentRepository(db), notifier)
+    try:
+        results = service.execute(payload.notifications)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PaymentPresenter.present_batch(results)
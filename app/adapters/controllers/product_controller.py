@@ -1,30 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from typing import Dict, List
 from sqlalchemy.orm import Session
 
+from app.adapters.gateways.cached_product import CachedProductRepository
 from app.adapters.gateways.product import ProductRepository
+from app.adapters.presenters.conditional_response import validator_headers, is_not_modified, \
+    not_modified_response
+from app.adapters.presenters.json_response import json_response
 from app.adapters.presenters.products.product_presenter import ProductPresenter
-from app.core.schemas.product_schemas import ProductIn, ProductOut
+from app.core.schemas.product_schemas import ProductIn, ProductOut, ProductCatalogDiffOut
 from app.core.usecases.products.create_product_service import CreateProductService
 from app.core.usecases.products.delete_product_service import DeleteProductService
-from app.core.usecases.products.list_products_service import ListProductsService, ListProductsByCategoryService
+from app.core.usecases.products.list_products_service import ListProductsService, ListProductsByCategoryService, \
+    GetMenuService
 from app.core.usecases.products.update_product_service import UpdateProductService
+from app.core.usecases.products.upsert_product_catalog_service import MAX_CATALOG_SIZE, UpsertProductCatalogService
 from app.devices.db.connection import get_db_session
 from app.shared.enums.categorys import CategoryEnum
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEACTIVATE_MISSING_DESCRIPTION = "Desativa os produtos ativos que não estão no catálogo enviado"
+# O corpo é lido à mão para aceitar também NDJSON; o schema vai só para a documentação
+CATALOG_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": {"$ref": "#/components/schemas/ProductIn"}},
+            },
+            NDJSON_MEDIA_TYPE: {
+                "schema": {"$ref": "#/components/schemas/ProductIn"},
+                "description": "Um produto por linha",
+            },
+        },
+    },
+}
+
+_product_list = TypeAdapter(List[ProductIn])
+
+
+async def _read_catalog(request: Request) -> List[ProductIn]:
+    """
+    Lê o catálogo do corpo: um array JSON de produtos ou, com Content-Type
+    application/x-ndjson, um produto por linha, validado à medida que chega.
+    Erros de validação respondem 422 como os demais corpos da API.
+    """
+    if not request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        try:
+            return _product_list.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()])
+
+    products: List[ProductIn] = []
+    buffer = b""
+    line_number = 0
+
+    def parse(line: bytes) -> None:
+        nonlocal line_number
+        line_number += 1
+        if not line.strip():
+            return
+        try:
+            products.append(ProductIn.model_validate_json(line))
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", line_number, *error["loc"])} for error in e.errors()]
+            )
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            parse(line)
+        if len(products) > MAX_CATALOG_SIZE:
+            # Não há por que ler o resto: o serviço recusa o catálogo
+            return products
+    parse(buffer)
+    return products
+
 @router.get("/products", response_model=List[ProductOut])
-def list_products(db: Session = Depends(get_db_session)):
-    """Lista todos os produtos"""
-    service = ListProductsService(ProductRepository(db))
-    return ProductPresenter.present_list(service.execute())
+def list_products(request: Request, db: Session = Depends(get_db_session)):
+    """Lista todos os produtos. Suporta If-None-Match/If-Modified-Since (304)."""
+    service = ListProductsService(CachedProductRepository(ProductRepository(db)))
+    headers = validator_headers(service.version())
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_list_json(service.execute()), headers)
+
+@router.get("/products/menu", response_model=Dict[CategoryEnum, List[ProductOut]])
+def get_menu(request: Request, db: Session = Depends(get_db_session)):
+    """Cardápio completo agrupado por categoria, em uma única consulta. Suporta 304."""
+    service = GetMenuService(CachedProductRepository(ProductRepository(db)))
+    headers = validator_headers(service.version())
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_menu_json(service.execute()), headers)
 
 @router.get("/products/category/{category}", response_model=List[ProductOut])
-def list_products_by_category(category: CategoryEnum, db: Session = Depends(get_db_session)):
-    """Lista produtos por categoria"""
-    service = ListProductsByCategoryService(ProductRepository(db))
-    return ProductPresenter.present_list(service.execute(category.value))
+def list_products_by_category(
+    category: CategoryEnum, request: Request, db: Session = Depends(get_db_session)
+):
+    """Lista produtos por categoria. Suporta If-None-Match/If-Modified-Since (304)."""
+    service = ListProductsByCategoryService(CachedProductRepository(ProductRepository(db)))
+    headers = validator_headers(service.version(category.value))
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return json_response(ProductPresenter.present_list_json(service.execute(category.value)), headers)
 
 @router.post("/products", response_model=ProductOut, status_code=201)
 def create_product(product_in: ProductIn, db: Session = Depends(get_db_session)):
@@ -37,6 +123,25 @@ def create_product(product_in: ProductIn, db: Session = Depends(get_db_session))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/products/bulk", response_model=ProductCatalogDiffOut, openapi_extra=CATALOG_BODY)
+async def bulk_upsert_products(
+    request: Request,
+    deactivate_missing: bool = Query(True, description=DEACTIVATE_MISSING_DESCRIPTION),
+    db: Session = Depends(get_db_session),
+):
+    """
+    Cria ou atualiza, pelo nome, todos os produtos do catálogo em uma única transação
+    e retorna o resumo das alterações (criados, atualizados, inalterados e desativados).
+    """
+    products = await _read_catalog(request)
+    service = UpsertProductCatalogService(ProductRepository(db))
+
+    try:
+        diff = await run_in_threadpool(service.execute, products, deactivate_missing)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProductPresenter.present_catalog_diff(diff)
+
 @router.put("/products/{product_id}", response_model=ProductOut)
 def update_product(product_id: int, product_in: ProductIn, db: Session = Depends(get_db_session)):
     """Atualiza um produto existente"""
@@ -1,18 +1,29 @@
+import hashlib
+import os
+import time
 from typing import Optional
 
-from app.adapters.gateways.client import ClientRepository
+from app.adapters.gateways.client import ClientRepository, AsyncClientRepository
 from app.core.entities.client import Client
-from app.devices.db.connection import get_db_session
+from app.devices.db.connection import get_db_session, get_async_db_session
 from app.shared.handles.jwt_user import verify_jwt
+from app.shared.ttl_cache import TTLCache
 from fastapi.security import HTTPBearer
 
 
 from fastapi import Depends, HTTPException, status, Header
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
 security = HTTPBearer()
 
+AUTH_TOKEN_CACHE_TTL_SECONDS = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "300"))
+AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+# Token já verificado -> payload, por processo. A entrada nunca vive além do `exp` do token.
+token_cache = TTLCache(maxsize=AUTH_TOKEN_CACHE_MAX_ENTRIES, ttl=AUTH_TOKEN_CACHE_TTL_SECONDS)
+
 
 def get_current_user(
     token: Optional[str]  = Header(None),
@@ -20,36 +31,71 @@ def get_current_user(
 ) -> dict:
     """
     1) Decodifica o JWT e extrai cpf, email e name.
-    2) Usa o ClientRepository para buscar por CPF.
-    3) Se não existir, instancia seu dataclass Client e chama repo.create().
-    4) Retorna sempre a entidade Client.
+    2) Usa o ClientRepository para obter o id do cliente pelo CPF, cadastrando-o
+       no primeiro acesso (upsert em um único statement).
+    3) Retorna o id do cliente e o payload do token.
+    """
+    payload = _decode_token(token)
+    repo = ClientRepository(db)
+
+    try:
+        client_id = repo.get_or_create_id(_new_client(payload))
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {"user_id": client_id, "payload": payload}
+
+
+async def get_current_user_async(
+    token: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db_session),
+) -> dict:
+    """Versão de `get_current_user` para as rotas da pilha assíncrona (DB_ASYNC)."""
+    payload = _decode_token(token)
+    repo = AsyncClientRepository(db)
+
+    try:
+        client_id = await repo.get_or_create_id(_new_client(payload))
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {"user_id": client_id, "payload": payload}
+
+
+def _decode_token(token: Optional[str]) -> dict:
     """
+    Verifica o JWT, reaproveitando o resultado de tokens já verificados.
+    A chave é o hash do token inteiro (cabeçalho, payload e assinatura): qualquer
+    alteração no token cai fora do cache e passa pela verificação normal.
+    """
+    key = hashlib.sha256(token.encode()).digest() if token else None
+    payload = token_cache.get(key) if key else None
+    if payload is not None:
+        return payload
+
     try:
         payload = verify_jwt(token)
     except ValueError as e:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
-    cpf   = payload.get("cpf")
-    email = payload.get("email", "")
-    name  = payload.get("name", "")
-
-    if not cpf:
+    if not payload.get("cpf"):
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Token não contém CPF")
 
-    repo = ClientRepository(db)
+    ttl = AUTH_TOKEN_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        ttl = min(ttl, payload["exp"] - time.time())
+    if ttl > 0:
+        token_cache.set(key, payload, ttl=ttl)
+    return payload
+
 
-    client = repo.find_by_cpf(cpf)
-
-    if not client:
-        client = Client(
-            id=None,
-            name=name,
-            email=email,
-            cpf=cpf,
-            created_at=None,
-            updated_at=None,
-            active=True
-        )
-        client = repo.create(client)
-
-    return {"user_id": client.id, "payload": payload}
\ No newline at end of file
+def _new_client(payload: dict) -> Client:
+    return Client(
+        id=None,
+        name=payload.get("name", ""),
+        email=payload.get("email", ""),
+        cpf=payload["cpf"],
+        created_at=None,
+        updated_at=None,
+        active=True
+    )
@@ -0,0 +1,20 @@
+import hmac
+import os
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+# Token exigido no header X-Internal-Token pelas rotas /internal; sem ele configurado as rotas ficam desligadas
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """
+    Protege as rotas operacionais (`/internal`). Sem `INTERNAL_API_TOKEN` elas
+    respondem 404, como se não existissem; com ele, exigem o mesmo valor no
+    header `X-Internal-Token`.
+    """
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_internal_token is None or not hmac.compare_digest(x_internal_token.encode(), INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Token interno inválido")
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+
+import httpx
+import jwt
+from dotenv import load_dotenv
+
+from app.core.ports.auth_provider_port import AuthProviderPort, AuthProviderUnavailableError
+from app.shared.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.shared.ttl_cache import TTLCache
+
+load_dotenv()
+
+AUTH_ENDPOINT = os.getenv("AUTH_ENDPOINT")
+AUTH_PROXY_TIMEOUT_SECONDS = float(os.getenv("AUTH_PROXY_TIMEOUT_SECONDS", "5"))
+AUTH_PROXY_MAX_CONNECTIONS = int(os.getenv("AUTH_PROXY_MAX_CONNECTIONS", "20"))
+AUTH_PROXY_TOKEN_TTL_SECONDS = float(os.getenv("AUTH_PROXY_TOKEN_TTL_SECONDS", "60"))
+AUTH_PROXY_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_PROXY_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+AUTH_PROXY_FAILURE_THRESHOLD = int(os.getenv("AUTH_PROXY_FAILURE_THRESHOLD", "5"))
+AUTH_PROXY_RESET_TIMEOUT_SECONDS = float(os.getenv("AUTH_PROXY_RESET_TIMEOUT_SECONDS", "30"))
+
+# Não devolve do cache um token que expira nos próximos segundos
+TOKEN_EXPIRY_MARGIN_SECONDS = 5
+
+
+class HttpAuthProvider(AuthProviderPort):
+    """
+    Cliente do serviço externo de autenticação (Lambda/Cognito).
+
+    - Um único `httpx.AsyncClient` por processo, com keep-alive: as chamadas
+      reaproveitam as conexões (e o handshake TLS) em vez de abrir uma por requisição.
+    - Tokens emitidos ficam em cache por CPF, por no máximo `AUTH_PROXY_TOKEN_TTL_SECONDS`
+      e nunca além do `exp` do próprio token.
+    - Chamadas simultâneas para o mesmo CPF compartilham uma única ida ao serviço.
+    - Um disjuntor (`CircuitBreaker`) falha na hora enquanto o serviço estiver fora
+      (erros de rede e respostas 5xx contam como falha).
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = AUTH_ENDPOINT,
+        cache: Optional[TTLCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.endpoint = endpoint
+        self.cache = cache or TTLCache(maxsize=AUTH_PROXY_TOKEN_CACHE_MAX_ENTRIES, ttl=AUTH_PROXY_TOKEN_TTL_SECONDS)
+        self.breaker = breaker or CircuitBreaker(AUTH_PROXY_FAILURE_THRESHOLD, AUTH_PROXY_RESET_TIMEOUT_SECONDS)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # As conexões do httpx ficam presas ao event loop em que foram abertas. Na
+            # aplicação há um loop só; fora dela (ex.: testes) cada loop ganha seu cliente.
+            self._client = httpx.AsyncClient(
+                timeout=AUTH_PROXY_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=AUTH_PROXY_MAX_CONNECTIONS,
+                    max_keepalive_connections=AUTH_PROXY_MAX_CONNECTIONS,
+                ),
+                transport=self._transport,
+            )
+            self._client_loop = loop
+            self._in_flight = {}
+        return self._client
+
+    async def aclose(self) -> None:
+        """Fecha as conexões mantidas; chamado no encerramento da aplicação."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def fetch_token(self, cpf: str) -> str:
+        token = self.cache.get(cpf)
+        if token is not None:
+            return token
+
+        client = self._get_client()
+        task = self._in_flight.get(cpf)
+        if task is None:
+            task = asyncio.ensure_future(self._request_token(client, cpf))
+            self._in_flight[cpf] = task
+            task.add_done_callback(lambda done: self._in_flight.pop(cpf, None) if self._in_flight.get(cpf) is done else None)
+        # shield: se um dos clientes desconectar, a chamada compartilhada segue para os demais
+        return await asyncio.shield(task)
+
+    async def _request_token(self, client: httpx.AsyncClient, cpf: str) -> str:
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as e:
+            raise AuthProviderUnavailableError("Serviço de autenticação indisponível", retry_after=e.retry_after)
+
+        try:
+            resp = await client.post(self.endpoint, json={"cpf": cpf})
+        except httpx.HTTPError as e:
+            self.breaker.record_failure()
+            raise AuthProviderUnavailableError("Erro no serviço de autenticação") from e
+        except BaseException:
+            # Qualquer outro erro (ex.: cliente fechado no meio da chamada, cancelamento)
+            # também encerra a chamada de teste; senão o circuito ficaria semiaberto para sempre
+            self.breaker.record_failure()
+            raise
+
+        if resp.status_code >= 500:
+            self.breaker.record_failure()
+            raise AuthProviderUnavailableError("Erro no serviço de autenticação")
+        self.breaker.record_success()
+
+        if resp.status_code == 200:
+            token = resp.json()["token"]
+            ttl = self._cache_ttl(token)
+            if ttl > 0:
+                self.cache.set(cpf, token, ttl=ttl)
+            return token
+
+        if resp.status_code == 404:
+            raise ValueError("CPF não encontrado no Cognito.")
+        if resp.status_code == 400:
+            raise ValueError("CPF inválido (Lambda).")
+
+        raise AuthProviderUnavailableError("Erro no serviço de autenticação")
+
+    def _cache_ttl(self, token: str) -> float:
+        """TTL do cache limitado ao `exp` do token (lido sem validar a assinatura, que é do emissor)."""
+        try:
+            expires_at = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.PyJWTError:
+            expires_at = None
+        if expires_at is None:
+            return self.cache.ttl
+        return min(self.cache.ttl, expires_at - time.time() - TOKEN_EXPIRY_MARGIN_SECONDS)
+
+
+auth_provider = HttpAuthProvider()
+
+
+def get_auth_provider() -> AuthProviderPort:
+    return auth_provider
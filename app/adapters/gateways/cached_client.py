@@ -0,0 +1,35 @@
+import os
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.shared.ttl_cache import TTLCache
+
+CLIENT_ID_CACHE_TTL_SECONDS = float(os.getenv("CLIENT_ID_CACHE_TTL_SECONDS", "300"))
+CLIENT_ID_CACHE_MAX_ENTRIES = int(os.getenv("CLIENT_ID_CACHE_MAX_ENTRIES", "10000"))
+
+# CPF -> id do cliente, por processo. Usado na autenticação de cada requisição
+# (`get_current_user`); alterações feitas em outro processo aparecem no máximo após o TTL.
+client_id_cache = TTLCache(maxsize=CLIENT_ID_CACHE_MAX_ENTRIES, ttl=CLIENT_ID_CACHE_TTL_SECONDS)
+
+_INVALIDATE_ON_COMMIT = "invalidate_client_cache"
+
+
+def invalidate_client_cache(session: Session, *cpfs: str) -> None:
+    """
+    Chamada pelo `ClientRepository` ao alterar (inclusive desativar) ou remover um
+    cliente. Remove os CPFs agora e de novo no commit, para descartar o que outra
+    requisição tenha lido do banco antes da alteração ser confirmada.
+    """
+    for cpf in cpfs:
+        client_id_cache.delete(cpf)
+    pending = session.info.get(_INVALIDATE_ON_COMMIT)
+    if pending is None:
+        pending = session.info[_INVALIDATE_ON_COMMIT] = set()
+        event.listen(session, "after_commit", _delete_after_commit, once=True)
+    pending.update(cpfs)
+
+
+def _delete_after_commit(session: Session) -> None:
+    for cpf in session.info.pop(_INVALIDATE_ON_COMMIT, ()):
+        client_id_cache.delete(cpf)
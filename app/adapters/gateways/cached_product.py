@@ -0,0 +1,142 @@
+import os
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.entities.product import Product, ProductCatalogChange
+from app.core.entities.resource_version import ResourceVersion
+from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.shared.enums.categorys import CategoryEnum
+from app.shared.ttl_cache import TTLCache
+
+PRODUCT_CACHE_TTL_SECONDS = float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", "60"))
+PRODUCT_CACHE_MAX_ENTRIES = int(os.getenv("PRODUCT_CACHE_MAX_ENTRIES", "1024"))
+
+# Cache do catálogo por processo. Com vários workers cada um tem o seu e as
+# alterações feitas em outro processo aparecem no máximo após o TTL.
+product_catalog_cache = TTLCache(maxsize=PRODUCT_CACHE_MAX_ENTRIES, ttl=PRODUCT_CACHE_TTL_SECONDS)
+# Última versão vista de cada listagem em cache (ver `find_catalog_version`)
+catalog_versions: Dict = {}
+
+_INVALIDATE_ON_COMMIT = "invalidate_product_cache"
+
+
+def invalidate_product_cache(session: Session) -> None:
+    """
+    Chamada pelo `ProductRepository` ao criar, alterar ou remover produtos. Limpa o
+    cache agora e de novo no commit, para descartar o que outra requisição tenha
+    lido do banco antes da alteração ser confirmada.
+    """
+    product_catalog_cache.clear()
+    if not session.info.get(_INVALIDATE_ON_COMMIT):
+        session.info[_INVALIDATE_ON_COMMIT] = True
+        event.listen(session, "after_commit", _clear_after_commit, once=True)
+
+
+def _clear_after_commit(session: Session) -> None:
+    session.info.pop(_INVALIDATE_ON_COMMIT, None)
+    product_catalog_cache.clear()
+
+
+class CachedProductRepository(ProductRepositoryPort):
+    """
+    Decorador read-through do `ProductRepositoryPort`: listagens e buscas por id
+    vêm da memória enquanto válidas; as escritas vão direto ao repositório.
+
+    As entidades são copiadas na saída, então quem as altera não modifica o cache.
+    Preço e estoque em cache podem estar defasados, para mais ou para menos, até o
+    TTL: uma alteração feita por outro processo só aparece depois dele. Use apenas
+    para exibir o catálogo; a criação de pedidos e a atualização de produtos leem
+    o banco (`ProductRepository`), que tem os valores atuais.
+    """
+
+    def __init__(
+        self,
+        repository: ProductRepositoryPort,
+        cache: TTLCache = product_catalog_cache,
+        versions: Dict = catalog_versions,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.versions = versions
+
+    def _cached_list(self, key, load) -> List[Product]:
+        products = self.cache.get(key)
+        if products is None:
+            products = load()
+            self.cache.set(key, products)
+            for product in products:
+                self.cache.set(("id", product.id), product)
+        return [replace(product) for product in products]
+
+    def find_all(self) -> List[Product]:
+        return self._cached_list(("all",), self.repository.find_all)
+
+    def find_menu(self) -> Dict[CategoryEnum, List[Product]]:
+        menu = self.cache.get(("menu",))
+        if menu is None:
+            menu = self.repository.find_menu()
+            self.cache.set(("menu",), menu)
+        return {category: [replace(product) for product in products] for category, products in menu.items()}
+
+    def find_by_category(self, category: str) -> List[Product]:
+        return self._cached_list(("category", category), lambda: self.repository.find_by_category(category))
+
+    def find_by_id(self, product_id: int) -> Optional[Product]:
+        product = self.cache.get(("id", product_id))
+        if product is None:
+            product = self.repository.find_by_id(product_id)
+            if product is None:
+                return None
+            self.cache.set(("id", product_id), product)
+        return replace(product)
+
+    def find_by_ids(self, product_ids: List[int]) -> List[Product]:
+        found: Dict[int, Product] = {}
+        missing = []
+        for product_id in set(product_ids):
+            product = self.cache.get(("id", product_id))
+            if product is None:
+                missing.append(product_id)
+            else:
+                found[product_id] = product
+        if missing:
+            for product in self.repository.find_by_ids(missing):
+                self.cache.set(("id", product.id), product)
+                found[product.id] = product
+        return [replace(product) for product in found.values()]
+
+    def find_catalog_version(self, category: Optional[str] = None) -> ResourceVersion:
+        """
+        Sempre consultada no banco. Se a versão mudou desde a última vez, a listagem
+        correspondente é descartada do cache: assim uma alteração feita em outro
+        processo não fica servida com o ETag novo até o fim do TTL.
+        """
+        version = self.repository.find_catalog_version(category)
+        key = ("category", category) if category is not None else ("all",)
+        if self.versions.get(key) != version:
+            self.cache.delete(key)
+            if category is None:
+                self.cache.delete(("menu",))
+            self.versions[key] = version
+        return version
+
+    def create(self, product: Product) -> Product:
+        return self.repository.create(product)
+
+    def update(self, product: Product) -> Product:
+        return self.repository.update(product)
+
+    def reserve_stock(self, quantities: Dict[int, int]) -> List[int]:
+        # O estoque desses produtos mudou: as buscas por id voltam a ler do banco
+        for product_id in quantities:
+            self.cache.delete(("id", product_id))
+        return self.repository.reserve_stock(quantities)
+
+    def delete(self, product_id: int) -> None:
+        self.repository.delete(product_id)
+
+    def upsert_catalog(self, products: List[Product], deactivate_missing: bool) -> List[ProductCatalogChange]:
+        return self.repository.upsert_catalog(products, deactivate_missing)
@@ -1,10 +1,17 @@
 from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.adapters.gateways.cached_client import client_id_cache, invalidate_client_cache
 from app.core.entities.client import Client
-from app.core.ports.client_repository_port import ClientRepositoryPort
-from app.devices.db.models import ClientModel, CouponModel, ClientCouponAssociationModel
+from app.core.ports.client_repository_port import ClientRepositoryPort, AsyncClientRepositoryPort
+from app.devices.db.models import BaseUserModel, ClientModel, CouponModel, ClientCouponAssociationModel
+from app.devices.db.unit_of_work import save_changes
+from app.shared.enums.user_type import UserType
 
 
 class ClientRepository(ClientRepositoryPort):
@@ -22,7 +29,7 @@ class ClientRepository(ClientRepositoryPort):
             password=client.password,
         )
         self.db_session.add(client_model)
-        self.db_session.commit()
+        save_changes(self.db_session)
         self.db_session.refresh(client_model)
 
         return Client(
@@ -30,7 +37,8 @@ class ClientRepository(ClientRepositoryPort):
             name=client_model.name,
             email=client_model.email,
             cpf=client_model.cpf,
-            password=client_model.password
+            password=client_model.password,
+            check_cpf=False,
         )
 
     def find_by_id(self, client_id: int) -> Optional[Client]:
@@ -48,6 +56,7 @@ class ClientRepository(ClientRepositoryPort):
             cpf=client_model.cpf,
             password=client_model.password,
             active=client_model.active,
+            check_cpf=False,
         )
 
     def find_by_cpf(self, cpf: str) -> Optional[Client]:
@@ -70,7 +79,60 @@ class ClientRepository(ClientRepositoryPort):
             updated_at=client_model.updated_at,
             user_type=client_model.user_type,
             active=client_model.active,
+            check_cpf=False,
+        )
+
+    def get_or_create_id(self, client: Client) -> int:
+        """
+        Retorna o id do cliente com o CPF de `client`, cadastrando-o se ainda não existir,
+        em um único statement:
+
+            WITH inserted AS (INSERT INTO base_users ... ON CONFLICT (cpf) DO NOTHING RETURNING id),
+                 linked AS (INSERT INTO clients (id) SELECT id FROM inserted RETURNING id)
+            SELECT id FROM linked UNION ALL SELECT id FROM clients JOIN base_users ... WHERE cpf = :cpf
+
+        Requisições simultâneas do mesmo cliente não violam a constraint única: a
+        perdedora espera o commit da outra e não insere nada. Como o SELECT dela usa
+        o snapshot do início do statement, pode não enxergar a linha recém-confirmada;
+        nesse caso o statement é repetido uma vez.
+        """
+        client_id = client_id_cache.get(client.cpf)
+        if client_id is not None:
+            return client_id
+
+        inserted = (
+            insert(BaseUserModel.__table__)
+            .values(
+                name=client.name,
+                email=client.email,
+                cpf=client.cpf,
+                password=client.password,
+                user_type=UserType.CLIENT,
+            )
+            .on_conflict_do_nothing(index_elements=["cpf"])
+            .returning(BaseUserModel.__table__.c.id)
+            .cte("inserted")
         )
+        linked = (
+            insert(ClientModel.__table__)
+            .from_select(["id"], select(inserted.c.id))
+            .returning(ClientModel.__table__.c.id)
+            .cte("linked")
+        )
+        statement = select(linked.c.id).union_all(select(ClientModel.id).where(ClientModel.cpf == client.cpf))
+
+        for _ in range(2):
+            client_id = self.db_session.execute(statement).scalar()
+            if client_id is not None:
+                break
+        else:
+            # O CPF pertence a um usuário que não é cliente (ex.: administrador)
+            raise ValueError("CPF já cadastrado para outro tipo de usuário.")
+
+        save_changes(self.db_session)
+        client_id_cache.set(client.cpf, client_id)
+        return client_id
+
     def find_by_email(self, email: str) -> Optional[Client]:
         """
         Busca um cliente pelo email. Retorna None se não encontrado.
@@ -90,25 +152,37 @@ class ClientRepository(ClientRepositoryPort):
             created_at=client_model.created_at,
             updated_at=client_model.updated_at,
             active=client_model.active,
+            check_cpf=False,
         )
 
     def find_all(self) -> List[Client]:
         """
         Retorna todos os clientes do banco de dados.
         """
-        client_models = self.db_session.query(ClientModel).all()
+        # Só as colunas, sem instanciar models; o CPF gravado já foi validado e não é checado de novo
+        rows = self.db_session.query(
+            ClientModel.id,
+            ClientModel.name,
+            ClientModel.email,
+            ClientModel.cpf,
+            ClientModel.password,
+            ClientModel.created_at,
+            ClientModel.updated_at,
+            ClientModel.active,
+        ).all()
         return [
             Client(
                 id=m.id,
                 name=m.name,
                 email=m.email,
-                cpf=m.formatted_cpf,
+                cpf=m.cpf,
                 password=m.password,
                 created_at=m.created_at,
                 updated_at=m.updated_at,
                 active=m.active,
+                check_cpf=False,
             )
-            for m in client_models
+            for m in rows
         ]
 
     def update(self, client: Client) -> Client:
@@ -119,13 +193,14 @@ class ClientRepository(ClientRepositoryPort):
         if not client_model:
             raise ValueError("Client not found")
 
+        invalidate_client_cache(self.db_session, client_model.cpf, client.cpf)
         client_model.name = client.name
         client_model.email = client.email
         client_model.cpf = client.cpf
         client_model.password = client.password
         client_model.active = client.active
 
-        self.db_session.commit()
+        save_changes(self.db_session)
         self.db_session.refresh(client_model)
 
         return Client(
@@ -137,6 +212,7 @@ class ClientRepository(ClientRepositoryPort):
             created_at=client_model.created_at,
             updated_at=client_model.updated_at,
             active=client_model.active,
+            check_cpf=False,
         )
 
     def delete(self, client_id: int) -> None:
@@ -145,8 +221,9 @@ class ClientRepository(ClientRepositoryPort):
         """
         client_model = self.db_session.query(ClientModel).get(client_id)
         if client_model:
+            invalidate_client_cache(self.db_session, client_model.cpf)
             self.db_session.delete(client_model)
-            self.db_session.commit()
+            save_changes(self.db_session)
 
     def find_coupons_by_client_id(self, client_id: int):
         """
@@ -158,16 +235,26 @@ class ClientRepository(ClientRepositoryPort):
         """
         current_date = datetime.utcnow()
 
+        # EXISTS em vez de OUTER JOIN: não duplica cupons não-VIP por associação
+        # e a verificação do vínculo usa a PK (client_id, coupon_id)
+        is_linked_to_client = (
+            self.db_session.query(ClientCouponAssociationModel)
+            .filter(
+                ClientCouponAssociationModel.coupon_id == CouponModel.id,
+                ClientCouponAssociationModel.client_id == client_id,
+            )
+            .exists()
+        )
+
         coupons = (
             self.db_session.query(CouponModel)
-            .outerjoin(ClientCouponAssociationModel, CouponModel.id == ClientCouponAssociationModel.coupon_id)
             .filter(
                 # Cupons ativos
                 CouponModel.active == True,
                 # Cupons não expirados
                 CouponModel.expires_at >= current_date,
                 # Se VIP, verificar associação com o cliente
-                ((CouponModel.vip == True) & (ClientCouponAssociationModel.client_id == client_id))
+                ((CouponModel.vip == True) & is_linked_to_client)
                 | (CouponModel.vip == False)  # Se não VIP, é para todos
             )
             .all()
@@ -175,3 +262,59 @@ class ClientRepository(ClientRepositoryPort):
 
         return coupons
 
+
+class AsyncClientRepository(AsyncClientRepositoryPort):
+    """Repositório de clientes sobre uma `AsyncSession`; mesmas consultas do `ClientRepository` via `run_sync`."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, client: Client) -> Client:
+        return await self.db_session.run_sync(lambda session: ClientRepository(session).create(client))
+
+    async def find_by_cpf(self, cpf: str) -> Optional[Client]:
+        return await self.db_session.run_sync(lambda session: ClientRepository(session).find_by_cpf(cpf))
+
+    async def get_or_create_id(self, client: Client) -> int:
+        return await self.db_session.run_sync(lambda session: ClientRepository(session).get_or_create_id(client))
+
+    async def find_by_email(self, email: str) -> Optional[Client]:
+        return await self.db_session.run_sync(lambda session: ClientRepository(session).find_by_email(email))
+
+    async def update(self, client: Client) -> Client:
+        return await self.db_session.run_sync(lambda session: ClientRepository(session).update(client))
+
+
+class ThreadPoolClientRepository(AsyncClientRepositoryPort):
+    """
+    `ClientRepository` sobre a `Session` síncrona, com cada chamada no threadpool.
+    Usado pelas rotas assíncronas de clientes: a thread fica presa só durante a
+    consulta, e não enquanto a rota aguarda outra coisa (ex.: o hash da senha).
+    As leituras encerram a transação ao terminar, devolvendo a conexão ao pool
+    durante essa espera; as escritas já confirmam a transação.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self.repository = ClientRepository(db_session)
+
+    def _read(self, fn, *args):
+        try:
+            return fn(*args)
+        finally:
+            self.db_session.rollback()
+
+    async def create(self, client: Client) -> Client:
+        return await run_in_threadpool(self.repository.create, client)
+
+    async def find_by_cpf(self, cpf: str) -> Optional[Client]:
+        return await run_in_threadpool(self._read, self.repository.find_by_cpf, cpf)
+
+    async def get_or_create_id(self, client: Client) -> int:
+        return await run_in_threadpool(self.repository.get_or_create_id, client)
+
+    async def find_by_email(self, email: str) -> Optional[Client]:
+        return await run_in_threadpool(self._read, self.repository.find_by_email, email)
+
+    async def update(self, client: Client) -> Client:
+        return await run_in_threadpool(self.repository.update, client)
@@ -0,0 +1,111 @@
+import csv
+import io
+from typing import Iterable, List, TextIO
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.entities.client_import import ClientImportRow, ClientImportSummary
+from app.core.ports.client_import_port import ClientImportPort
+from app.devices.db.unit_of_work import save_changes
+
+STAGING_TABLE = "client_import_staging"
+
+CREATE_STAGING = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    line integer PRIMARY KEY,
+    cpf text,
+    name text,
+    email text,
+    error text
+) ON COMMIT DROP
+"""
+
+COPY_STAGING = f"COPY {STAGING_TABLE} (line, cpf, name, email, error) FROM STDIN WITH (FORMAT csv)"
+
+# Cadastra a primeira ocorrência de cada e-mail do arquivo e, entre essas, a primeira de
+# cada CPF, desde que ainda não exista em base_users; marca o motivo nas demais. Assim uma
+# linha recusada pelo e-mail não faz as seguintes com o mesmo CPF parecerem repetidas.
+# O UPDATE enxerga base_users como estava antes dos INSERTs do próprio statement, então
+# "já cadastrado" só acusa registros anteriores.
+MERGE_STAGING = f"""
+WITH by_email AS (
+    SELECT line, cpf, name, email,
+           row_number() OVER (PARTITION BY email ORDER BY line) AS email_rank
+    FROM {STAGING_TABLE}
+    WHERE error IS NULL
+),
+candidates AS (
+    SELECT line, cpf, name, email, email_rank,
+           CASE WHEN email_rank = 1
+                THEN row_number() OVER (PARTITION BY cpf, email_rank = 1 ORDER BY line)
+           END AS cpf_rank
+    FROM by_email
+),
+inserted AS (
+    INSERT INTO base_users (name, email, cpf, password, user_type, active)
+    SELECT name, email, cpf, NULL, 'CLIENT', true
+    FROM candidates
+    WHERE cpf_rank = 1 AND email_rank = 1
+    ORDER BY line
+    ON CONFLICT DO NOTHING
+    RETURNING id, cpf
+),
+linked AS (
+    INSERT INTO clients (id) SELECT id FROM inserted RETURNING id
+)
+UPDATE {STAGING_TABLE} AS staging
+SET error = CASE
+    WHEN c.email_rank > 1 THEN 'E-mail repetido no arquivo.'
+    WHEN c.cpf_rank > 1 THEN 'CPF repetido no arquivo.'
+    WHEN EXISTS (SELECT 1 FROM base_users u WHERE u.cpf = c.cpf) THEN 'CPF já cadastrado no sistema.'
+    WHEN EXISTS (SELECT 1 FROM base_users u WHERE u.email = c.email) THEN 'E-mail já cadastrado no sistema.'
+    ELSE 'CPF ou e-mail cadastrado por outra requisição durante a importação.'
+END
+FROM candidates c
+WHERE staging.line = c.line
+  AND NOT (c.email_rank = 1 AND c.cpf_rank = 1 AND EXISTS (SELECT 1 FROM inserted i WHERE i.cpf = c.cpf))
+"""
+
+COUNT_STAGING = f"""
+SELECT count(*), count(*) FILTER (WHERE error IS NULL), count(*) FILTER (WHERE error IS NOT NULL)
+FROM {STAGING_TABLE}
+"""
+
+COPY_REPORT = (
+    f"COPY (SELECT line, cpf, email, error FROM {STAGING_TABLE} WHERE error IS NOT NULL ORDER BY line) "
+    "TO STDOUT WITH (FORMAT csv, HEADER)"
+)
+
+
+class ClientCopyImporter(ClientImportPort):
+    """
+    Carga em massa de clientes via COPY: cada lote vai para uma tabela temporária
+    (COPY FROM STDIN), um único statement cadastra as linhas válidas em
+    base_users/clients e o relatório de rejeitadas sai por COPY TO STDOUT.
+    Só um lote fica em memória por vez; a tabela temporária some no commit.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def import_rows(self, chunks: Iterable[List[ClientImportRow]], report: TextIO) -> ClientImportSummary:
+        self.db_session.execute(text(CREATE_STAGING))
+        cursor = self.db_session.connection().connection.driver_connection.cursor()
+        try:
+            for chunk in chunks:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows((r.line, r.cpf, r.name, r.email, r.error) for r in chunk)
+                buffer.seek(0)
+                cursor.copy_expert(COPY_STAGING, buffer)
+
+            cursor.execute(f"ANALYZE {STAGING_TABLE}")
+            cursor.execute(MERGE_STAGING)
+            cursor.execute(COUNT_STAGING)
+            received, imported, rejected = cursor.fetchone()
+            cursor.copy_expert(COPY_REPORT, report)
+        finally:
+            cursor.close()
+
+        save_changes(self.db_session)
+        return ClientImportSummary(received=received, imported=imported, rejected=rejected)
@@ -1,10 +1,14 @@
 from datetime import datetime, date
 from typing import List, Optional
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.entities.coupon import Coupon
-from app.core.ports.coupon_repository_port import CouponRepositoryPort
+from app.core.entities.resource_version import ResourceVersion
+from app.core.ports.coupon_repository_port import CouponRepositoryPort, AsyncCouponRepositoryPort
 from app.devices.db.models import CouponModel
+from app.devices.db.unit_of_work import save_changes
 
 
 class CouponRepository(CouponRepositoryPort):
@@ -23,7 +27,7 @@ class CouponRepository(CouponRepositoryPort):
             descricao=coupon.descricao,
         )
         self.db_session.add(coupon_model)
-        self.db_session.commit()
+        save_changes(self.db_session)
         self.db_session.refresh(coupon_model)
 
         return Coupon(
@@ -58,11 +62,23 @@ class CouponRepository(CouponRepositoryPort):
             active=coupon_model.active,
         )
 
+    def find_version(self) -> ResourceVersion:
+        updated_at, count = self.db_session.query(func.max(CouponModel.updated_at), func.count(CouponModel.id)).one()
+        return ResourceVersion(updated_at=updated_at, count=count)
+
     def find_all(self) -> List[Coupon]:
         """
         Retorna todos os cupons cadastrados.
         """
-        coupon_models = self.db_session.query(CouponModel).all()
+        rows = self.db_session.query(
+            CouponModel.id,
+            CouponModel.hash,
+            CouponModel.discount_percentage,
+            CouponModel.max_discount,
+            CouponModel.expires_at,
+            CouponModel.descricao,
+            CouponModel.active,
+        ).all()
         return [
             Coupon(
                 id=c.id,
@@ -73,7 +89,7 @@ class CouponRepository(CouponRepositoryPort):
                 descricao=c.descricao,
                 active=c.active,
             )
-            for c in coupon_models
+            for c in rows
         ]
 
     def update(self, coupon: Coupon) -> Coupon:
@@ -91,7 +107,7 @@ class CouponRepository(CouponRepositoryPort):
         coupon_model.active = coupon.active
         coupon_model.descricao = coupon.descricao
 
-        self.db_session.commit()
+        save_changes(self.db_session)
         self.db_session.refresh(coupon_model)
 
         return Coupon(
@@ -111,4 +127,14 @@ class CouponRepository(CouponRepositoryPort):
         coupon_model = self.db_session.query(CouponModel).get(coupon_id)
         if coupon_model:
             self.db_session.delete(coupon_model)
-            self.db_session.commit()
\ No newline at end of file
+            save_changes(self.db_session)
+
+
+class AsyncCouponRepository(AsyncCouponRepositoryPort):
+    """Repositório de cupons sobre uma `AsyncSession`; mesmas consultas do `CouponRepository` via `run_sync`."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def find_by_hash(self, coupon_hash: str) -> Optional[Coupon]:
+        return await self.db_session.run_sync(lambda session: CouponRepository(session).find_by_hash(coupon_hash))
@@ -1,76 +1,110 @@
-from sqlalchemy import case, asc
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import case, asc, tuple_, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, joinedload
+from typing import Dict, Optional, List, Iterator
 
 from app.core.entities.item import OrderItem
 from app.core.entities.order import Order
-from app.core.ports.order_repository_port import OrderRepositoryPort
-from app.devices.db.models import OrderModel, OrderItemModel
+from app.core.entities.page import Page
+from app.core.entities.resource_version import ResourceVersion
+from app.core.ports.order_repository_port import OrderRepositoryPort, AsyncOrderRepositoryPort
+from app.devices.db.models import OrderModel, OrderItemModel, ProductModel
+from app.devices.db.unit_of_work import save_changes
+from app.shared.cursor import encode_cursor, decode_cursor
 from app.shared.enums.order_status import OrderStatus
 
+# Prioridade de exibição no painel: Pronto > Em Preparação > Recebido
+STATUS_PRIORITY = case(
+    (OrderModel.status == OrderStatus.READY, 1),
+    (OrderModel.status == OrderStatus.IN_PROGRESS, 2),
+    (OrderModel.status == OrderStatus.RECEIVED, 3),
+    else_=9999
+)
+
+STATUS_PRIORITY_VALUES = {
+    OrderStatus.READY: 1,
+    OrderStatus.IN_PROGRESS: 2,
+    OrderStatus.RECEIVED: 3,
+}
+
+# Colunas lidas pelas consultas de leitura: tuplas em vez de models, sem identity map
+ORDER_COLUMNS = (
+    OrderModel.id,
+    OrderModel.client_id,
+    OrderModel.status,
+    OrderModel.coupon_id,
+    OrderModel.amount,
+)
+
+ORDER_ITEM_COLUMNS = (
+    OrderItemModel.order_id,
+    OrderItemModel.id,
+    OrderItemModel.product_id,
+    OrderItemModel.quantity,
+    OrderItemModel.price,
+    ProductModel.name,
+)
+
 
 class OrderRepository(OrderRepositoryPort):
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
-    def create(self, order: Order) -> Order:
-        order_model = OrderModel(
-            client_id=order.client_id,
-            status=order.status,
-            coupon_id=order.coupon_id,
-            amount=order.amount,
+    def _query(self):
+        """
+        Query base de pedidos com itens e produtos carregados antecipadamente.
+        Os itens vêm em um único SELECT ... IN e os produtos no mesmo JOIN,
+        evitando um lazy load por item ao montar as entidades.
+        """
+        return self.db_session.query(OrderModel).options(
+            selectinload(OrderModel.items).joinedload(OrderItemModel.product)
         )
-        self.db_session.add(order_model)
-        self.db_session.flush()
 
-        # Criação de itens do pedido com preço incluído
-        order_item_models = []
-        for item in order.items:
-            item_model = OrderItemModel(
-                order_id=order_model.id,
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price,
-            )
-            self.db_session.add(item_model)
-            order_item_models.append(item_model)
+    def _rows(self):
+        """Query base das leituras: só as colunas de `ORDER_COLUMNS`."""
+        return self.db_session.query(*ORDER_COLUMNS)
 
-        self.db_session.commit()
-
-        # Atualiza os objetos criados
-        self.db_session.refresh(order_model)
-        for item_model in order_item_models:
-            self.db_session.refresh(item_model)
+    def _items_by_order(self, order_ids: List[int]) -> Dict[int, List[OrderItem]]:
+        """Itens (com o nome do produto) de vários pedidos em um único SELECT ... IN."""
+        items = {order_id: [] for order_id in order_ids}
+        if not order_ids:
+            return items
+        rows = (
+            self.db_session.query(*ORDER_ITEM_COLUMNS)
+            .outerjoin(ProductModel, OrderItemModel.product_id == ProductModel.id)
+            .filter(OrderItemModel.order_id.in_(order_ids))
+            .order_by(OrderItemModel.id)
+        )
+        for row in rows:
+            items[row.order_id].append(
+                OrderItem(
+                    id=row.id,
+                    product_id=row.product_id,
+                    quantity=row.quantity,
+                    price=row.price,
+                    name="Unknown" if row.name is None else row.name,
+                )
+            )
+        return items
 
-        created_items = [
-            OrderItem(
-                id=item_model.id,
-                product_id=item_model.product_id,
-                quantity=item_model.quantity,
-                price=item_model.price,
+    def _to_entities(self, rows) -> List[Order]:
+        """Converte linhas de `_rows()` em entidades, carregando os itens em uma consulta só."""
+        items = self._items_by_order([row.id for row in rows])
+        return [
+            Order(
+                id=row.id,
+                client_id=row.client_id,
+                status=row.status,
+                coupon_id=row.coupon_id,
+                amount=row.amount,
+                items=items[row.id],
             )
-            for item_model in order_item_models
+            for row in rows
         ]
 
-        return Order(
-            id=order_model.id,
-            client_id=order_model.client_id,
-            status=order_model.status,
-            coupon_id=order_model.coupon_id,
-            amount=order_model.amount,
-            items=created_items,
-        )
-
-    def find_by_id(self, order_id: int) -> Optional[Order]:
-        order_model = (
-            self.db_session.query(OrderModel)
-            .filter(OrderModel.id == order_id)
-            .filter(OrderModel.active == True)
-            .first()
-        )
-        if not order_model:
-            return None
-
+    @staticmethod
+    def _to_entity(order_model: OrderModel) -> Order:
+        """Converte um `OrderModel` (com itens já carregados) para a entidade `Order`."""
         return Order(
             id=order_model.id,
             client_id=order_model.client_id,
@@ -89,91 +123,102 @@ class OrderRepository(OrderRepositoryPort):
             ]
         )
 
+    def create(self, order: Order) -> Order:
+        order_id = self.db_session.execute(
+            insert(OrderModel)
+            .values(
+                client_id=order.client_id,
+                status=order.status,
+                coupon_id=order.coupon_id,
+                amount=order.amount,
+            )
+            .returning(OrderModel.id)
+        ).scalar_one()
+
+        # Itens gravados em um único INSERT de várias linhas; os ids voltam na ordem dos itens
+        item_ids = []
+        if order.items:
+            item_ids = self.db_session.scalars(
+                insert(OrderItemModel).returning(OrderItemModel.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "order_id": order_id,
+                        "product_id": item.product_id,
+                        "quantity": item.quantity,
+                        "price": item.price,
+                    }
+                    for item in order.items
+                ],
+            ).all()
+
+        save_changes(self.db_session)
+
+        created_items = [
+            OrderItem(
+                id=item_id,
+                product_id=item.product_id,
+                quantity=item.quantity,
+                price=item.price,
+            )
+            for item_id, item in zip(item_ids, order.items)
+        ]
+
+        return Order(
+            id=order_id,
+            client_id=order.client_id,
+            status=order.status,
+            coupon_id=order.coupon_id,
+            amount=order.amount,
+            items=created_items,
+        )
+
+    def find_by_id(self, order_id: int) -> Optional[Order]:
+        row = (
+            self._rows()
+            .filter(OrderModel.id == order_id)
+            .filter(OrderModel.active == True)
+            .first()
+        )
+        if not row:
+            return None
+
+        return self._to_entities([row])[0]
+
     def find_all(self) -> List[Order]:
-        order_models = (
-            self.db_session.query(OrderModel)
+        rows = (
+            self._rows()
             .filter(OrderModel.active == True)
             .all()
         )
 
-        return [
-            Order(
-                id=order_model.id,
-                client_id=order_model.client_id,
-                status=order_model.status,
-                coupon_id=order_model.coupon_id,
-                amount=order_model.amount,
-                items=[
-                    OrderItem(
-                        id=item.id,
-                        product_id=item.product_id,
-                        quantity=item.quantity,
-                        price=item.price,
-                        name=getattr(item.product, "name", "Unknown"),
-                    )
-                    for item in order_model.items
-                ]
-            )
-            for order_model in order_models
-        ]
+        return self._to_entities(rows)
 
-    def find_by_status(self, status: str) -> List[Order]:
-        order_models = (
-            self.db_session.query(OrderModel)
+    def _by_status_query(self, status: str):
+        return (
+            self._rows()
             .filter(OrderModel.status == status)
             .filter(OrderModel.active == True)
-            .all()
         )
 
-        return [
-            Order(
-                id=order_model.id,
-                client_id=order_model.client_id,
-                status=order_model.status,
-                coupon_id=order_model.coupon_id,
-                amount=order_model.amount,
-                items=[
-                    OrderItem(
-                        id=item.id,
-                        product_id=item.product_id,
-                        quantity=item.quantity,
-                        price=item.price,
-                        name=getattr(item.product, "name", "Unknown"),
-                    )
-                    for item in order_model.items
-                ]
-            )
-            for order_model in order_models
-        ]
-
-    def find_by_client(self, client_id: int) -> List[Order]:
-        order_models = (
-            self.db_session.query(OrderModel)
+    def _by_client_query(self, client_id: int):
+        return (
+            self._rows()
             .filter(OrderModel.client_id == client_id)
             .filter(OrderModel.active == True)
-            .all()
         )
 
-        return [
-            Order(
-                id=order_model.id,
-                client_id=order_model.client_id,
-                status=order_model.status,
-                coupon_id=order_model.coupon_id,
-                amount=order_model.amount,
-                items=[
-                    OrderItem(
-                        id=item.id,
-                        product_id=item.product_id,
-                        quantity=item.quantity,
-                        price=item.price,
-                        name=getattr(item.product, "name", "Unknown"),
-                    )
-                    for item in order_model.items
-                ]
-            )
-            for order_model in order_models
-        ]
+    def _active_query(self):
+        return (
+            self._rows()
+            .filter(OrderModel.status != OrderStatus.COMPLETED)
+            .filter(OrderModel.active == True)
+        )
+
+    def find_by_status(self, status: str) -> List[Order]:
+        return self._to_entities(self._by_status_query(status).all())
+
+    def find_by_client(self, client_id: int) -> List[Order]:
+        return self._to_entities(self._by_client_query(client_id).all())
 
     def find_active_sorted_orders(self) -> List[Order]:
         """
@@ -181,74 +226,151 @@ class OrderRepository(OrderRepositoryPort):
          1. Pronto > Em Preparação > Recebido;
          2. Pedidos mais antigos (pelo id) primeiro.
         """
-        status_priority = case(
-            (OrderModel.status == OrderStatus.READY, 1),
-            (OrderModel.status == OrderStatus.IN_PROGRESS, 2),
-            (OrderModel.status == OrderStatus.RECEIVED, 3),
-            else_=9999
+        rows = (
+            self._active_query()
+            .order_by(STATUS_PRIORITY, asc(OrderModel.id))
+            .all()
         )
 
-        order_models = (
-            self.db_session.query(OrderModel)
-            .filter(OrderModel.status != OrderStatus.COMPLETED)
-            .filter(OrderModel.active == True)
-            .order_by(status_priority, asc(OrderModel.id))
+        return self._to_entities(rows)
+
+    def _page_by_id(self, query, limit: int, cursor: Optional[str]) -> Page[Order]:
+        """Pagina uma query de pedidos pelo id (keyset), do mais antigo ao mais recente."""
+        if cursor:
+            (last_id,) = decode_cursor(cursor, 1)
+            query = query.filter(OrderModel.id > last_id)
+
+        # Busca um registro a mais para saber se existe próxima página
+        rows = query.order_by(asc(OrderModel.id)).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = encode_cursor(rows[-1].id) if has_more else None
+        return Page(items=self._to_entities(rows), next_cursor=next_cursor)
+
+    def find_by_status_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return self._page_by_id(self._by_status_query(status), limit, cursor)
+
+    def find_by_client_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return self._page_by_id(self._by_client_query(client_id), limit, cursor)
+
+    def find_active_sorted_orders_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        """
+        Versão paginada de `find_active_sorted_orders`, com keyset em (prioridade do status, id).
+        """
+        query = self._active_query()
+        if cursor:
+            last_priority, last_id = decode_cursor(cursor, 2)
+            query = query.filter(tuple_(STATUS_PRIORITY, OrderModel.id) > tuple_(last_priority, last_id))
+
+        rows = (
+            query.order_by(STATUS_PRIORITY, asc(OrderModel.id))
+            .limit(limit + 1)
             .all()
         )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
-        return [
-            Order(
-                id=order_model.id,
-                client_id=order_model.client_id,
-                status=order_model.status,
-                coupon_id=order_model.coupon_id,
-                amount=order_model.amount,
-                items=[
-                    OrderItem(
-                        id=item.id,
-                        product_id=item.product_id,
-                        quantity=item.quantity,
-                        price=item.price,
-                        name=getattr(item.product, "name", "Unknown"),
-                    )
-                    for item in order_model.items
-                ]
-            )
-            for order_model in order_models
-        ]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor(STATUS_PRIORITY_VALUES.get(last.status, 9999), last.id)
+        return Page(items=self._to_entities(rows), next_cursor=next_cursor)
+
+    def _stream(self, query, batch_size: int) -> Iterator[Order]:
+        """
+        Itera os pedidos de uma query usando um cursor no servidor (yield_per),
+        mantendo em memória apenas um lote de `batch_size` pedidos por vez.
+        Os itens de cada lote vêm em um único SELECT ... IN.
+        """
+        batch = []
+        for row in query.yield_per(batch_size):
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield from self._to_entities(batch)
+                batch = []
+        if batch:
+            yield from self._to_entities(batch)
+
+    def stream_by_status(self, status: str, batch_size: int = 500) -> Iterator[Order]:
+        return self._stream(self._by_status_query(status).order_by(asc(OrderModel.id)), batch_size)
+
+    def stream_by_client(self, client_id: int, batch_size: int = 500) -> Iterator[Order]:
+        return self._stream(self._by_client_query(client_id).order_by(asc(OrderModel.id)), batch_size)
+
+    def stream_active_sorted_orders(self, batch_size: int = 500) -> Iterator[Order]:
+        return self._stream(
+            self._active_query().order_by(STATUS_PRIORITY, asc(OrderModel.id)), batch_size
+        )
 
     def update(self, order: Order) -> Order:
-        # Busca o modelo do pedido no banco pelo ID
-        order_model = self.db_session.query(OrderModel).get(order.id)
+        # Busca o modelo do pedido no banco pelo ID, já com itens e produtos
+        order_model = self._query().filter(OrderModel.id == order.id).first()
         if not order_model:
             raise ValueError("Pedido não encontrado.")
 
         # Atualiza o status do pedido
         order_model.status = order.status
 
-        self.db_session.commit()
-        self.db_session.refresh(order_model)
+        # Monta a entidade antes do commit: os itens não mudam e o commit
+        # expira os atributos, o que forçaria um novo lazy load por item.
+        updated_order = self._to_entity(order_model)
+        save_changes(self.db_session)
 
-        updated_items = [
-            OrderItem(
-                id=item.id,
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price,
-                name=getattr(item.product, "name", "Unknown"),
-            )
-            for item in order_model.items
-        ]
-
-        return Order(
-            id=order_model.id,
-            client_id=order_model.client_id,
-            status=order_model.status,
-            coupon_id=order_model.coupon_id,
-            amount=order_model.amount,
-            items=updated_items,
-        )
+        return updated_order
 
     def delete(self, order_id: int) -> None:
         """Remove o order pelo ID."""
-        pass
\ No newline at end of file
+        pass
+
+    def find_version(self, order_id: int) -> Optional[ResourceVersion]:
+        updated_at = (
+            self.db_session.query(OrderModel.updated_at)
+            .filter(OrderModel.id == order_id)
+            .filter(OrderModel.active == True)
+            .scalar()
+        )
+        if updated_at is None:
+            return None
+        return ResourceVersion(updated_at=updated_at, count=1)
+
+
+class AsyncOrderRepository(AsyncOrderRepositoryPort):
+    """
+    Repositório de pedidos sobre uma `AsyncSession` (asyncpg). As consultas são as
+    mesmas do `OrderRepository`, executadas com `run_sync`: o SQL vai pelo driver
+    assíncrono sem ocupar o thread pool nem bloquear o event loop.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, order: Order) -> Order:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).create(order))
+
+    async def find_by_id(self, order_id: int) -> Optional[Order]:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).find_by_id(order_id))
+
+    async def find_active_sorted_orders(self) -> List[Order]:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).find_active_sorted_orders())
+
+    async def find_by_status_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).find_by_status_page(status, limit, cursor)
+        )
+
+    async def find_by_client_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).find_by_client_page(client_id, limit, cursor)
+        )
+
+    async def find_active_sorted_orders_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).find_active_sorted_orders_page(limit, cursor)
+        )
+
+    async def update(self, order: Order) -> Order:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).update(order))
+
+    async def find_version(self, order_id: int) -> Optional[ResourceVersion]:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).find_version(order_id))
@@ -1,9 +1,21 @@
-from typing import Optional
+from typing import List, Optional
 
+from sqlalchemy import DateTime, Integer, String, cast, column, exists, func, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.entities.payment import Payment
-from app.core.ports.payment_repository_port import PaymentRepositoryPort
-from app.devices.db.models import PaymentModel
+from app.core.entities.payment import Payment, PaymentStatusChange, PaymentStatusChangeResult
+from app.core.ports.payment_repository_port import PaymentRepositoryPort, AsyncPaymentRepositoryPort
+from app.devices.db.models import PaymentModel, PaymentWebhookEventModel
+from app.shared.enums.payment_change_outcome import PaymentChangeOutcome
+from app.devices.db.unit_of_work import save_changes
+
+PAYMENT_FIELDS = ("id", "order_id", "qr_code", "status", "payment_date", "description", "amount")
+
+
+def _payment_columns(table):
+    return [table.c[name] for name in PAYMENT_FIELDS]
+
 
 class PaymentRepository(PaymentRepositoryPort):
     def __init__(self, db_session: Session):
@@ -19,10 +31,10 @@ class PaymentRepository(PaymentRepositoryPort):
             amount=payment.amount,
         )
         self.db_session.add(payment_model)
-        self.db_session.commit()
-        self.db_session.refresh(payment_model)
+        self.db_session.flush()
 
-        return Payment(
+        # Todos os campos da entidade são conhecidos após o flush; dispensa o refresh
+        created_payment = Payment(
             id=payment_model.id,
             order_id=payment_model.order_id,
             qr_code=payment_model.qr_code,
@@ -31,6 +43,8 @@ class PaymentRepository(PaymentRepositoryPort):
             description=payment_model.description,
             amount=payment_model.amount,
         )
+        save_changes(self.db_session)
+        return created_payment
 
     def get_by_order_id(self, order_id: int) -> Optional[Payment]:
         payment_model = (
@@ -58,7 +72,7 @@ class PaymentRepository(PaymentRepositoryPort):
         payment_model.status = payment.status
         payment_model.description = payment.description
         payment_model.payment_date = payment.payment_date
-        self.db_session.commit()
+        save_changes(self.db_session)
         self.db_session.refresh(payment_model)
         return Payment(
             id=payment_model.id,
@@ -69,3 +83,105 @@ class PaymentRepository(PaymentRepositoryPort):
             description=payment_model.description,
             amount=payment_model.amount,
         )
+
+    def apply_status_changes(self, changes: List[PaymentStatusChange]) -> List[PaymentStatusChangeResult]:
+        """
+        Aplica as mudanças (no máximo uma por pedido) em um único comando:
+
+            WITH changes AS (VALUES ...),
+                 fresh AS (INSERT INTO payment_webhook_events ... ON CONFLICT DO NOTHING RETURNING ...),
+                 updated AS (UPDATE payments ... FROM changes WHERE <sem chave ou chave nova> RETURNING ...)
+            SELECT ... FROM changes LEFT JOIN updated LEFT JOIN payments
+
+        A chave de idempotência só é gravada se o pedido tiver pagamento; uma chave já
+        gravada (para qualquer pedido) não reaplica a mudança. O SELECT final enxerga `payments` como estava
+        antes do UPDATE: para as duplicadas, é o estado atual.
+        """
+        payments = PaymentModel.__table__
+        events = PaymentWebhookEventModel.__table__
+
+        changes_cte = select(
+            values(
+                column("order_id", Integer),
+                column("status", String),
+                column("description", String),
+                column("payment_date", DateTime),
+                column("idempotency_key", String),
+                name="v",
+            ).data([
+                (c.order_id, c.status.name, c.description, c.payment_date, c.idempotency_key)
+                for c in changes
+            ])
+        ).cte("changes")
+
+        fresh = (
+            insert(events)
+            .from_select(
+                ["idempotency_key", "order_id"],
+                select(changes_cte.c.idempotency_key, changes_cte.c.order_id)
+                .where(changes_cte.c.idempotency_key.isnot(None))
+                .where(exists().where(payments.c.order_id == changes_cte.c.order_id)),
+            )
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(events.c.idempotency_key, events.c.order_id)
+            .cte("fresh")
+        )
+        updated = (
+            update(payments)
+            .where(payments.c.order_id == changes_cte.c.order_id)
+            .where(or_(
+                changes_cte.c.idempotency_key.is_(None),
+                # A chave só vale para o pedido com que foi gravada
+                tuple_(changes_cte.c.idempotency_key, changes_cte.c.order_id).in_(
+                    select(fresh.c.idempotency_key, fresh.c.order_id)
+                ),
+            ))
+            .values(
+                # Os literais do VALUES chegam como texto; o tipo das colunas vem do cast
+                status=cast(changes_cte.c.status, payments.c.status.type),
+                description=changes_cte.c.description,
+                payment_date=func.coalesce(cast(changes_cte.c.payment_date, DateTime), payments.c.payment_date),
+            )
+            .returning(*_payment_columns(payments))
+            .cte("updated")
+        )
+        statement = (
+            select(
+                changes_cte.c.order_id,
+                (updated.c.id.isnot(None)).label("applied"),
+                *(c.label(f"updated_{c.name}") for c in _payment_columns(updated)),
+                *(c.label(f"current_{c.name}") for c in _payment_columns(payments)),
+            )
+            .select_from(
+                changes_cte
+                .outerjoin(updated, updated.c.order_id == changes_cte.c.order_id)
+                .outerjoin(payments, payments.c.order_id == changes_cte.c.order_id)
+            )
+        )
+
+        results = {}
+        for row in self.db_session.execute(statement).mappings():
+            if row["applied"]:
+                outcome, prefix = PaymentChangeOutcome.UPDATED, "updated_"
+            elif row["current_id"] is not None:
+                outcome, prefix = PaymentChangeOutcome.DUPLICATE, "current_"
+            else:
+                results[row["order_id"]] = PaymentStatusChangeResult(row["order_id"], PaymentChangeOutcome.NOT_FOUND)
+                continue
+            payment = Payment(**{name: row[prefix + name] for name in PAYMENT_FIELDS})
+            results[row["order_id"]] = PaymentStatusChangeResult(row["order_id"], outcome, payment)
+        save_changes(self.db_session)
+        return [results[c.order_id] for c in changes]
+
+
+class AsyncPaymentRepository(AsyncPaymentRepositoryPort):
+    """Repositório de pagamentos sobre uma `AsyncSession`; mesmas consultas do `PaymentRepository` via `run_sync`."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, payment: Payment) -> Payment:
+        return await self.db_session.run_sync(lambda session: PaymentRepository(session).create(payment))
+
+    async def get_by_order_id(self, order_id: int) -> Optional[Payment]:
+        return await self.db_session.run_sync(lambda session: PaymentRepository(session).get_by_order_id(order_id))
@@ -1,9 +1,40 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from sqlalchemy import Float, Integer, String, case, cast, column, exists, func, literal, select, true, tuple_, update, \
+    values
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.entities.product import Product
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.adapters.gateways.cached_product import CachedProductRepository, invalidate_product_cache
+from app.core.entities.product import Product, ProductCatalogChange
+from app.core.entities.resource_version import ResourceVersion
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 from app.devices.db.models import ProductModel
+from app.devices.db.unit_of_work import save_changes
+from app.shared.enums.catalog_change import CatalogChange
+from app.shared.enums.categorys import CategoryEnum
+
+
+# Colunas lidas pelas listagens: o SELECT devolve tuplas, sem instanciar models nem passar pelo identity map
+PRODUCT_COLUMNS = (
+    ProductModel.id,
+    ProductModel.name,
+    ProductModel.description,
+    ProductModel.price,
+    ProductModel.category,
+    ProductModel.quantity_available,
+)
+
+
+def _row_to_entity(row) -> Product:
+    return Product(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        price=row.price,
+        category=row.category,
+        quantity_available=row.quantity_available
+    )
 
 
 class ProductRepository(ProductRepositoryPort):
@@ -11,6 +42,8 @@ class ProductRepository(ProductRepositoryPort):
         self.db_session = db_session
 
     def create(self, product: Product) -> Product:
+        if self.db_session.query(exists().where(ProductModel.name == product.name)).scalar():
+            raise ValueError("Já existe um produto com este nome.")
         product_model = ProductModel(
             name=product.name,
             description=product.description,
@@ -19,7 +52,8 @@ class ProductRepository(ProductRepositoryPort):
             quantity_available=product.quantity_available
         )
         self.db_session.add(product_model)
-        self.db_session.commit()
+        invalidate_product_cache(self.db_session)
+        save_changes(self.db_session)
         self.db_session.refresh(product_model)
         # Converte de volta para a dataclass
         return Product(
@@ -44,35 +78,40 @@ class ProductRepository(ProductRepositoryPort):
             quantity_available=product_model.quantity_available
         )
 
+    def find_by_ids(self, product_ids: List[int]) -> List[Product]:
+        if not product_ids:
+            return []
+        rows = (
+            self.db_session.query(*PRODUCT_COLUMNS)
+            .filter(ProductModel.id.in_(set(product_ids)))
+            .all()
+        )
+        return [_row_to_entity(row) for row in rows]
+
     def find_all(self) -> List[Product]:
-        product_models = self.db_session.query(ProductModel).filter(ProductModel.active == True).all()
-        return [
-            Product(
-                id=m.id,
-                name=m.name,
-                description=m.description,
-                price=m.price,
-                category=m.category,
-                quantity_available=m.quantity_available
-            )
-            for m in product_models
-        ]
+        rows = self.db_session.query(*PRODUCT_COLUMNS).filter(ProductModel.active == True).all()
+        return [_row_to_entity(row) for row in rows]
+
+    def find_menu(self) -> Dict[CategoryEnum, List[Product]]:
+        """Um único SELECT ordenado por categoria; todas as categorias aparecem, mesmo vazias."""
+        rows = (
+            self.db_session.query(*PRODUCT_COLUMNS)
+            .filter(ProductModel.active == True)
+            .order_by(ProductModel.category, ProductModel.id)
+            .all()
+        )
+        menu = {category: [] for category in CategoryEnum}
+        for row in rows:
+            menu[row.category].append(_row_to_entity(row))
+        return menu
 
     def find_by_category(self, category: str) -> List[Product]:
-        product_models = self.db_session.query(ProductModel).filter(
-            ProductModel.category == category and ProductModel.active == True
-        ).all()
-        return [
-            Product(
-                id=m.id,
-                name=m.name,
-                description=m.description,
-                price=m.price,
-                category=m.category,
-                quantity_available=m.quantity_available
-            )
-            for m in product_models
-        ]
+        rows = (
+            self.db_session.query(*PRODUCT_COLUMNS)
+            .filter(ProductModel.category == category, ProductModel.active == True)
+            .all()
+        )
+        return [_row_to_entity(row) for row in rows]
 
     def update(self, product: Product) -> Product:
         product_model = self.db_session.query(ProductModel).get(product.id)
@@ -83,7 +122,8 @@ class ProductRepository(ProductRepositoryPort):
         product_model.price = product.price
         product_model.category = product.category
         product_model.quantity_available = product.quantity_available
-        self.db_session.commit()
+        invalidate_product_cache(self.db_session)
+        save_changes(self.db_session)
         self.db_session.refresh(product_model)
         return Product(
             id=product_model.id,
@@ -94,11 +134,203 @@ class ProductRepository(ProductRepositoryPort):
             quantity_available=product_model.quantity_available
         )
 
+    def reserve_stock(self, quantities: Dict[int, int]) -> List[int]:
+        """
+        Um único UPDATE ... FROM (VALUES ...) condicional para todos os produtos:
+        a condição `quantity_available >= quantidade` é reavaliada pelo Postgres
+        sobre a versão mais recente da linha, então dois pedidos concorrentes
+        não conseguem vender a mesma unidade.
+        """
+        if not quantities:
+            return []
+        requested = values(
+            column("id", Integer), column("quantity", Integer), name="requested"
+        ).data(sorted(quantities.items()))
+        statement = (
+            update(ProductModel)
+            .where(ProductModel.id == requested.c.id)
+            .where(ProductModel.quantity_available >= requested.c.quantity)
+            # Venda não é alteração do cardápio: mantém o `updated_at`, que versiona o catálogo
+            .values(
+                quantity_available=ProductModel.quantity_available - requested.c.quantity,
+                updated_at=ProductModel.updated_at,
+            )
+            .returning(ProductModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        reserved = set(self.db_session.execute(statement).scalars())
+        return [product_id for product_id in sorted(quantities) if product_id not in reserved]
+
+    def find_catalog_version(self, category: Optional[str] = None) -> ResourceVersion:
+        """
+        Um único SELECT agregado. A última alteração considera também os produtos
+        desativados, para que a remoção de um deles mude a versão.
+
+        As vendas (`reserve_stock`) não mudam o `updated_at`: a versão só muda com
+        alterações do cardápio e quando um produto esgota ou volta a ter estoque
+        (`available`). Assim o cache das listagens e o ETag sobrevivem ao movimento
+        de pedidos; a quantidade exata exibida pode estar defasada até a próxima
+        mudança de versão, mas o pedido sempre confere o estoque no banco.
+        """
+        query = self.db_session.query(
+            func.max(ProductModel.updated_at),
+            func.count(ProductModel.id).filter(ProductModel.active == True),
+            func.count(ProductModel.id).filter(ProductModel.active == True, ProductModel.quantity_available > 0),
+        )
+        if category is not None:
+            query = query.filter(ProductModel.category == category)
+        updated_at, count, available = query.one()
+        return ResourceVersion(updated_at=updated_at, count=count, available=available)
+
     def delete(self, product_id: int) -> None:
         product_model = self.db_session.query(ProductModel).get(product_id)
         if not product_model.active:
             raise ValueError("Product inactive")
         if product_model:
             product_model.active = False
-            self.db_session.commit()
+            invalidate_product_cache(self.db_session)
+            save_changes(self.db_session)
             self.db_session.refresh(product_model)
+
+    def upsert_catalog(self, products: List[Product], deactivate_missing: bool) -> List[ProductCatalogChange]:
+        """
+        Um único comando para o lote inteiro:
+
+            WITH incoming AS (SELECT * FROM unnest(:names, :descriptions, ...)),
+                 upserted AS (INSERT INTO product ... ON CONFLICT (name) DO UPDATE ... WHERE <mudou> RETURNING ...),
+                 deactivated AS (UPDATE product SET active = false WHERE <ativo e fora do lote> RETURNING ...)
+            SELECT ... FROM upserted UNION ALL SELECT ... FROM deactivated
+
+        Os produtos vão como cinco arrays, então o número de parâmetros não cresce
+        com o lote (o asyncpg aceita no máximo 32767). Produtos idênticos ao que já
+        está gravado não são reescritos nem mudam o `updated_at`. O SELECT final
+        enxerga `product` como estava antes do INSERT: quem já existia foi atualizado.
+        """
+        table = ProductModel.__table__
+        incoming = (
+            select(
+                func.unnest(
+                    literal([p.name for p in products], ARRAY(String)),
+                    literal([p.description for p in products], ARRAY(String)),
+                    literal([float(p.price) for p in products], ARRAY(Float)),
+                    literal([CategoryEnum(p.category).name for p in products], ARRAY(String)),
+                    literal([p.quantity_available for p in products], ARRAY(Integer)),
+                )
+                .table_valued("name", "description", "price", "category", "quantity_available")
+                .render_derived(with_types=False)
+            )
+            .cte("incoming")
+        )
+
+        statement = insert(table).from_select(
+            ["name", "description", "price", "category", "quantity_available", "active"],
+            select(
+                incoming.c.name,
+                incoming.c.description,
+                incoming.c.price,
+                # Os valores chegam como texto; o tipo enum da coluna vem do cast
+                cast(incoming.c.category, table.c.category.type),
+                incoming.c.quantity_available,
+                true(),
+            ),
+        )
+        excluded = statement.excluded
+        upserted = (
+            statement.on_conflict_do_update(
+                index_elements=["name"],
+                set_={
+                    "description": excluded.description,
+                    "price": excluded.price,
+                    "category": excluded.category,
+                    "quantity_available": excluded.quantity_available,
+                    "active": True,
+                    # O onupdate do model não vale para o ON CONFLICT
+                    "updated_at": func.now(),
+                },
+                where=tuple_(
+                    table.c.description, table.c.price, table.c.category, table.c.quantity_available, table.c.active,
+                ).is_distinct_from(tuple_(
+                    excluded.description, excluded.price, excluded.category, excluded.quantity_available, excluded.active,
+                )),
+            )
+            .returning(table.c.id, table.c.name)
+            .cte("upserted")
+        )
+        existing = exists().where(table.c.name == upserted.c.name)
+        statement = select(
+            upserted.c.id,
+            upserted.c.name,
+            case((existing, CatalogChange.UPDATED.value), else_=CatalogChange.CREATED.value).label("change"),
+        )
+
+        if deactivate_missing:
+            deactivated = (
+                update(table)
+                .where(table.c.active == True)
+                .where(~exists().where(incoming.c.name == table.c.name))
+                .values(active=False, updated_at=func.now())
+                .returning(table.c.id, table.c.name)
+                .cte("deactivated")
+            )
+            statement = statement.union_all(
+                select(deactivated.c.id, deactivated.c.name, literal(CatalogChange.DEACTIVATED.value))
+            )
+
+        changes = [
+            ProductCatalogChange(id=row.id, name=row.name, change=CatalogChange(row.change))
+            for row in self.db_session.execute(statement)
+        ]
+        if changes:
+            invalidate_product_cache(self.db_session)
+        save_changes(self.db_session)
+        return sorted(changes, key=lambda item: item.id)
+
+
+class AsyncProductRepository(AsyncProductRepositoryPort):
+    """
+    Repositório de produtos sobre uma `AsyncSession`; mesmas consultas do `ProductRepository` via `run_sync`.
+    Com `cached=True` as leituras passam pelo `CachedProductRepository`.
+    """
+
+    def __init__(self, db_session: AsyncSession, cached: bool = False):
+        self.db_session = db_session
+        self.cached = cached
+
+    def _repository(self, session: Session) -> ProductRepositoryPort:
+        repository = ProductRepository(session)
+        return CachedProductRepository(repository) if self.cached else repository
+
+    async def create(self, product: Product) -> Product:
+        return await self.db_session.run_sync(lambda session: self._repository(session).create(product))
+
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_by_id(product_id))
+
+    async def find_by_ids(self, product_ids: List[int]) -> List[Product]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_by_ids(product_ids))
+
+    async def find_by_category(self, category: str) -> List[Product]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_by_category(category))
+
+    async def find_menu(self) -> Dict[CategoryEnum, List[Product]]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_menu())
+
+    async def find_all(self) -> List[Product]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_all())
+
+    async def update(self, product: Product) -> Product:
+        return await self.db_session.run_sync(lambda session: self._repository(session).update(product))
+
+    async def reserve_stock(self, quantities: Dict[int, int]) -> List[int]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).reserve_stock(quantities))
+
+    async def delete(self, product_id: int) -> None:
+        await self.db_session.run_sync(lambda session: self._repository(session).delete(product_id))
+
+    async def upsert_catalog(self, products: List[Product], deactivate_missing: bool) -> List[ProductCatalogChange]:
+        return await self.db_session.run_sync(
+            lambda session: self._repository(session).upsert_catalog(products, deactivate_missing)
+        )
+
+    async def find_catalog_version(self, category: Optional[str] = None) -> ResourceVersion:
+        return await self.db_session.run_sync(lambda session: self._repository(session).find_catalog_version(category))
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from app.adapters.presenters.order.order_presenter import OrderPresenter
+from app.core.entities.order import Order
+from app.core.ports.order_event_publisher_port import OrderEventPublisherPort
+from app.shared.enums.order_event_type import OrderEventType
+
+# Sinaliza ao assinante que ele perdeu eventos e precisa de um novo snapshot
+RESYNC = object()
+
+
+class OrderBoardSubscription:
+    """Fila de eventos de um painel conectado, consumida no event loop da conexão."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.max_pending = max_pending
+
+    def _deliver(self, item) -> None:
+        # Executa no event loop do assinante
+        if item is not RESYNC and self.queue.qsize() >= self.max_pending:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            item = RESYNC
+        self.queue.put_nowait(item)
+
+    def deliver(self, item) -> None:
+        self.loop.call_soon_threadsafe(self._deliver, item)
+
+    async def get(self, timeout: float):
+        """Aguarda o próximo evento; retorna None se o tempo esgotar."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class OrderBoardFeed(OrderEventPublisherPort):
+    """
+    Feed em memória dos eventos do painel da cozinha.
+
+    Cada evento recebe uma versão monotônica e fica num buffer circular, o que
+    permite a um painel que reconecta (Last-Event-ID) receber só o que perdeu.
+    As versões são por processo: com vários workers/réplicas cada um mantém o
+    seu feed, e um painel só enxerga os eventos publicados no mesmo processo.
+    """
+
+    def __init__(self, history_size: int = 1000, max_pending: int = 1000):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._history: Deque[Tuple[int, str, str]] = deque(maxlen=history_size)
+        self._subscribers: Set[OrderBoardSubscription] = set()
+        self._max_pending = max_pending
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def publish(self, event_type: OrderEventType, order: Order) -> int:
+        """
+        Registra o evento e o entrega a todos os painéis conectados.
+        Pode ser chamado de qualquer thread (os endpoints síncronos rodam no threadpool).
+        """
+        if event_type == OrderEventType.REMOVED:
+            data = json.dumps({"id": order.id})
+        else:
+            data = OrderPresenter.present(order).model_dump_json()
+
+        with self._lock:
+            self._version += 1
+            event = (self._version, event_type.value, data)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            subscriber.deliver(event)
+        return event[0]
+
+    def subscribe(self, last_version: Optional[int] = None) -> Tuple[OrderBoardSubscription, int, Optional[List]]:
+        """
+        Registra um novo assinante no event loop corrente.
+
+        Retorna (assinatura, versão atual, eventos perdidos). Os eventos perdidos
+        são None quando não é possível retomar a partir de `last_version` (versão
+        desconhecida ou já fora do buffer) e o painel precisa de um snapshot.
+        """
+        subscription = OrderBoardSubscription(asyncio.get_running_loop(), self._max_pending)
+        with self._lock:
+            self._subscribers.add(subscription)
+            current = self._version
+            missed = None
+            if last_version is not None and last_version <= current:
+                oldest = self._history[0][0] if self._history else current + 1
+                if last_version == current or last_version >= oldest - 1:
+                    missed = [event for event in self._history if event[0] > last_version]
+        return subscription, current, missed
+
+    def unsubscribe(self, subscription: OrderBoardSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+order_board_feed = OrderBoardFeed()
+
+
+def get_order_event_publisher() -> OrderBoardFeed:
+    return order_board_feed
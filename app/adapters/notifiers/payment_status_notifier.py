@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.ports.payment_status_notifier_port import PaymentStatusNotifierPort
+from app.devices.db.connection import SQLALCHEMY_DATABASE_URL, engine
+
+# "memory": avisa só as requisições do próprio processo; "postgres": LISTEN/NOTIFY entre processos
+PAYMENT_NOTIFY_BACKEND = os.getenv("PAYMENT_NOTIFY_BACKEND", "memory")
+PAYMENT_NOTIFY_CHANNEL = "payment_status"
+# O payload do NOTIFY é limitado a 8000 bytes; ids vão em lotes
+NOTIFY_IDS_PER_MESSAGE = 500
+# Reconexão do LISTEN: espera dobra a cada falha, de 0,5 s até o máximo
+PAYMENT_NOTIFY_RETRY_MAX_SECONDS = float(os.getenv("PAYMENT_NOTIFY_RETRY_MAX_SECONDS", "30"))
+PAYMENT_NOTIFY_RETRY_MIN_SECONDS = 0.5
+# Intervalo do SELECT 1 que detecta uma conexão de LISTEN morta sem aviso (ex.: failover)
+PAYMENT_NOTIFY_HEALTHCHECK_SECONDS = float(os.getenv("PAYMENT_NOTIFY_HEALTHCHECK_SECONDS", "30"))
+# Quanto `start()` aguarda a primeira conexão antes de deixar a aplicação subir
+PAYMENT_NOTIFY_START_TIMEOUT_SECONDS = 5
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentStatusSubscription:
+    """Espera de uma requisição pelo pagamento de um pedido, no event loop da requisição."""
+
+    def __init__(self, order_id: int, loop: asyncio.AbstractEventLoop):
+        self.order_id = order_id
+        self.loop = loop
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self.loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Aguarda um aviso; retorna False se o tempo esgotar."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+class PaymentStatusNotifier(PaymentStatusNotifierPort):
+    """
+    Avisos em memória de mudança de pagamento, por pedido.
+
+    Substitui o polling de `GET /orders/{id}/payment_status` por uma espera
+    (long-poll): o webhook publica os pedidos alterados e as requisições
+    que aguardam esses pedidos são acordadas. Vale só para o próprio processo;
+    com vários workers/réplicas use o `PostgresPaymentStatusNotifier`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[PaymentStatusSubscription]] = {}
+
+    def publish(self, order_ids: Iterable[int]) -> None:
+        """Pode ser chamado de qualquer thread (os endpoints síncronos rodam no threadpool)."""
+        self._wake(order_ids)
+
+    def _wake(self, order_ids: Iterable[int]) -> None:
+        with self._lock:
+            subscribers = [s for order_id in order_ids for s in self._subscribers.get(order_id, ())]
+        for subscriber in subscribers:
+            subscriber.notify()
+
+    def _wake_all(self) -> None:
+        with self._lock:
+            subscribers = [s for waiting in self._subscribers.values() for s in waiting]
+        for subscriber in subscribers:
+            subscriber.notify()
+
+    def subscribe(self, order_id: int) -> PaymentStatusSubscription:
+        subscription = PaymentStatusSubscription(order_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(order_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: PaymentStatusSubscription) -> None:
+        with self._lock:
+            waiting = self._subscribers.get(subscription.order_id)
+            if waiting is not None:
+                waiting.discard(subscription)
+                if not waiting:
+                    del self._subscribers[subscription.order_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "orders": len(self._subscribers),
+                "waiting": sum(len(s) for s in self._subscribers.values()),
+            }
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresPaymentStatusNotifier(PaymentStatusNotifier):
+    """
+    Avisos via Postgres LISTEN/NOTIFY: `publish` envia um NOTIFY (além de acordar
+    o próprio processo) e cada processo mantém uma conexão asyncpg dedicada em
+    LISTEN, que acorda as suas requisições.
+
+    A conexão é supervisionada por uma tarefa iniciada em `start()`: se cair
+    (reinício ou failover do banco, detectado pelo encerramento da conexão ou
+    por um SELECT 1 periódico), é reaberta com espera crescente. Ao reconectar,
+    todas as esperas em andamento são acordadas para reler o banco, já que os
+    avisos enviados durante a queda se perderam.
+    """
+
+    def __init__(self, database_url: str = SQLALCHEMY_DATABASE_URL, notify_engine: Engine = engine):
+        super().__init__()
+        # asyncpg recebe a URL sem o driver do SQLAlchemy (ex.: postgresql+psycopg2://)
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.notify_engine = notify_engine
+        self._listener: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected: Optional[asyncio.Event] = None
+        self.reconnects = 0
+
+    def publish(self, order_ids: Iterable[int]) -> None:
+        order_ids = list(order_ids)
+        if not order_ids:
+            return
+        self._wake(order_ids)
+        with self.notify_engine.connect() as conn:
+            for payload in _notify_payloads(order_ids):
+                conn.execute(select(func.pg_notify(PAYMENT_NOTIFY_CHANNEL, payload)))
+            conn.commit()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self._wake(int(order_id) for order_id in payload.split(","))
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._connected = asyncio.Event()
+        self._task = asyncio.create_task(self._listen_forever())
+        # Não impede a aplicação de subir com o banco fora: a tarefa segue tentando
+        try:
+            await asyncio.wait_for(asyncio.shield(self._connected.wait()), PAYMENT_NOTIFY_START_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("LISTEN %s ainda sem conexão; tentando em segundo plano", PAYMENT_NOTIFY_CHANNEL)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_listener()
+
+    async def _listen_forever(self) -> None:
+        delay = PAYMENT_NOTIFY_RETRY_MIN_SECONDS
+        while True:
+            try:
+                lost = await self._connect()
+            except Exception as e:
+                logger.warning("Falha ao abrir o LISTEN %s (%s); nova tentativa em %.1f s",
+                               PAYMENT_NOTIFY_CHANNEL, e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, PAYMENT_NOTIFY_RETRY_MAX_SECONDS)
+                continue
+
+            delay = PAYMENT_NOTIFY_RETRY_MIN_SECONDS
+            if self._connected.is_set():
+                self.reconnects += 1
+                self._wake_all()
+            self._connected.set()
+
+            await self._wait_until_lost(lost)
+            logger.warning("Conexão do LISTEN %s perdida; reconectando", PAYMENT_NOTIFY_CHANNEL)
+            await self._close_listener()
+
+    async def _connect(self) -> asyncio.Event:
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        try:
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(PAYMENT_NOTIFY_CHANNEL, self._on_notify)
+        except Exception:
+            connection.terminate()
+            raise
+        self._listener = connection
+        return lost
+
+    async def _wait_until_lost(self, lost: asyncio.Event) -> None:
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), PAYMENT_NOTIFY_HEALTHCHECK_SECONDS)
+            except asyncio.TimeoutError:
+                try:
+                    await self._listener.fetchval("SELECT 1", timeout=PAYMENT_NOTIFY_HEALTHCHECK_SECONDS)
+                except Exception:
+                    return
+
+    async def _close_listener(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.is_closed():
+            try:
+                await asyncio.wait_for(listener.close(), PAYMENT_NOTIFY_RETRY_MIN_SECONDS)
+            except Exception:
+                listener.terminate()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["backend"] = "postgres"
+        stats["listening"] = self._listener is not None and not self._listener.is_closed()
+        stats["reconnects"] = self.reconnects
+        return stats
+
+
+def _notify_payloads(order_ids: List[int]) -> List[str]:
+    return [
+        ",".join(str(order_id) for order_id in order_ids[i:i + NOTIFY_IDS_PER_MESSAGE])
+        for i in range(0, len(order_ids), NOTIFY_IDS_PER_MESSAGE)
+    ]
+
+
+payment_status_notifier = (
+    PostgresPaymentStatusNotifier() if PAYMENT_NOTIFY_BACKEND == "postgres" else PaymentStatusNotifier()
+)
+
+
+def get_payment_status_notifier() -> PaymentStatusNotifier:
+    return payment_status_notifier
@@ -0,0 +1,61 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.entities.resource_version import ResourceVersion
+
+
+def validator_headers(version: ResourceVersion, *salt, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """
+    Monta ETag e Last-Modified a partir da versão do recurso. `salt` entra no ETag
+    quando o conteúdo depende de algo além dos registros (ex.: a data de hoje).
+    O ETag é fraco: identifica o conteúdo, não os bytes da resposta.
+    """
+    parts = [version.count, version.updated_at and version.updated_at.isoformat()]
+    if version.available is not None:
+        parts.append(version.available)
+    raw = ":".join(str(part) for part in (*parts, *salt))
+    headers = {
+        "ETag": f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:20]}"',
+        "Cache-Control": "no-cache",
+    }
+    last_modified = last_modified or version.updated_at
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified).replace(microsecond=0), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Avalia If-None-Match e, na ausência dele, If-Modified-Since (RFC 9110, 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = _opaque(headers["ETag"])
+        return any(tag == "*" or _opaque(tag) == etag for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= _to_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def _opaque(tag: str) -> str:
+    # Comparação fraca: ignora o prefixo W/
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -1,3 +1,4 @@
+from app.adapters.presenters.json_response import dumps
 from app.core.schemas.coupon_schemas import CouponOut
 from app.core.entities.coupon import Coupon
 
@@ -22,3 +23,25 @@ class CouponPresenter:
         Retorna uma lista de cupons formatados.
         """
         return [CouponPresenter.present(coupon) for coupon in coupons]
+
+
+    @staticmethod
+    def to_dict(coupon: Coupon) -> dict:
+        """
+        Mesmo formato do `CouponOut`, montado direto da entidade, sem passar pelo Pydantic.
+        """
+        return {
+            "hash": coupon.hash,
+            "descricao": coupon.descricao,
+            "discount_percentage": float(coupon.discount_percentage),
+            "max_discount": float(coupon.max_discount),
+            "expires_at": coupon.expires_at,
+            "active": coupon.active,
+        }
+
+    @staticmethod
+    def present_list_json(coupons: list[Coupon]) -> bytes:
+        """
+        Retorna a lista de cupons já serializada.
+        """
+        return dumps([CouponPresenter.to_dict(coupon) for coupon in coupons])
@@ -0,0 +1,23 @@
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Response
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serializa dicts/listas simples com orjson. Enums viram o próprio valor e datas
+    saem em ISO 8601, como no `model_dump(mode="json")` do Pydantic.
+    """
+    return orjson.dumps(content)
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None, status_code: int = 200) -> Response:
+    """
+    Resposta com um corpo JSON já serializado pelo presenter.
+
+    Ao receber um `Response` o FastAPI não valida nem codifica o retorno de novo
+    contra o `response_model`; o schema continua declarado na rota e no OpenAPI,
+    então o presenter é quem garante que o formato confere com ele.
+    """
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
@@ -1,4 +1,6 @@
-from app.core.schemas.order_schemas import OrderOut, OrderItemOut
+from app.adapters.presenters.json_response import dumps
+from app.core.entities.page import Page
+from app.core.schemas.order_schemas import OrderOut, OrderItemOut, OrderPageOut
 from app.core.entities.order import Order
 
 class OrderPresenter:
@@ -30,3 +32,52 @@ class OrderPresenter:
         Retorna uma lista de pedidos formatados.
         """
         return [OrderPresenter.present(order) for order in orders]
+
+    @staticmethod
+    def present_page(page: Page[Order]) -> OrderPageOut:
+        """
+        Retorna uma página de pedidos formatados junto com o cursor da próxima página.
+        """
+        return OrderPageOut(
+            items=OrderPresenter.present_list(page.items),
+            next_cursor=page.next_cursor,
+        )
+
+    @staticmethod
+    def to_dict(order: Order) -> dict:
+        """
+        Mesmo formato do `OrderOut`, montado direto da entidade, sem passar pelo Pydantic.
+        """
+        return {
+            "id": order.id,
+            "client_id": order.client_id,
+            "coupon_hash": order.coupon_hash,
+            "status": order.status,
+            "items": [
+                {
+                    "product_id": item.product_id,
+                    "name": item.name,
+                    "quantity": item.quantity,
+                    "price": float(item.price),
+                }
+                for item in order.items
+            ],
+            "amount": float(order.amount),
+        }
+
+    @staticmethod
+    def present_page_json(page: Page[Order]) -> bytes:
+        """
+        Página de pedidos já serializada no formato do `OrderPageOut`.
+        """
+        return dumps({
+            "items": [OrderPresenter.to_dict(order) for order in page.items],
+            "next_cursor": page.next_cursor,
+        })
+
+    @staticmethod
+    def present_ndjson(order: Order) -> bytes:
+        """
+        Retorna o pedido serializado como uma linha de NDJSON.
+        """
+        return dumps(OrderPresenter.to_dict(order)) + b"\n"
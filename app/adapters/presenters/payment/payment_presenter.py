@@ -1,5 +1,7 @@
-from app.core.entities.payment import Payment
-from app.core.schemas.payment_schemas import PaymentStatusResponse
+from typing import List
+
+from app.core.entities.payment import Payment, PaymentStatusChangeResult
+from app.core.schemas.payment_schemas import PaymentStatusResponse, PaymentWebhookBatchResponse, PaymentWebhookResult
 
 class PaymentPresenter:
     @staticmethod
@@ -9,3 +11,14 @@ class PaymentPresenter:
             payment_status=payment.status,
             qr_code=payment.qr_code,
         )
+
+    @staticmethod
+    def present_batch(results: List[PaymentStatusChangeResult]) -> PaymentWebhookBatchResponse:
+        return PaymentWebhookBatchResponse(results=[
+            PaymentWebhookResult(
+                order_id=result.order_id,
+                result=result.outcome.value,
+                payment_status=result.payment.status.value if result.payment else None,
+            )
+            for result in results
+        ])
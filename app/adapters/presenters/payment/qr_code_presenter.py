@@ -0,0 +1,53 @@
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+
+import orjson
+import segno
+
+from app.shared.ttl_cache import TTLCache
+
+QR_IMAGE_CACHE_TTL_SECONDS = float(os.getenv("QR_IMAGE_CACHE_TTL_SECONDS", "3600"))
+QR_IMAGE_CACHE_MAX_ENTRIES = int(os.getenv("QR_IMAGE_CACHE_MAX_ENTRIES", "1024"))
+
+QR_MEDIA_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "matrix": "application/json",
+}
+QR_BORDER = 4
+
+# Imagens já renderizadas por (pedido, formato, escala): o conteúdo do QR de um pagamento não muda
+qr_image_cache = TTLCache(maxsize=QR_IMAGE_CACHE_MAX_ENTRIES, ttl=QR_IMAGE_CACHE_TTL_SECONDS)
+
+
+@dataclass(slots=True)
+class RenderedQrCode:
+    body: bytes
+    media_type: str
+    etag: str
+
+
+class QrCodePresenter:
+    @staticmethod
+    def render(payload: str, fmt: str, scale: int) -> RenderedQrCode:
+        """
+        Renderiza o QR Code do payload em PNG, SVG ou matriz de módulos (JSON com
+        uma linha de "0"/"1" por fileira, para quem desenha o QR no próprio quiosque).
+        """
+        qr = segno.make(payload, error="m", micro=False)
+        if fmt == "matrix":
+            body = orjson.dumps({
+                "version": qr.version,
+                "size": len(qr.matrix),
+                "rows": ["".join("1" if module else "0" for module in row) for row in qr.matrix],
+            })
+        else:
+            buffer = io.BytesIO()
+            options = {"xmldecl": False} if fmt == "svg" else {}
+            qr.save(buffer, kind=fmt, scale=scale, border=QR_BORDER, **options)
+            body = buffer.getvalue()
+        # ETag forte: a mesma entrada sempre gera os mesmos bytes
+        digest = hashlib.sha1(f"{payload}:{fmt}:{scale}".encode()).hexdigest()[:20]
+        return RenderedQrCode(body=body, media_type=QR_MEDIA_TYPES[fmt], etag=f'"{digest}"')
@@ -1,6 +1,9 @@
-from typing import List
-from app.core.entities.product import Product
-from app.core.schemas.product_schemas import ProductOut
+from typing import Dict, List
+from app.adapters.presenters.json_response import dumps
+from app.core.entities.product import Product, ProductCatalogDiff
+from app.core.schemas.product_schemas import ProductOut, ProductCatalogDiffOut, ProductCatalogChangeOut
+from app.shared.enums.catalog_change import CatalogChange
+from app.shared.enums.categorys import CategoryEnum
 
 class ProductPresenter:
     @staticmethod
@@ -19,3 +22,48 @@ class ProductPresenter:
     def present_list(products: List[Product]) -> List[ProductOut]:
         """Formata uma lista de produtos"""
         return [ProductPresenter.present(product) for product in products]
+
+    @staticmethod
+    def present_menu(menu: Dict[CategoryEnum, List[Product]]) -> Dict[CategoryEnum, List[ProductOut]]:
+        """Formata o cardápio agrupado por categoria"""
+        return {category: ProductPresenter.present_list(products) for category, products in menu.items()}
+
+    @staticmethod
+    def present_catalog_diff(diff: ProductCatalogDiff) -> ProductCatalogDiffOut:
+        """Totais da carga do catálogo e a lista dos produtos alterados"""
+        return ProductCatalogDiffOut(
+            received=diff.received,
+            created=diff.count(CatalogChange.CREATED),
+            updated=diff.count(CatalogChange.UPDATED),
+            unchanged=diff.unchanged,
+            deactivated=diff.count(CatalogChange.DEACTIVATED),
+            changes=[
+                ProductCatalogChangeOut(id=item.id, name=item.name, change=item.change)
+                for item in diff.changes
+            ],
+        )
+
+    @staticmethod
+    def to_dict(product: Product) -> dict:
+        """Mesmo formato do `ProductOut`, sem passar pelo Pydantic"""
+        return {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": float(product.price),
+            "category": product.category,
+            "quantity_available": product.quantity_available,
+        }
+
+    @staticmethod
+    def present_list_json(products: List[Product]) -> bytes:
+        """Lista de produtos já serializada"""
+        return dumps([ProductPresenter.to_dict(product) for product in products])
+
+    @staticmethod
+    def present_menu_json(menu: Dict[CategoryEnum, List[Product]]) -> bytes:
+        """Cardápio já serializado, com o valor da categoria como chave"""
+        return dumps({
+            category.value: [ProductPresenter.to_dict(product) for product in products]
+            for category, products in menu.items()
+        })
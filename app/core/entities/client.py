@@ -1,12 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass
 from datetime import datetime
 from typing import Optional
 
 from app.shared.enums.user_type import UserType
-from app.shared.validates.cpf_validate import is_cpf_valid
+from app.shared.validates.cpf_validate import is_cpf_valid, only_digits
 
 
-@dataclass
+@dataclass(slots=True)
 class Client:
     id: Optional[int]
     name: str
@@ -17,10 +17,14 @@ class Client:
     updated_at: Optional[datetime] = None
     user_type: UserType = UserType.CLIENT
     active: bool = True
+    # False para linhas lidas do banco: o CPF foi normalizado e validado ao ser gravado
+    check_cpf: InitVar[bool] = True
 
-    def __post_init__(self):
+    def __post_init__(self, check_cpf: bool):
+        if not check_cpf:
+            return
         # Normaliza o CPF removendo caracteres não numéricos
-        clean_cpf = "".join(c for c in self.cpf if c.isdigit())
+        clean_cpf = only_digits(self.cpf)
         # Valida o CPF; se inválido, lança uma exceção
         if not is_cpf_valid(clean_cpf):
             raise ValueError("CPF inválido.")
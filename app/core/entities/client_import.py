@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ClientImportRow:
+    """Linha do arquivo de importação já normalizada; `error` preenchido quando ela é rejeitada."""
+    line: int
+    cpf: str
+    name: str
+    email: str
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ClientImportSummary:
+    received: int = 0
+    imported: int = 0
+    rejected: int = 0
@@ -2,7 +2,7 @@ from datetime import date
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Coupon:
     hash: Optional[str]
     descricao: Optional[str]
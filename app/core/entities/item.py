@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     id: Optional[int] = None
     product_id: int = 0
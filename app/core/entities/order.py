@@ -5,7 +5,7 @@ from app.core.entities.item import OrderItem
 from app.shared.enums.order_status import OrderStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: Optional[int] = None
     client_id: Optional[int] = None
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """Uma página de resultados de uma listagem paginada por cursor (keyset)."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
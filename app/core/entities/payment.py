@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
+from app.shared.enums.payment_change_outcome import PaymentChangeOutcome
 from app.shared.enums.payment_status import PaymentStatus
 
 @dataclass
@@ -12,3 +13,20 @@ class Payment:
     payment_date: Optional[datetime] = None
     description: Optional[str] = None
     amount: float = 0.0
+
+
+@dataclass(slots=True)
+class PaymentStatusChange:
+    """Mudança de status de pagamento recebida pelo webhook."""
+    order_id: int
+    status: PaymentStatus
+    description: Optional[str] = None
+    payment_date: Optional[datetime] = None
+    idempotency_key: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PaymentStatusChangeResult:
+    order_id: int
+    outcome: PaymentChangeOutcome
+    payment: Optional[Payment] = None
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 
+from app.shared.enums.catalog_change import CatalogChange
 from app.shared.enums.categorys import CategoryEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     name: str
     description: str
@@ -12,3 +13,24 @@ class Product:
     category: CategoryEnum
     quantity_available: int = 0
     id: Optional[int] = field(default=1)
+
+
+@dataclass(slots=True)
+class ProductCatalogChange:
+    id: int
+    name: str
+    change: CatalogChange
+
+
+@dataclass(slots=True)
+class ProductCatalogDiff:
+    """Resumo de uma carga do catálogo: só os produtos alterados aparecem em `changes`."""
+    received: int
+    changes: List[ProductCatalogChange] = field(default_factory=list)
+
+    def count(self, change: CatalogChange) -> int:
+        return sum(1 for item in self.changes if item.change == change)
+
+    @property
+    def unchanged(self) -> int:
+        return self.received - self.count(CatalogChange.CREATED) - self.count(CatalogChange.UPDATED)
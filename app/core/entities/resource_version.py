@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """Versão de um recurso para requisições condicionais: última alteração e quantidade de registros."""
+    updated_at: Optional[datetime] = None
+    count: int = 0
+    # Catálogo: produtos ativos com estoque (as vendas não alteram `updated_at`)
+    available: Optional[int] = None
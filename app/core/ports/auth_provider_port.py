@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class AuthProviderUnavailableError(Exception):
+    """
+    O provedor de autenticação não respondeu como esperado (erro de rede, 5xx) ou
+    está sendo evitado pelo disjuntor; neste caso `retry_after` traz os segundos até
+    a próxima tentativa.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AuthProviderPort(ABC):
+    """Define a interface (porta) para o provedor externo que emite tokens de clientes."""
+
+    @abstractmethod
+    async def fetch_token(self, cpf: str) -> str:
+        """
+        Retorna o token do cliente com o CPF (já normalizado).
+        Lança ValueError se o provedor recusar o CPF e `AuthProviderUnavailableError`
+        se o provedor estiver indisponível.
+        """
+        pass
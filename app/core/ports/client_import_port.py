@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, TextIO
+
+from app.core.entities.client_import import ClientImportRow, ClientImportSummary
+
+
+class ClientImportPort(ABC):
+    """Define a interface (porta) para a carga em massa de clientes."""
+
+    @abstractmethod
+    def import_rows(self, chunks: Iterable[List[ClientImportRow]], report: TextIO) -> ClientImportSummary:
+        """
+        Recebe as linhas em lotes (as já rejeitadas vêm com `error`), cadastra as
+        válidas em uma única transação e escreve em `report` um CSV
+        (line, cpf, email, error) com cada linha rejeitada e o motivo.
+        """
+        pass
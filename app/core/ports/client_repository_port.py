@@ -21,6 +21,11 @@ class ClientRepositoryPort(ABC):
     def find_by_cpf(self, cpf: str) -> Optional[Client]:
         """Retorna um Client (ou None se não encontrado) pelo CPF."""
         pass
+
+    @abstractmethod
+    def get_or_create_id(self, client: Client) -> int:
+        """Retorna o id do Client com o CPF informado, cadastrando-o se não existir (idempotente)."""
+        pass
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Client]:
         """Retorna um Client (ou None se não encontrado) pelo Email."""
@@ -47,3 +52,28 @@ class ClientRepositoryPort(ABC):
          Retorna todos os cupons ativos e não expirados vinculados a um cliente.
          """
         pass
+
+
+class AsyncClientRepositoryPort(ABC):
+
+    """Versão assíncrona da porta de Client, usada pela pilha assíncrona (DB_ASYNC)."""
+
+    @abstractmethod
+    async def create(self, client: Client) -> Client:
+        pass
+
+    @abstractmethod
+    async def find_by_cpf(self, cpf: str) -> Optional[Client]:
+        pass
+
+    @abstractmethod
+    async def get_or_create_id(self, client: Client) -> int:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Client]:
+        pass
+
+    @abstractmethod
+    async def update(self, client: Client) -> Client:
+        pass
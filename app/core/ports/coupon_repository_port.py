@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from app.core.entities.coupon import Coupon
+from app.core.entities.resource_version import ResourceVersion
 
 
 class CouponRepositoryPort(ABC):
@@ -31,3 +32,17 @@ class CouponRepositoryPort(ABC):
     def delete(self, coupon_id: int) -> None:
         """Remove o Coupon pelo ID (exclusão física)."""
         pass
+
+    @abstractmethod
+    def find_version(self) -> ResourceVersion:
+        """Versão da lista de Coupons (última alteração e quantidade), sem carregá-los."""
+        pass
+
+
+class AsyncCouponRepositoryPort(ABC):
+
+    """Versão assíncrona da porta de Coupon, usada pela pilha assíncrona (DB_ASYNC)."""
+
+    @abstractmethod
+    async def find_by_hash(self, coupon_hash: str) -> Optional[Coupon]:
+        pass
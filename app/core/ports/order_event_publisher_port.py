@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.core.entities.order import Order
+from app.shared.enums.order_event_type import OrderEventType
+
+
+class OrderEventPublisherPort(ABC):
+    """Define a interface (porta) para publicação de eventos do painel de pedidos."""
+
+    @abstractmethod
+    def publish(self, event_type: OrderEventType, order: Order) -> int:
+        """Publica um evento do pedido e retorna a versão atribuída a ele."""
+        pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from app.core.entities.order import Order
+from app.core.entities.page import Page
+from app.core.entities.resource_version import ResourceVersion
 
 
 class OrderRepositoryPort(ABC):
@@ -22,6 +24,51 @@ class OrderRepositoryPort(ABC):
         """Lista todos os orders."""
         pass
 
+    @abstractmethod
+    def find_by_status(self, status: str) -> List[Order]:
+        """Lista os orders ativos com o status informado."""
+        pass
+
+    @abstractmethod
+    def find_by_client(self, client_id: int) -> List[Order]:
+        """Lista os orders ativos de um cliente."""
+        pass
+
+    @abstractmethod
+    def find_active_sorted_orders(self) -> List[Order]:
+        """Lista os orders não finalizados, ordenados por prioridade do status e id."""
+        pass
+
+    @abstractmethod
+    def find_by_status_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        """Página de orders com o status informado, ordenada por id."""
+        pass
+
+    @abstractmethod
+    def find_by_client_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        """Página de orders de um cliente, ordenada por id."""
+        pass
+
+    @abstractmethod
+    def find_active_sorted_orders_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        """Página de orders não finalizados, ordenada por prioridade do status e id."""
+        pass
+
+    @abstractmethod
+    def stream_by_status(self, status: str, batch_size: int = 500) -> Iterator[Order]:
+        """Itera, em lotes, os orders com o status informado."""
+        pass
+
+    @abstractmethod
+    def stream_by_client(self, client_id: int, batch_size: int = 500) -> Iterator[Order]:
+        """Itera, em lotes, os orders de um cliente."""
+        pass
+
+    @abstractmethod
+    def stream_active_sorted_orders(self, batch_size: int = 500) -> Iterator[Order]:
+        """Itera, em lotes, os orders não finalizados na ordem do painel."""
+        pass
+
     @abstractmethod
     def update(self, order: Order) -> Order:
         """Atualiza um order existente."""
@@ -30,4 +77,46 @@ class OrderRepositoryPort(ABC):
     @abstractmethod
     def delete(self, order_id: int) -> None:
         """Remove o order pelo ID."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_version(self, order_id: int) -> Optional[ResourceVersion]:
+        """Versão de um order (última alteração), sem carregar os itens; None se não encontrado."""
+        pass
+
+
+class AsyncOrderRepositoryPort(ABC):
+
+    """Versão assíncrona da porta de Order, usada pela pilha assíncrona (DB_ASYNC)."""
+
+    @abstractmethod
+    async def create(self, order: Order) -> Order:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, order_id: int) -> Optional[Order]:
+        pass
+
+    @abstractmethod
+    async def find_active_sorted_orders(self) -> List[Order]:
+        pass
+
+    @abstractmethod
+    async def find_by_status_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        pass
+
+    @abstractmethod
+    async def find_by_client_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        pass
+
+    @abstractmethod
+    async def find_active_sorted_orders_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        pass
+
+    @abstractmethod
+    async def update(self, order: Order) -> Order:
+        pass
+
+    @abstractmethod
+    async def find_version(self, order_id: int) -> Optional[ResourceVersion]:
+        pass
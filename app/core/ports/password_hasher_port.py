@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class PasswordHasherPort(ABC):
+    """Define a interface (porta) para gerar e verificar hashes de senha."""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Retorna o hash da senha."""
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Verifica a senha contra o hash armazenado. Retorna (válida, novo_hash);
+        `novo_hash` vem preenchido quando o armazenado deve ser substituído
+        (ex.: custo diferente do configurado). Sem `hashed`, a senha é inválida,
+        mas a verificação custa o mesmo que com um hash.
+        """
+        pass
+
+    @abstractmethod
+    async def hash_async(self, password: str) -> str:
+        """Versão de `hash` para rotas assíncronas: aguarda o hash sem ocupar uma thread."""
+        pass
+
+    @abstractmethod
+    async def verify_async(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Versão de `verify` para rotas assíncronas."""
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
-from app.core.entities.payment import Payment
+from typing import List, Optional
+from app.core.entities.payment import Payment, PaymentStatusChange, PaymentStatusChangeResult
 
 class PaymentRepositoryPort(ABC):
     @abstractmethod
@@ -17,3 +17,25 @@ class PaymentRepositoryPort(ABC):
     def update(self, payment: Payment) -> Payment:
         """Atualiza um pagamento existente e retorna a entidade atualizada."""
         pass
+
+    @abstractmethod
+    def apply_status_changes(self, changes: List[PaymentStatusChange]) -> List[PaymentStatusChangeResult]:
+        """
+        Aplica as mudanças de status (uma por pedido) de uma só vez e retorna o resultado
+        de cada uma, na ordem recebida. Mudanças cuja chave de idempotência já foi
+        aplicada não alteram nada e retornam o pagamento como está.
+        """
+        pass
+
+
+class AsyncPaymentRepositoryPort(ABC):
+
+    """Versão assíncrona da porta de Payment, usada pela pilha assíncrona (DB_ASYNC)."""
+
+    @abstractmethod
+    async def create(self, payment: Payment) -> Payment:
+        pass
+
+    @abstractmethod
+    async def get_by_order_id(self, order_id: int) -> Optional[Payment]:
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class PaymentStatusNotifierPort(ABC):
+    """Define a interface (porta) para avisar quem aguarda mudanças no pagamento de um pedido."""
+
+    @abstractmethod
+    def publish(self, order_ids: Iterable[int]) -> None:
+        """Avisa que o pagamento dos pedidos mudou (chamado depois de confirmada a transação)."""
+        pass
+
+    @abstractmethod
+    def subscribe(self, order_id: int) -> Any:
+        """
+        Registra interesse no pedido no event loop corrente. A assinatura retornada
+        tem `async wait(timeout) -> bool`, verdadeiro se houve aviso dentro do prazo.
+        """
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Any) -> None:
+        pass
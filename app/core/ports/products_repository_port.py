@@ -1,8 +1,10 @@
 # app/core/ports/product_repository_port.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from app.core.entities.product import Product
+from app.core.entities.product import Product, ProductCatalogChange
+from app.core.entities.resource_version import ResourceVersion
+from app.shared.enums.categorys import CategoryEnum
 
 
 class ProductRepositoryPort(ABC):
@@ -18,11 +20,21 @@ class ProductRepositoryPort(ABC):
         """Retorna um Product (ou None se não encontrado)."""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, product_ids: List[int]) -> List[Product]:
+        """Retorna os Products encontrados entre os IDs informados (os ausentes são ignorados)."""
+        pass
+
     @abstractmethod
     def find_by_category(self, category: str) -> List[Product]:
         """Retorna um Product (ou None se não encontrado)."""
         pass
 
+    @abstractmethod
+    def find_menu(self) -> Dict[CategoryEnum, List[Product]]:
+        """Todos os produtos ativos agrupados por categoria, em uma única consulta."""
+        pass
+
     @abstractmethod
     def find_all(self) -> List[Product]:
         """Lista todos os products."""
@@ -33,7 +45,84 @@ class ProductRepositoryPort(ABC):
         """Atualiza um product existente."""
         pass
 
+    @abstractmethod
+    def reserve_stock(self, quantities: Dict[int, int]) -> List[int]:
+        """
+        Baixa atomicamente o estoque de cada produto ({product_id: quantidade}),
+        somente onde há quantidade suficiente, sem confirmar a transação.
+        Retorna os IDs que não puderam ser reservados; se houver algum, a
+        transação corrente deve ser descartada.
+        """
+        pass
+
     @abstractmethod
     def delete(self, product_id: int) -> None:
         """Remove o product pelo ID."""
         pass
+
+    @abstractmethod
+    def upsert_catalog(self, products: List[Product], deactivate_missing: bool) -> List[ProductCatalogChange]:
+        """
+        Grava o catálogo em uma única transação: cria os produtos de nome novo,
+        atualiza (e reativa) os existentes e, com `deactivate_missing`, desativa os
+        produtos ativos fora da lista. Os nomes não se repetem. Retorna apenas os
+        produtos efetivamente alterados.
+        """
+        pass
+
+    @abstractmethod
+    def find_catalog_version(self, category: Optional[str] = None) -> ResourceVersion:
+        """
+        Versão do catálogo (ou de uma categoria) sem carregar os produtos:
+        última alteração e quantidade de produtos ativos.
+        """
+        pass
+
+
+class AsyncProductRepositoryPort(ABC):
+
+    """Versão assíncrona da porta de Product, usada pela pilha assíncrona (DB_ASYNC)."""
+
+    @abstractmethod
+    async def create(self, product: Product) -> Product:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        pass
+
+    @abstractmethod
+    async def find_by_ids(self, product_ids: List[int]) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def find_by_category(self, category: str) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def find_menu(self) -> Dict[CategoryEnum, List[Product]]:
+        pass
+
+    @abstractmethod
+    async def find_all(self) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def update(self, product: Product) -> Product:
+        pass
+
+    @abstractmethod
+    async def reserve_stock(self, quantities: Dict[int, int]) -> List[int]:
+        pass
+
+    @abstractmethod
+    async def delete(self, product_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def upsert_catalog(self, products: List[Product], deactivate_missing: bool) -> List[ProductCatalogChange]:
+        pass
+
+    @abstractmethod
+    async def find_catalog_version(self, category: Optional[str] = None) -> ResourceVersion:
+        pass
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWorkPort(ABC):
+    """
+    Define a interface (porta) de uma unidade de trabalho: os repositórios que
+    participam dela não confirmam a transação; a unidade confirma tudo de uma
+    vez ao final do bloco `with`, ou desfaz tudo se ocorrer uma exceção.
+    """
+
+    def __enter__(self) -> "UnitOfWorkPort":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Confirma todas as alterações feitas dentro da unidade."""
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Descarta todas as alterações feitas dentro da unidade."""
+        pass
+
+
+class AsyncUnitOfWorkPort(ABC):
+    """Versão assíncrona da unidade de trabalho, usada com `async with`."""
+
+    async def __aenter__(self) -> "AsyncUnitOfWorkPort":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
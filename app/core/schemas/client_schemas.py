@@ -15,6 +15,10 @@ class ClientUpdateIn(BaseModel):
     password: Optional[str] = Field(None, description="Senha do cliente")
     active: Optional[bool] = Field(None, description="Status do cliente (ativo ou inativo)")
 
+class ClientLoginIn(BaseModel):
+    cpf: str
+    password: str
+
 class ClientOut(BaseModel):
     id: int
     name: str
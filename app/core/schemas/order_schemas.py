@@ -27,4 +27,8 @@ class OrderOut(BaseModel):
     coupon_hash: Optional[str]
     status: OrderStatus
     items: List[OrderItemOut]
-    amount: float
\ No newline at end of file
+    amount: float
+
+class OrderPageOut(BaseModel):
+    items: List[OrderOut]
+    next_cursor: Optional[str] = None
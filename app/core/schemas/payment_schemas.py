@@ -1,6 +1,6 @@
 from datetime import datetime
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 from app.shared.enums.payment_status import PaymentStatus
 
@@ -22,3 +22,16 @@ class PaymentWebhookRequest(BaseModel):
     order_id: int
     payment_status: PaymentStatus
     description: Optional[str] = None
+    # Identificador da notificação no provedor; entregas repetidas não são reaplicadas
+    idempotency_key: Optional[str] = Field(None, max_length=255)
+
+class PaymentWebhookBatchRequest(BaseModel):
+    notifications: List[PaymentWebhookRequest]
+
+class PaymentWebhookResult(BaseModel):
+    order_id: int
+    result: str
+    payment_status: Optional[str] = None
+
+class PaymentWebhookBatchResponse(BaseModel):
+    results: List[PaymentWebhookResult]
@@ -1,5 +1,8 @@
 # Schemas de entrada/saída para a API
+from typing import List
+
 from pydantic import BaseModel
+from app.shared.enums.catalog_change import CatalogChange
 from app.shared.enums.categorys import CategoryEnum
 
 
@@ -17,3 +20,16 @@ class ProductOut(BaseModel):
     price: float
     category: CategoryEnum
     quantity_available: int
+
+class ProductCatalogChangeOut(BaseModel):
+    id: int
+    name: str
+    change: CatalogChange
+
+class ProductCatalogDiffOut(BaseModel):
+    received: int
+    created: int
+    updated: int
+    unchanged: int
+    deactivated: int
+    changes: List[ProductCatalogChangeOut]
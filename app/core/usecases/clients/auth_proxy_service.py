@@ -1,14 +1,13 @@
-from dotenv import load_dotenv
+import math
 
+from app.core.ports.auth_provider_port import AuthProviderPort, AuthProviderUnavailableError
 from app.shared.validates.cpf_validate import is_cpf_valid
-import os, httpx
 from fastapi import HTTPException, status
 
-load_dotenv()
 
 class AuthProxyService:
-    def __init__(self, auth_endpoint: str = os.getenv("AUTH_ENDPOINT")):
-        self.auth_endpoint = auth_endpoint
+    def __init__(self, auth_provider: AuthProviderPort):
+        self.auth_provider = auth_provider
 
     @staticmethod
     def normalize_and_validate_cpf(cpf: str) -> str:
@@ -24,18 +23,14 @@ class AuthProxyService:
     async def execute(self, cpf: str) -> str:
         clean_cpf = self.normalize_and_validate_cpf(cpf)
 
-        async with httpx.AsyncClient(timeout=5) as client:
-            resp = await client.post(self.auth_endpoint, json={"cpf": clean_cpf})
-
-        if resp.status_code == 200:
-            return resp.json()["token"]
-
-        if resp.status_code == 404:
-            print(resp.text)
-            raise ValueError("CPF não encontrado no Cognito.")
-        if resp.status_code == 400:
-            print(resp.text)
-            raise ValueError("CPF inválido (Lambda).")
-
-        # Qualquer outro erro → 502 Bad Gateway
-        raise HTTPException(status.HTTP_502_BAD_GATEWAY, "Erro no serviço de autenticação")
\ No newline at end of file
+        try:
+            return await self.auth_provider.fetch_token(clean_cpf)
+        except AuthProviderUnavailableError as e:
+            # Disjuntor aberto → 503 com Retry-After; qualquer outro erro → 502 Bad Gateway
+            if e.retry_after is not None:
+                raise HTTPException(
+                    status.HTTP_503_SERVICE_UNAVAILABLE,
+                    str(e),
+                    headers={"Retry-After": str(math.ceil(e.retry_after))},
+                )
+            raise HTTPException(status.HTTP_502_BAD_GATEWAY, "Erro no serviço de autenticação")
@@ -1,13 +1,15 @@
 from pydantic import EmailStr
 
 from app.core.entities.client import Client
-from app.core.ports.client_repository_port import ClientRepositoryPort
+from app.core.ports.client_repository_port import ClientRepositoryPort, AsyncClientRepositoryPort
+from app.core.ports.password_hasher_port import PasswordHasherPort
 from app.core.schemas.client_schemas import ClientIn
 from app.shared.validates.cpf_validate import is_cpf_valid
 
 class CreateClientService:
-    def __init__(self, client_repository: ClientRepositoryPort):
+    def __init__(self, client_repository: ClientRepositoryPort, password_hasher: PasswordHasherPort):
         self.client_repository = client_repository
+        self.password_hasher = password_hasher
 
     # @staticmethod
     # def normalize_and_validate_cpf(cpf: str) -> str:
@@ -35,14 +37,38 @@ class CreateClientService:
         Se ocorrer qualquer problema, lança ValueError com a mensagem adequada.
         """
 
-        client = Client(
+        client = self._build_client(client_data)
+
+        self.validate_unique_fields(client.cpf, client_data.email)
+        # Só gera o hash (caro) depois das validações
+        client.password = self.password_hasher.hash(client_data.password)
+        return self.client_repository.create(client)
+
+    def _build_client(self, client_data: ClientIn) -> Client:
+        return Client(
             id=None,
             name=client_data.name,
             email=client_data.email,
             cpf=client_data.cpf,  # CPF sem formatação
-            password=client_data.password,
             active=True
         )
 
-        self.validate_unique_fields(client.cpf, client_data.email)
-        return self.client_repository.create(client)
+
+class AsyncCreateClientService(CreateClientService):
+    """Mesmo fluxo, para rotas assíncronas: o hash é aguardado sem prender uma thread."""
+
+    def __init__(self, client_repository: AsyncClientRepositoryPort, password_hasher: PasswordHasherPort):
+        super().__init__(client_repository, password_hasher)
+
+    async def validate_unique_fields(self, cpf: str, email: EmailStr):
+        if await self.client_repository.find_by_cpf(cpf):
+            raise ValueError("CPF já cadastrado no sistema.")
+
+        if await self.client_repository.find_by_email(email):
+            raise ValueError("Email já cadastrado no sistema.")
+
+    async def execute(self, client_data: ClientIn) -> Client:
+        client = self._build_client(client_data)
+        await self.validate_unique_fields(client.cpf, client_data.email)
+        client.password = await self.password_hasher.hash_async(client_data.password)
+        return await self.client_repository.create(client)
@@ -1,3 +1,4 @@
+from app.core.entities.client import Client
 from app.core.ports.client_repository_port import ClientRepositoryPort
 from app.shared.handles.jwt_user import create_access_token
 from app.shared.validates.cpf_validate import is_cpf_valid
@@ -38,6 +39,11 @@ class IdentifyClientService:
             raise ValueError("CPF inativado no sistema.")
 
         # 3) Gerar JWT para o cliente e retornar
+        return self.issue_token(client)
+
+    @staticmethod
+    def issue_token(client: Client) -> str:
+        """Gera o JWT do cliente identificado."""
         return create_access_token({
             "id": client.id,
             "cpf": client.cpf,
@@ -0,0 +1,62 @@
+import csv
+import re
+from typing import Iterator, List, TextIO
+
+from app.core.entities.client_import import ClientImportRow, ClientImportSummary
+from app.core.ports.client_import_port import ClientImportPort
+from app.shared.validates.cpf_batch_validate import validate_cpfs
+from app.shared.validates.cpf_validate import only_digits
+
+IMPORT_CHUNK_SIZE = 10_000
+REQUIRED_COLUMNS = ("cpf", "name", "email")
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+class ImportClientsService:
+    def __init__(self, importer: ClientImportPort, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.importer = importer
+        self.chunk_size = chunk_size
+
+    def execute(self, csv_file: TextIO, report: TextIO) -> ClientImportSummary:
+        """
+        Importa clientes de um CSV com as colunas cpf, name e email (outras são ignoradas).
+        O arquivo é lido e validado em lotes de `chunk_size` linhas; as rejeitadas
+        (CPF inválido, dados faltando, duplicadas ou já cadastradas) vão para `report`.
+        Clientes importados não têm senha: entram pelo CPF.
+        """
+        reader = csv.DictReader(csv_file)
+        if reader.fieldnames is None:
+            raise ValueError("Arquivo vazio.")
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        missing = [column for column in REQUIRED_COLUMNS if column not in reader.fieldnames]
+        if missing:
+            raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(missing)}.")
+
+        return self.importer.import_rows(self._chunks(reader), report)
+
+    def _chunks(self, reader: csv.DictReader) -> Iterator[List[ClientImportRow]]:
+        chunk = []
+        for record in reader:
+            chunk.append(ClientImportRow(
+                line=reader.line_num,
+                cpf=only_digits((record.get("cpf") or "").strip()),
+                name=(record.get("name") or "").strip(),
+                email=(record.get("email") or "").strip().lower(),
+            ))
+            if len(chunk) >= self.chunk_size:
+                yield self._validate(chunk)
+                chunk = []
+        if chunk:
+            yield self._validate(chunk)
+
+    @staticmethod
+    def _validate(rows: List[ClientImportRow]) -> List[ClientImportRow]:
+        valid_cpfs = validate_cpfs([row.cpf for row in rows]).tolist()
+        for row, cpf_ok in zip(rows, valid_cpfs):
+            if not cpf_ok:
+                row.error = "CPF inválido."
+            elif not row.name:
+                row.error = "Nome obrigatório."
+            elif not EMAIL_PATTERN.fullmatch(row.email):
+                row.error = "E-mail inválido."
+        return rows
@@ -0,0 +1,57 @@
+from app.core.ports.client_repository_port import ClientRepositoryPort, AsyncClientRepositoryPort
+from app.core.ports.password_hasher_port import PasswordHasherPort
+from app.core.usecases.clients.identify_client_service import IdentifyClientService
+
+
+class LoginClientService:
+    def __init__(self, client_repository: ClientRepositoryPort, password_hasher: PasswordHasherPort):
+        self.client_repository = client_repository
+        self.password_hasher = password_hasher
+
+    def execute(self, cpf: str, password: str) -> str:
+        """
+        Autentica o cliente por CPF e senha e retorna um JWT.
+        Se o hash armazenado usa outro custo (ou a senha ainda estava em texto puro),
+        grava o hash novo, de forma transparente para o cliente.
+        """
+        clean_cpf = IdentifyClientService.normalize_and_validate_cpf(cpf)
+
+        client = self.client_repository.find_by_cpf(clean_cpf)
+        # CPF desconhecido também passa pela verificação (contra nenhum hash): mesma
+        # mensagem e mesmo tempo de resposta, sem revelar quais CPFs existem
+        valid, new_hash = self.password_hasher.verify(password, client.password if client else None)
+        if not valid:
+            raise ValueError("CPF ou senha inválidos.")
+
+        if not client.active:
+            raise ValueError("CPF inativado no sistema.")
+
+        if new_hash:
+            client.password = new_hash
+            client = self.client_repository.update(client)
+
+        return IdentifyClientService.issue_token(client)
+
+
+class AsyncLoginClientService(LoginClientService):
+    """Mesmo fluxo, para rotas assíncronas: a verificação é aguardada sem prender uma thread."""
+
+    def __init__(self, client_repository: AsyncClientRepositoryPort, password_hasher: PasswordHasherPort):
+        super().__init__(client_repository, password_hasher)
+
+    async def execute(self, cpf: str, password: str) -> str:
+        clean_cpf = IdentifyClientService.normalize_and_validate_cpf(cpf)
+
+        client = await self.client_repository.find_by_cpf(clean_cpf)
+        valid, new_hash = await self.password_hasher.verify_async(password, client.password if client else None)
+        if not valid:
+            raise ValueError("CPF ou senha inválidos.")
+
+        if not client.active:
+            raise ValueError("CPF inativado no sistema.")
+
+        if new_hash:
+            client.password = new_hash
+            client = await self.client_repository.update(client)
+
+        return IdentifyClientService.issue_token(client)
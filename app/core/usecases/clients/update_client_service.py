@@ -1,11 +1,13 @@
 from app.core.entities.client import Client
-from app.core.ports.client_repository_port import ClientRepositoryPort
+from app.core.ports.client_repository_port import ClientRepositoryPort, AsyncClientRepositoryPort
+from app.core.ports.password_hasher_port import PasswordHasherPort
 from app.core.schemas.client_schemas import ClientUpdateIn
 from app.shared.validates.cpf_validate import is_cpf_valid
 
 class UpdateClientService:
-    def __init__(self, client_repository: ClientRepositoryPort):
+    def __init__(self, client_repository: ClientRepositoryPort, password_hasher: PasswordHasherPort):
         self.client_repository = client_repository
+        self.password_hasher = password_hasher
         self.allowed_updates = {"cpf", "name", "email", "active", "password"}
 
     def normalize_and_validate_cpf(self, cpf: str) -> str:
@@ -25,6 +27,14 @@ class UpdateClientService:
         if invalid_keys:
             raise ValueError(f"Campos inválidos no payload: {', '.join(invalid_keys)}")
 
+    def _updates_dict(self, updates: dict | ClientUpdateIn) -> dict:
+        if isinstance(updates, dict):
+            updates = ClientUpdateIn(**updates)
+
+        updates_dict = updates.dict(exclude_unset=True)
+        self.validate_updates(updates_dict)
+        return updates_dict
+
     def update_field(self, client: Client, field: str, value):
         """
         Atualiza um campo do cliente, aplicando validações específicas para CPF e e-mail.
@@ -42,6 +52,9 @@ class UpdateClientService:
                 raise ValueError("Email já cadastrado no sistema.")
             client.email = value
 
+        elif field == "password":
+            client.password = self.password_hasher.hash(value)
+
         else:
             setattr(client, field, value)
 
@@ -53,12 +66,7 @@ class UpdateClientService:
         :return: Cliente atualizado.
         """
 
-        if isinstance(updates, dict):
-            updates = ClientUpdateIn(**updates)
-
-        updates_dict = updates.dict(exclude_unset=True)
-        self.validate_updates(updates_dict)
-
+        updates_dict = self._updates_dict(updates)
 
         clean_cpf = self.normalize_and_validate_cpf(cpf)
         existing_client = self.client_repository.find_by_cpf(clean_cpf)
@@ -71,3 +79,43 @@ class UpdateClientService:
 
         # 3) Salvar alterações no repositório
         return self.client_repository.update(existing_client)
+
+
+class AsyncUpdateClientService(UpdateClientService):
+    """Mesmo fluxo, para rotas assíncronas: o hash da nova senha é aguardado sem prender uma thread."""
+
+    def __init__(self, client_repository: AsyncClientRepositoryPort, password_hasher: PasswordHasherPort):
+        super().__init__(client_repository, password_hasher)
+
+    async def update_field(self, client: Client, field: str, value):
+        if field == "cpf":
+            new_cpf = self.normalize_and_validate_cpf(value)
+            existing_cpf = await self.client_repository.find_by_cpf(new_cpf)
+            if existing_cpf and new_cpf != client.cpf:
+                raise ValueError("CPF já cadastrado no sistema.")
+            client.cpf = new_cpf
+
+        elif field == "email":
+            existing_email = await self.client_repository.find_by_email(value)
+            if existing_email and value != client.email:
+                raise ValueError("Email já cadastrado no sistema.")
+            client.email = value
+
+        elif field == "password":
+            client.password = await self.password_hasher.hash_async(value)
+
+        else:
+            setattr(client, field, value)
+
+    async def execute(self, cpf: str, updates: dict | ClientUpdateIn) -> Client:
+        updates_dict = self._updates_dict(updates)
+
+        clean_cpf = self.normalize_and_validate_cpf(cpf)
+        existing_client = await self.client_repository.find_by_cpf(clean_cpf)
+        if not existing_client:
+            raise ValueError("Cliente não encontrado.")
+
+        for field, value in updates_dict.items():
+            await self.update_field(existing_client, field, value)
+
+        return await self.client_repository.update(existing_client)
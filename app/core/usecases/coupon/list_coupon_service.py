@@ -1,6 +1,7 @@
 from datetime import date
 from typing import List
 from app.core.entities.coupon import Coupon
+from app.core.entities.resource_version import ResourceVersion
 from app.core.ports.coupon_repository_port import CouponRepositoryPort
 
 class ListCouponService:
@@ -17,6 +18,10 @@ class ListCouponService:
             if coupon.active and coupon.expires_at >= today
         ]
 
+    def version(self) -> ResourceVersion:
+        """Versão da lista de cupons; a validade também depende da data de hoje."""
+        return self.coupon_repository.find_version()
+
     def execute_all(self) -> List[Coupon]:
         """
         Retorna todos os cupons, sem filtro de validade.
@@ -1,9 +1,13 @@
+from collections import defaultdict
 from datetime import date
+from typing import Dict, List
+
 from app.core.entities.order import Order
 from app.core.entities.item import OrderItem
-from app.core.ports.coupon_repository_port import CouponRepositoryPort
-from app.core.ports.order_repository_port import OrderRepositoryPort
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.core.entities.product import Product
+from app.core.ports.coupon_repository_port import CouponRepositoryPort, AsyncCouponRepositoryPort
+from app.core.ports.order_repository_port import OrderRepositoryPort, AsyncOrderRepositoryPort
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 from app.core.schemas.order_schemas import OrderIn
 from app.shared.enums.order_status import OrderStatus
 
@@ -20,9 +24,16 @@ class CreateOrderService:
 
     def execute(self, order_in: OrderIn, client_id: int) -> Order:
         """Cria um pedido a partir dos dados do `OrderIn`."""
+        order = self._build_order(order_in, client_id)
+
+        # Validações, cálculos e criação do pedido no repositório
+        created_order = self._process_order(order)
+        return  created_order
+
+    def _build_order(self, order_in: OrderIn, client_id: int) -> Order:
         if not order_in.items or len(order_in.items) == 0:
             raise ValueError("O pedido deve conter pelo menos um item.")
-        order = Order(
+        return Order(
             client_id=client_id,
             coupon_hash=order_in.coupon_hash,
             status=OrderStatus.RECEIVED,
@@ -35,35 +46,36 @@ class CreateOrderService:
             ],
         )
 
-        # Validações, cálculos e criação do pedido no repositório
-        created_order = self._process_order(order)
-        return  created_order
-
     def _process_order(self, order: Order) -> Order:
         """Processa todas as validações, cálculos e a criação do pedido."""
         existing_coupon = None
         if order.coupon_hash:
             existing_coupon = self._validate_coupon(order)
-        self._calculate_amount(order)
 
-        # Em seguida, valida o estoque e atualiza a quantidade disponível
-        self._validate_stock(order)
+        # Busca todos os produtos do pedido de uma vez; reaproveitados em todas as etapas
+        products = self._load_products(order)
+        self._calculate_amount(order, products)
+
+        # Em seguida, reserva o estoque (confirmado junto com a criação do pedido)
+        self._reserve_stock(order, products)
 
         # Aplica desconto, se houver cupom válido
         self._apply_discount(order, existing_coupon)
 
         created_order = self.order_repository.create(order)
-
-        # Atualiza os nomes dos itens no pedido retornado
-        for item in created_order.items:
-            product = self.product_repository.find_by_id(item.product_id)
-            item.name = product.name
-
+        self._name_items(created_order, products)
         return created_order
 
+    def _name_items(self, order: Order, products: Dict[int, Product]):
+        """Atualiza os nomes dos itens no pedido retornado."""
+        for item in order.items:
+            item.name = products[item.product_id].name
+
     def _validate_coupon(self, order: Order):
         """Valida se o cupom é válido."""
-        coupon = self.coupon_repository.find_by_hash(order.coupon_hash)
+        return self._check_coupon(order, self.coupon_repository.find_by_hash(order.coupon_hash))
+
+    def _check_coupon(self, order: Order, coupon):
         if order.client_id is None:
             raise ValueError(f"Para utilizar um cupom, é necessário que o cliente esteja autenticado"
                              f" e devidamente identificado.")
@@ -75,33 +87,60 @@ class CreateOrderService:
             raise ValueError("O cupom informado já expirou.")
         return coupon
 
-    def _calculate_amount(self, order: Order):
+    def _load_products(self, order: Order) -> Dict[int, Product]:
+        """Carrega, em uma única consulta, os produtos de todos os itens do pedido."""
+        return self._index_products(
+            order, self.product_repository.find_by_ids([item.product_id for item in order.items])
+        )
+
+    def _index_products(self, order: Order, found: List[Product]) -> Dict[int, Product]:
+        products = {product.id: product for product in found}
+        for item in order.items:
+            if item.product_id not in products:
+                raise ValueError(f"Produto com ID {item.product_id} não encontrado.")
+        return products
+
+    def _calculate_amount(self, order: Order, products: Dict[int, Product]):
         """Calcula o valor total do pedido e atualiza os preços dos itens."""
         total = 0
         for item in order.items:
             if item.quantity <= 0:
                 raise ValueError("A quantidade do item deve ser maior que zero.")
-            product = self.product_repository.find_by_id(item.product_id)
-            if not product:
-                raise ValueError(f"Produto com ID {item.product_id} não encontrado.")
+            product = products[item.product_id]
             # Calcula o preço do item e atualiza o nome
             item.price = product.price * item.quantity
             item.name = product.name
             total += item.price
         order.amount = total
 
-    def _validate_stock(self, order: Order):
-        """Verifica se há estoque suficiente para cada item e atualiza o estoque."""
+    def _reserve_stock(self, order: Order, products: Dict[int, Product]):
+        """
+        Verifica se há estoque suficiente para os itens e o reserva em uma única
+        operação atômica no repositório. Se algum produto não puder ser reservado,
+        o pedido é rejeitado e a transação não deve ser confirmada.
+        """
+        quantities = self._requested_quantities(order, products)
+        rejected = self.product_repository.reserve_stock(quantities)
+        self._confirm_reservation(quantities, products, rejected)
+
+    def _requested_quantities(self, order: Order, products: Dict[int, Product]) -> Dict[int, int]:
+        """Soma as quantidades por produto e rejeita cedo o que já se sabe insuficiente, sem ir ao banco."""
+        quantities = defaultdict(int)
         for item in order.items:
-            product = self.product_repository.find_by_id(item.product_id)
-            if not product:
-                raise ValueError(f"Produto com ID {item.product_id} não encontrado.")
-            if product.quantity_available < item.quantity:
+            quantities[item.product_id] += item.quantity
+
+        for product_id, quantity in quantities.items():
+            product = products[product_id]
+            if product.quantity_available < quantity:
                 raise ValueError(f"Estoque insuficiente para o produto {product.name}.")
+        return dict(quantities)
+
+    def _confirm_reservation(self, quantities: Dict[int, int], products: Dict[int, Product], rejected: List[int]):
+        if rejected:
+            raise ValueError(f"Estoque insuficiente para o produto {products[rejected[0]].name}.")
 
-            # Reduz o estoque do produto
-            product.quantity_available -= item.quantity
-            self.product_repository.update(product)
+        for product_id, quantity in quantities.items():
+            products[product_id].quantity_available -= quantity
 
     def _apply_discount(self, order: Order, coupon):
         """Aplica o desconto do cupom ao valor total do pedido, se aplicável."""
@@ -109,3 +148,41 @@ class CreateOrderService:
             discount = (order.amount * coupon.discount_percentage) / 100
             discount = min(discount, coupon.max_discount)
             order.amount -= discount
+
+
+class AsyncCreateOrderService(CreateOrderService):
+    """
+    Versão assíncrona do `CreateOrderService` para a pilha assíncrona (DB_ASYNC).
+    Reaproveita as regras de validação e cálculo; só as idas ao banco são aguardadas.
+    """
+
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryPort,
+        product_repository: AsyncProductRepositoryPort,
+        coupon_repository: AsyncCouponRepositoryPort,
+    ):
+        super().__init__(order_repository, product_repository, coupon_repository)
+
+    async def execute(self, order_in: OrderIn, client_id: int) -> Order:
+        order = self._build_order(order_in, client_id)
+
+        existing_coupon = None
+        if order.coupon_hash:
+            coupon = await self.coupon_repository.find_by_hash(order.coupon_hash)
+            existing_coupon = self._check_coupon(order, coupon)
+
+        products = self._index_products(
+            order, await self.product_repository.find_by_ids([item.product_id for item in order.items])
+        )
+        self._calculate_amount(order, products)
+
+        quantities = self._requested_quantities(order, products)
+        rejected = await self.product_repository.reserve_stock(quantities)
+        self._confirm_reservation(quantities, products, rejected)
+
+        self._apply_discount(order, existing_coupon)
+
+        created_order = await self.order_repository.create(order)
+        self._name_items(created_order, products)
+        return created_order
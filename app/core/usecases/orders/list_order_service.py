@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator
 
 from app.core.entities.order import Order
-from app.core.ports.order_repository_port import OrderRepositoryPort
+from app.core.entities.page import Page
+from app.core.entities.resource_version import ResourceVersion
+from app.core.ports.order_repository_port import OrderRepositoryPort, AsyncOrderRepositoryPort
 
 
 class ListOrdersService:
@@ -11,6 +13,12 @@ class ListOrdersService:
     def execute(self) -> List[Order]:
         return self.order_repository.find_active_sorted_orders()
 
+    def execute_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return self.order_repository.find_active_sorted_orders_page(limit, cursor)
+
+    def stream(self) -> Iterator[Order]:
+        return self.order_repository.stream_active_sorted_orders()
+
 class GetOrderByIdService:
     def __init__(self, order_repository: OrderRepositoryPort):
         self.order_repository = order_repository
@@ -18,6 +26,9 @@ class GetOrderByIdService:
     def execute(self, order_id: int) -> Optional[Order]:
         return self.order_repository.find_by_id(order_id)
 
+    def version(self, order_id: int) -> Optional[ResourceVersion]:
+        return self.order_repository.find_version(order_id)
+
 class ListOrdersByStatusService:
     def __init__(self, order_repository: OrderRepositoryPort):
         self.order_repository = order_repository
@@ -25,9 +36,56 @@ class ListOrdersByStatusService:
     def execute(self, status: str) -> List[Order]:
         return self.order_repository.find_by_status(status)
 
+    def execute_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return self.order_repository.find_by_status_page(status, limit, cursor)
+
+    def stream(self, status: str) -> Iterator[Order]:
+        return self.order_repository.stream_by_status(status)
+
 class ListOrdersByClientService:
     def __init__(self, order_repository: OrderRepositoryPort):
         self.order_repository = order_repository
 
     def execute(self, client_id: int) -> List[Order]:
         return self.order_repository.find_by_client(client_id)
+
+    def execute_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return self.order_repository.find_by_client_page(client_id, limit, cursor)
+
+    def stream(self, client_id: int) -> Iterator[Order]:
+        return self.order_repository.stream_by_client(client_id)
+
+
+class AsyncListOrdersService:
+    def __init__(self, order_repository: AsyncOrderRepositoryPort):
+        self.order_repository = order_repository
+
+    async def execute(self) -> List[Order]:
+        return await self.order_repository.find_active_sorted_orders()
+
+    async def execute_page(self, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.order_repository.find_active_sorted_orders_page(limit, cursor)
+
+class AsyncGetOrderByIdService:
+    def __init__(self, order_repository: AsyncOrderRepositoryPort):
+        self.order_repository = order_repository
+
+    async def execute(self, order_id: int) -> Optional[Order]:
+        return await self.order_repository.find_by_id(order_id)
+
+    async def version(self, order_id: int) -> Optional[ResourceVersion]:
+        return await self.order_repository.find_version(order_id)
+
+class AsyncListOrdersByStatusService:
+    def __init__(self, order_repository: AsyncOrderRepositoryPort):
+        self.order_repository = order_repository
+
+    async def execute_page(self, status: str, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.order_repository.find_by_status_page(status, limit, cursor)
+
+class AsyncListOrdersByClientService:
+    def __init__(self, order_repository: AsyncOrderRepositoryPort):
+        self.order_repository = order_repository
+
+    async def execute_page(self, client_id: int, limit: int, cursor: Optional[str] = None) -> Page[Order]:
+        return await self.order_repository.find_by_client_page(client_id, limit, cursor)
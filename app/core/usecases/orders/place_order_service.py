@@ -0,0 +1,62 @@
+from typing import Optional
+
+from app.core.entities.order import Order
+from app.core.ports.order_event_publisher_port import OrderEventPublisherPort
+from app.core.ports.unit_of_work_port import UnitOfWorkPort, AsyncUnitOfWorkPort
+from app.core.schemas.order_schemas import OrderIn
+from app.core.usecases.orders.create_order_service import CreateOrderService, AsyncCreateOrderService
+from app.core.usecases.payment.create_payment_service import PaymentService, AsyncPaymentService
+from app.shared.enums.order_event_type import OrderEventType
+
+
+class PlaceOrderService:
+    def __init__(
+        self,
+        unit_of_work: UnitOfWorkPort,
+        create_order_service: CreateOrderService,
+        payment_service: PaymentService,
+        event_publisher: Optional[OrderEventPublisherPort] = None,
+    ):
+        self.unit_of_work = unit_of_work
+        self.create_order_service = create_order_service
+        self.payment_service = payment_service
+        self.event_publisher = event_publisher
+
+    def execute(self, order_in: OrderIn, client_id: Optional[int]) -> Order:
+        """
+        Cria o pedido (itens e baixa de estoque) e o pagamento em uma única transação.
+        Se qualquer etapa falhar nada é gravado, evitando pedidos sem pagamento.
+        O painel só é notificado depois do commit.
+        """
+        with self.unit_of_work:
+            order = self.create_order_service.execute(order_in, client_id=client_id)
+            self.payment_service.execute(order)
+
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.CREATED, order)
+        return order
+
+
+class AsyncPlaceOrderService:
+    """Versão assíncrona do `PlaceOrderService` para a pilha assíncrona (DB_ASYNC)."""
+
+    def __init__(
+        self,
+        unit_of_work: AsyncUnitOfWorkPort,
+        create_order_service: AsyncCreateOrderService,
+        payment_service: AsyncPaymentService,
+        event_publisher: Optional[OrderEventPublisherPort] = None,
+    ):
+        self.unit_of_work = unit_of_work
+        self.create_order_service = create_order_service
+        self.payment_service = payment_service
+        self.event_publisher = event_publisher
+
+    async def execute(self, order_in: OrderIn, client_id: Optional[int]) -> Order:
+        async with self.unit_of_work:
+            order = await self.create_order_service.execute(order_in, client_id=client_id)
+            await self.payment_service.execute(order)
+
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.CREATED, order)
+        return order
@@ -1,15 +1,23 @@
 from typing import Optional
 from app.core.entities.order import Order
-from app.core.ports.order_repository_port import OrderRepositoryPort
-from app.core.ports.payment_repository_port import PaymentRepositoryPort
+from app.core.ports.order_event_publisher_port import OrderEventPublisherPort
+from app.core.ports.order_repository_port import OrderRepositoryPort, AsyncOrderRepositoryPort
+from app.core.ports.payment_repository_port import PaymentRepositoryPort, AsyncPaymentRepositoryPort
+from app.shared.enums.order_event_type import OrderEventType
 from app.shared.enums.order_status import OrderStatus
 from app.shared.enums.payment_status import PaymentStatus
 
 
 class UpdateOrderStatusService:
-    def __init__(self, order_repository: OrderRepositoryPort,payment_repository: PaymentRepositoryPort):
+    def __init__(
+        self,
+        order_repository: OrderRepositoryPort,
+        payment_repository: PaymentRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None,
+    ):
         self.order_repository = order_repository
         self.payment_repository = payment_repository
+        self.event_publisher = event_publisher
 
     def execute(self, order_id: int, new_status: OrderStatus) -> Order:
         # Busca o pedido atual
@@ -18,14 +26,51 @@ class UpdateOrderStatusService:
             raise ValueError("Pedido não encontrado.")
 
         if new_status != OrderStatus.RECEIVED:
-            payment = self.payment_repository.get_by_order_id(order_id)
-            if not payment or payment.status != PaymentStatus.PAID:
-                raise ValueError(
-                    "Não é possível alterar o status para diferente de RECEIVED sem que o pagamento esteja aprovado."
-                )
+            self._check_payment(self.payment_repository.get_by_order_id(order_id))
 
         # Atualiza o status (pode incluir validações adicionais se necessário)
         order.status = new_status
 
         # Persiste a alteração e retorna o pedido atualizado
-        return self.order_repository.update(order)
+        updated_order = self.order_repository.update(order)
+
+        self._publish(updated_order)
+        return updated_order
+
+    def _check_payment(self, payment):
+        if not payment or payment.status != PaymentStatus.PAID:
+            raise ValueError(
+                "Não é possível alterar o status para diferente de RECEIVED sem que o pagamento esteja aprovado."
+            )
+
+    def _publish(self, order: Order):
+        """Notifica o painel: pedidos finalizados saem dele."""
+        if self.event_publisher:
+            event_type = (
+                OrderEventType.REMOVED if order.status == OrderStatus.COMPLETED
+                else OrderEventType.STATUS_CHANGED
+            )
+            self.event_publisher.publish(event_type, order)
+
+
+class AsyncUpdateOrderStatusService(UpdateOrderStatusService):
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryPort,
+        payment_repository: AsyncPaymentRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None,
+    ):
+        super().__init__(order_repository, payment_repository, event_publisher)
+
+    async def execute(self, order_id: int, new_status: OrderStatus) -> Order:
+        order = await self.order_repository.find_by_id(order_id)
+        if not order:
+            raise ValueError("Pedido não encontrado.")
+
+        if new_status != OrderStatus.RECEIVED:
+            self._check_payment(await self.payment_repository.get_by_order_id(order_id))
+
+        order.status = new_status
+        updated_order = await self.order_repository.update(order)
+        self._publish(updated_order)
+        return updated_order
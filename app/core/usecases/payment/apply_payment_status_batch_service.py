@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from app.core.entities.payment import PaymentStatusChangeResult
+from app.core.ports.payment_repository_port import PaymentRepositoryPort
+from app.core.ports.payment_status_notifier_port import PaymentStatusNotifierPort
+from app.core.schemas.payment_schemas import PaymentWebhookRequest
+from app.core.usecases.payment.update_payment_status_service import build_status_change
+from app.shared.enums.payment_change_outcome import PaymentChangeOutcome
+
+MAX_BATCH_SIZE = 500
+
+
+class ApplyPaymentStatusBatchService:
+    def __init__(self, payment_repository: PaymentRepositoryPort, notifier: Optional[PaymentStatusNotifierPort] = None):
+        self.payment_repository = payment_repository
+        self.notifier = notifier
+
+    def execute(self, notifications: List[PaymentWebhookRequest]) -> List[PaymentStatusChangeResult]:
+        """
+        Aplica um lote de notificações de pagamento em uma única transação e retorna
+        o resultado de cada pedido. Pedidos sem pagamento não interrompem o lote.
+        """
+        if not notifications:
+            raise ValueError("O lote não possui notificações.")
+        if len(notifications) > MAX_BATCH_SIZE:
+            raise ValueError(f"O lote aceita no máximo {MAX_BATCH_SIZE} notificações.")
+        order_ids = [n.order_id for n in notifications]
+        if len(set(order_ids)) != len(order_ids):
+            raise ValueError("O lote possui mais de uma notificação para o mesmo pedido.")
+        keys = [n.idempotency_key for n in notifications if n.idempotency_key is not None]
+        if len(set(keys)) != len(keys):
+            raise ValueError("O lote possui a mesma chave de idempotência em mais de uma notificação.")
+
+        changes = [
+            build_status_change(n.order_id, n.payment_status, n.description, n.idempotency_key)
+            for n in notifications
+        ]
+        results = self.payment_repository.apply_status_changes(changes)
+        if self.notifier:
+            updated = [r.order_id for r in results if r.outcome == PaymentChangeOutcome.UPDATED]
+            if updated:
+                self.notifier.publish(updated)
+        return results
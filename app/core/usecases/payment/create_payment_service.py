@@ -1,6 +1,7 @@
 from app.core.entities.order import Order
 from app.core.entities.payment import Payment
 from app.adapters.gateways.payment import PaymentRepository
+from app.core.ports.payment_repository_port import AsyncPaymentRepositoryPort
 from app.core.schemas.payment_schemas import PaymentQRCode
 from app.shared.enums.payment_status import PaymentStatus
 from app.shared.generate_qr_data import generate_qr_data
@@ -13,8 +14,13 @@ class PaymentService:
         """
         Gera os dados do QRCode, cria o pagamento com status PENDING e retorna o QRCode.
         """
+        payment = self._build_payment(order)
+        self.payment_repository.create(payment)
+        return PaymentQRCode(qr_data=payment.qr_code)
+
+    def _build_payment(self, order: Order) -> Payment:
         qr_data = generate_qr_data(order.id, order.amount)
-        payment = Payment(
+        return Payment(
             id = None,
             qr_code=qr_data,
             status=PaymentStatus.PENDING,
@@ -22,5 +28,13 @@ class PaymentService:
             amount=order.amount,
             description="Pagamento pendente"
         )
-        self.payment_repository.create(payment)
-        return PaymentQRCode(qr_data=qr_data)
\ No newline at end of file
+
+
+class AsyncPaymentService(PaymentService):
+    def __init__(self, payment_repository: AsyncPaymentRepositoryPort):
+        super().__init__(payment_repository)
+
+    async def execute(self, order: Order) -> PaymentQRCode:
+        payment = self._build_payment(order)
+        await self.payment_repository.create(payment)
+        return PaymentQRCode(qr_data=payment.qr_code)
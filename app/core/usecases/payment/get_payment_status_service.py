@@ -1,5 +1,5 @@
 from app.core.entities.payment import Payment
-from app.core.ports.payment_repository_port import PaymentRepositoryPort
+from app.core.ports.payment_repository_port import PaymentRepositoryPort, AsyncPaymentRepositoryPort
 
 class GetPaymentStatusService:
     def __init__(self, payment_repository: PaymentRepositoryPort):
@@ -14,3 +14,14 @@ class GetPaymentStatusService:
         if not payment:
             raise ValueError("Pagamento não encontrado para o pedido.")
         return payment
+
+
+class AsyncGetPaymentStatusService:
+    def __init__(self, payment_repository: AsyncPaymentRepositoryPort):
+        self.payment_repository = payment_repository
+
+    async def execute(self, order_id: int) -> Payment:
+        payment = await self.payment_repository.get_by_order_id(order_id)
+        if not payment:
+            raise ValueError("Pagamento não encontrado para o pedido.")
+        return payment
@@ -1,26 +1,40 @@
 from datetime import datetime
 from typing import Optional
 from app.core.ports.payment_repository_port import PaymentRepositoryPort
+from app.core.ports.payment_status_notifier_port import PaymentStatusNotifierPort
+from app.shared.enums.payment_change_outcome import PaymentChangeOutcome
 from app.shared.enums.payment_status import PaymentStatus
-from app.core.entities.payment import Payment
+from app.core.entities.payment import Payment, PaymentStatusChange
+
+
+def build_status_change(order_id: int, new_status: PaymentStatus, description: Optional[str] = None,
+                        idempotency_key: Optional[str] = None) -> PaymentStatusChange:
+    """Se o status for PAID, a data de pagamento passa a ser o momento atual."""
+    return PaymentStatusChange(
+        order_id=order_id,
+        status=new_status,
+        description=description,
+        payment_date=datetime.now() if new_status == PaymentStatus.PAID else None,
+        idempotency_key=idempotency_key,
+    )
+
 
 class UpdatePaymentStatusService:
-    def __init__(self, payment_repository: PaymentRepositoryPort):
+    def __init__(self, payment_repository: PaymentRepositoryPort, notifier: Optional[PaymentStatusNotifierPort] = None):
         self.payment_repository = payment_repository
+        self.notifier = notifier
 
-    def execute(self, order_id: int, new_status: PaymentStatus, description: Optional[str] = None) -> Payment:
+    def execute(self, order_id: int, new_status: PaymentStatus, description: Optional[str] = None,
+                idempotency_key: Optional[str] = None) -> Payment:
         """
         Atualiza o status do pagamento associado ao pedido.
         Se o status for PAID, atualiza a data de pagamento para o momento atual.
+        Uma notificação com `idempotency_key` já aplicada não altera o pagamento.
         """
-        payment = self.payment_repository.get_by_order_id(order_id)
-        if not payment:
+        change = build_status_change(order_id, new_status, description, idempotency_key)
+        [result] = self.payment_repository.apply_status_changes([change])
+        if result.outcome == PaymentChangeOutcome.NOT_FOUND:
             raise ValueError("Pagamento não encontrado para o pedido.")
-
-        payment.status = new_status
-        payment.description = description
-        if new_status == PaymentStatus.PAID:
-            payment.payment_date = datetime.now()
-
-        updated_payment = self.payment_repository.update(payment)
-        return updated_payment
+        if result.outcome == PaymentChangeOutcome.UPDATED and self.notifier:
+            self.notifier.publish([order_id])
+        return result.payment
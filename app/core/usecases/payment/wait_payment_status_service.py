@@ -0,0 +1,38 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from app.core.entities.payment import Payment
+from app.core.ports.payment_status_notifier_port import PaymentStatusNotifierPort
+from app.shared.enums.payment_status import PaymentStatus
+
+
+class WaitPaymentStatusService:
+    def __init__(self, get_payment: Callable[[int], Awaitable[Payment]], notifier: PaymentStatusNotifierPort):
+        self.get_payment = get_payment
+        self.notifier = notifier
+
+    async def execute(self, order_id: int, timeout: float) -> Payment:
+        """
+        Long-poll do status de pagamento: retorna assim que o pagamento deixar de
+        estar pendente ou, esgotado `timeout`, como estiver. Durante a espera o banco
+        só é relido quando o webhook avisa uma mudança no pedido; se a espera esgota o
+        tempo, é relido uma vez, para não devolver um status velho se o aviso se perdeu
+        (ex.: a conexão de LISTEN caiu). Com `timeout` 0 há uma única leitura.
+        Levanta ValueError se nenhum pagamento for encontrado.
+        """
+        # Assina antes da primeira leitura: um aviso entre as duas não se perde
+        subscription = self.notifier.subscribe(order_id)
+        try:
+            payment = await self.get_payment(order_id)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while payment.status == PaymentStatus.PENDING:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                if not await subscription.wait(remaining):
+                    return await self.get_payment(order_id)
+                payment = await self.get_payment(order_id)
+            return payment
+        finally:
+            self.notifier.unsubscribe(subscription)
@@ -1,5 +1,5 @@
 from app.core.entities.product import Product
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 from app.core.schemas.product_schemas import ProductIn
 
 class CreateProductService:
@@ -8,11 +8,13 @@ class CreateProductService:
 
     def execute(self, product_data: ProductIn) -> Product:
         """Cria um novo produto após validações"""
+        return self.product_repository.create(self._build_product(product_data))
 
+    def _build_product(self, product_data: ProductIn) -> Product:
         if product_data.price < 0:
             raise ValueError("Price cannot be negative.")
 
-        product = Product(
+        return Product(
             name=product_data.name,
             description=product_data.description,
             price=product_data.price,
@@ -20,4 +22,10 @@ class CreateProductService:
             quantity_available=product_data.quantity_available
         )
 
-        return self.product_repository.create(product)
+
+class AsyncCreateProductService(CreateProductService):
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        super().__init__(product_repository)
+
+    async def execute(self, product_data: ProductIn) -> Product:
+        return await self.product_repository.create(self._build_product(product_data))
@@ -1,4 +1,4 @@
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 
 class DeleteProductService:
     def __init__(self, product_repository: ProductRepositoryPort):
@@ -11,3 +11,15 @@ class DeleteProductService:
             raise ValueError("Product not found")
 
         self.product_repository.delete(product_id)
+
+
+class AsyncDeleteProductService:
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        self.product_repository = product_repository
+
+    async def execute(self, product_id: int) -> None:
+        existing_product = await self.product_repository.find_by_id(product_id)
+        if not existing_product:
+            raise ValueError("Product not found")
+
+        await self.product_repository.delete(product_id)
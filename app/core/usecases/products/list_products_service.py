@@ -1,6 +1,8 @@
-from typing import List
+from typing import Dict, List
 from app.core.entities.product import Product
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.core.entities.resource_version import ResourceVersion
+from app.shared.enums.categorys import CategoryEnum
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 
 class ListProductsService:
     def __init__(self, product_repository: ProductRepositoryPort):
@@ -9,6 +11,9 @@ class ListProductsService:
     def execute(self) -> List[Product]:
         return self.product_repository.find_all()
 
+    def version(self) -> ResourceVersion:
+        return self.product_repository.find_catalog_version()
+
 
 class ListProductsByCategoryService:
     def __init__(self, product_repository: ProductRepositoryPort):
@@ -16,3 +21,51 @@ class ListProductsByCategoryService:
 
     def execute(self, category: str) -> List[Product]:
         return self.product_repository.find_by_category(category)
+
+    def version(self, category: str) -> ResourceVersion:
+        return self.product_repository.find_catalog_version(category)
+
+
+class GetMenuService:
+    def __init__(self, product_repository: ProductRepositoryPort):
+        self.product_repository = product_repository
+
+    def execute(self) -> Dict[CategoryEnum, List[Product]]:
+        """Cardápio completo (produtos ativos por categoria) em uma única consulta."""
+        return self.product_repository.find_menu()
+
+    def version(self) -> ResourceVersion:
+        return self.product_repository.find_catalog_version()
+
+
+class AsyncListProductsService:
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        self.product_repository = product_repository
+
+    async def execute(self) -> List[Product]:
+        return await self.product_repository.find_all()
+
+    async def version(self) -> ResourceVersion:
+        return await self.product_repository.find_catalog_version()
+
+
+class AsyncListProductsByCategoryService:
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        self.product_repository = product_repository
+
+    async def execute(self, category: str) -> List[Product]:
+        return await self.product_repository.find_by_category(category)
+
+    async def version(self, category: str) -> ResourceVersion:
+        return await self.product_repository.find_catalog_version(category)
+
+
+class AsyncGetMenuService:
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        self.product_repository = product_repository
+
+    async def execute(self) -> Dict[CategoryEnum, List[Product]]:
+        return await self.product_repository.find_menu()
+
+    async def version(self) -> ResourceVersion:
+        return await self.product_repository.find_catalog_version()
@@ -1,5 +1,5 @@
 from app.core.entities.product import Product
-from app.core.ports.products_repository_port import ProductRepositoryPort
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
 from app.core.schemas.product_schemas import ProductIn
 
 class UpdateProductService:
@@ -10,6 +10,9 @@ class UpdateProductService:
         """Atualiza um produto existente"""
 
         existing_product = self.product_repository.find_by_id(product_id)
+        return self.product_repository.update(self._apply_changes(existing_product, product_data))
+
+    def _apply_changes(self, existing_product: Product, product_data: ProductIn) -> Product:
         if not existing_product:
             raise ValueError("Product not found")
 
@@ -22,5 +25,13 @@ class UpdateProductService:
         existing_product.price = product_data.price
         existing_product.category = product_data.category.value
         existing_product.quantity_available = product_data.quantity_available
+        return existing_product
+
+
+class AsyncUpdateProductService(UpdateProductService):
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        super().__init__(product_repository)
 
-        return self.product_repository.update(existing_product)
+    async def execute(self, product_id: int, product_data: ProductIn) -> Product:
+        existing_product = await self.product_repository.find_by_id(product_id)
+        return await self.product_repository.update(self._apply_changes(existing_product, product_data))
@@ -0,0 +1,59 @@
+from typing import List
+
+from app.core.entities.product import Product, ProductCatalogDiff
+from app.core.ports.products_repository_port import ProductRepositoryPort, AsyncProductRepositoryPort
+from app.core.schemas.product_schemas import ProductIn
+
+MAX_CATALOG_SIZE = 10_000
+
+
+class UpsertProductCatalogService:
+    def __init__(self, product_repository: ProductRepositoryPort):
+        self.product_repository = product_repository
+
+    def execute(self, products_data: List[ProductIn], deactivate_missing: bool = True) -> ProductCatalogDiff:
+        """
+        Aplica um catálogo inteiro em uma única transação, identificando os produtos
+        pelo nome. Com `deactivate_missing`, os produtos ativos fora do catálogo são
+        desativados. Retorna o resumo do que mudou.
+        """
+        products = self._build_products(products_data)
+        return ProductCatalogDiff(
+            received=len(products),
+            changes=self.product_repository.upsert_catalog(products, deactivate_missing),
+        )
+
+    def _build_products(self, products_data: List[ProductIn]) -> List[Product]:
+        if not products_data:
+            raise ValueError("O catálogo não possui produtos.")
+        if len(products_data) > MAX_CATALOG_SIZE:
+            raise ValueError(f"O catálogo aceita no máximo {MAX_CATALOG_SIZE} produtos.")
+
+        seen = set()
+        products = []
+        for product_data in products_data:
+            if product_data.price < 0:
+                raise ValueError(f"Price cannot be negative: {product_data.name}.")
+            if product_data.name in seen:
+                raise ValueError(f"Produto repetido no catálogo: {product_data.name}.")
+            seen.add(product_data.name)
+            products.append(Product(
+                name=product_data.name,
+                description=product_data.description,
+                price=product_data.price,
+                category=product_data.category.value,
+                quantity_available=product_data.quantity_available
+            ))
+        return products
+
+
+class AsyncUpsertProductCatalogService(UpsertProductCatalogService):
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        super().__init__(product_repository)
+
+    async def execute(self, products_data: List[ProductIn], deactivate_missing: bool = True) -> ProductCatalogDiff:
+        products = self._build_products(products_data)
+        return ProductCatalogDiff(
+            received=len(products),
+            changes=await self.product_repository.upsert_catalog(products, deactivate_missing),
+        )
@@ -1,22 +1,112 @@
 import os
-from sqlalchemy import create_engine
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from app.devices.db.pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
 DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "mysecretpassword")
 DB_NAME = os.getenv("DB_NAME", "fastfood")
 
-SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+SQLALCHEMY_DATABASE_URL = os.getenv(
+    "DATABASE_URL", f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+# Com DB_ASYNC=true as rotas de pedidos e produtos usam a pilha assíncrona (asyncpg)
+DB_ASYNC = _env_bool("DB_ASYNC", "false")
+
+# Pool de conexões (valores por processo; a pilha assíncrona tem um pool próprio)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Testa a conexão no checkout: descarta as que caíram num failover do banco
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", "true")
+# Recicla conexões mais velhas que isso (segundos); -1 desliga
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Tempo máximo de cada statement em ms; 0 desliga
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+# Compatível com PgBouncer em transaction pooling: sem prepared statements nomeados
+# reaproveitados e sem parâmetros de sessão (o timeout vai em SET LOCAL por transação)
+DB_PGBOUNCER = _env_bool("DB_PGBOUNCER", "false")
+
+
+def to_async_url(url: str) -> str:
+    """Converte a URL síncrona (psycopg2) para o driver asyncpg."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def engine_options(async_driver: bool = False) -> dict:
+    """Argumentos de `create_engine`/`create_async_engine` a partir das variáveis DB_POOL_* e afins."""
+    options = dict(
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool if async_driver else InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    connect_args = {}
+    if async_driver and DB_PGBOUNCER:
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+    if DB_STATEMENT_TIMEOUT_MS and not DB_PGBOUNCER:
+        if async_driver:
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=False)
+
+def _set_local_statement_timeout(conn) -> None:
+    conn.exec_driver_sql(f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
+
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# A engine assíncrona só abre conexões quando usada; com DB_ASYNC=false fica ociosa
+async_engine = create_async_engine(to_async_url(SQLALCHEMY_DATABASE_URL), **engine_options(async_driver=True))
+
+if DB_STATEMENT_TIMEOUT_MS and DB_PGBOUNCER:
+    # O PgBouncer não repassa parâmetros de sessão entre transações
+    for _engine in (engine, async_engine.sync_engine):
+        event.listen(_engine, "begin", _set_local_statement_timeout)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def get_db_session():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db_session():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_session_factory():
+    """
+    Retorna a fábrica de sessões. Usada por respostas em streaming, que precisam
+    abrir a própria sessão: a de `get_db_session` é fechada antes do envio do corpo.
+    """
+    return SessionLocal
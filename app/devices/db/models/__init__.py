@@ -5,7 +5,8 @@ from .coupon_client import ClientCouponAssociationModel
 from .item import OrderItemModel
 from .order import OrderModel
 from .payment import PaymentModel
+from .payment_webhook_event import PaymentWebhookEventModel
 from .product import ProductModel
 
 __all__ = ["BaseUserModel", "ClientModel", "CouponModel", "ClientCouponAssociationModel",
-           "OrderItemModel", "OrderModel", "PaymentModel", "ProductModel"]
+           "OrderItemModel", "OrderModel", "PaymentModel", "PaymentWebhookEventModel", "ProductModel"]
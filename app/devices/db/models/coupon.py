@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Date, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, Boolean, Index, text
 from sqlalchemy.orm import relationship
 
 from app.devices.db.models.base_model import BaseModel
@@ -6,6 +6,9 @@ from app.devices.db.models.base_model import BaseModel
 
 class CouponModel(BaseModel):
     __tablename__ = "coupons"
+    __table_args__ = (
+        Index("ix_coupons_expires_at_active", "expires_at", postgresql_where=text("active")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     hash = Column(String, unique=True)
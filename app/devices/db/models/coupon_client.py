@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.devices.db.models.base_model import BaseModel
@@ -6,6 +6,10 @@ from app.devices.db.models.base_model import BaseModel
 
 class ClientCouponAssociationModel(BaseModel):
     __tablename__ = "client_coupons"
+    __table_args__ = (
+        # A PK (client_id, coupon_id) já atende buscas por cliente; esta atende o JOIN por cupom
+        Index("ix_client_coupons_coupon_id", "coupon_id", "client_id"),
+    )
 
     client_id = Column(Integer, ForeignKey("clients.id"), primary_key=True)
     coupon_id = Column(Integer, ForeignKey("coupons.id"), primary_key=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum, Float
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Float, Index, text
 from sqlalchemy.orm import relationship
 
 from app.devices.db.models.base_model import BaseModel
@@ -7,6 +7,13 @@ from app.shared.enums.order_status import OrderStatus
 
 class OrderModel(BaseModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Listagem por status e por cliente, paginadas por id
+        Index("ix_orders_status_id_active", "status", "id", postgresql_where=text("active")),
+        Index("ix_orders_client_id_id_active", "client_id", "id", postgresql_where=text("active")),
+        # Painel da cozinha: apenas pedidos em andamento
+        Index("ix_orders_board", "status", "id", postgresql_where=text("active AND status <> 'COMPLETED'")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 
 from app.devices.db.models.base_model import BaseModel
@@ -6,6 +6,9 @@ from app.shared.enums.payment_status import PaymentStatus
 
 class PaymentModel(BaseModel):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_order_id", "order_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     qr_code = Column(String, nullable=True)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+
+from app.devices.db.models.base_model import BaseModel
+
+
+class PaymentWebhookEventModel(BaseModel):
+    """Chaves de idempotência das notificações de pagamento já aplicadas."""
+    __tablename__ = "payment_webhook_events"
+
+    # A PK é a restrição de unicidade: uma entrega repetida não insere e não reaplica a mudança
+    idempotency_key = Column(String(255), primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
+
+    def __repr__(self):
+        return f"<PaymentWebhookEventModel(idempotency_key={self.idempotency_key}, order_id={self.order_id})>"
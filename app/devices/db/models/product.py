@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, Enum
+from sqlalchemy import Column, Integer, String, Float, Enum, Index
 
 from app.devices.db.models.base_model import BaseModel
 from app.shared.enums.categorys import CategoryEnum
 
 class ProductModel(BaseModel):
     __tablename__ = "product"
+    __table_args__ = (
+        # Cardápio por categoria (apenas produtos ativos)
+        Index("ix_product_category_active", "category", "active"),
+        # Chave da carga do catálogo (INSERT ... ON CONFLICT (name))
+        Index("uq_product_name", "name", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String,nullable=False)
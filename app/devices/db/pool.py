@@ -0,0 +1,106 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Limites superiores dos buckets (o último bucket, "+Inf", é implícito)
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+CONNECTION_LIFETIME_BUCKETS_S = (1, 10, 60, 300, 900, 1800, 3600)
+
+_CONNECTED_AT = "connected_at"
+
+
+class Histogram:
+    """Histograma cumulativo simples, seguro para uso entre threads."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, buckets = 0, {}
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": cumulative, "sum": round(total, 3), "buckets": buckets}
+
+
+class PoolMetrics:
+    """Tempo de espera por conexão no checkout e tempo de vida das conexões de um pool."""
+
+    def __init__(self):
+        self.checkout_wait_ms = Histogram(CHECKOUT_WAIT_BUCKETS_MS)
+        self.connection_lifetime_s = Histogram(CONNECTION_LIFETIME_BUCKETS_S)
+
+    def on_close(self, dbapi_connection, connection_record) -> None:
+        connected_at = connection_record.info.pop(_CONNECTED_AT, None)
+        if connected_at is not None:
+            self.connection_lifetime_s.observe(time.monotonic() - connected_at)
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    connection_record.info[_CONNECTED_AT] = time.monotonic()
+
+
+class _InstrumentedPoolMixin:
+    """Mede quanto tempo cada checkout esperou por uma conexão livre (inclui abrir uma nova)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        # Um pool recriado (dispose, failover) herda os listeners do original via `_dispatch`
+        if "_dispatch" not in kwargs:
+            event.listen(self, "connect", _on_connect)
+            event.listen(self, "close", self.metrics.on_close)
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.checkout_wait_ms.observe((time.perf_counter() - start) * 1000)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool) -> Dict:
+    """Estatísticas atuais de um pool; as métricas só existem nos pools instrumentados."""
+    stats = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout_s=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(
+            checkout_wait_ms=metrics.checkout_wait_ms.snapshot(),
+            connection_lifetime_s=metrics.connection_lifetime_s.snapshot(),
+        )
+    return stats
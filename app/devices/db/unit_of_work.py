@@ -0,0 +1,77 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.ports.unit_of_work_port import UnitOfWorkPort, AsyncUnitOfWorkPort
+from app.devices.db.connection import get_db_session, get_async_db_session
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class SqlAlchemyUnitOfWork(UnitOfWorkPort):
+    """Unidade de trabalho sobre a sessão da requisição (`get_db_session`)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        self.session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            super().__exit__(exc_type, exc, traceback)
+        finally:
+            self.session.info.pop(UNIT_OF_WORK_KEY, None)
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+
+
+class SqlAlchemyAsyncUnitOfWork(AsyncUnitOfWorkPort):
+    """
+    Unidade de trabalho sobre a sessão assíncrona da requisição. A marca fica na
+    sessão síncrona interna, que é a usada pelos repositórios via `run_sync`.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> "SqlAlchemyAsyncUnitOfWork":
+        self.session.sync_session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        try:
+            await super().__aexit__(exc_type, exc, traceback)
+        finally:
+            self.session.sync_session.info.pop(UNIT_OF_WORK_KEY, None)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+
+def save_changes(session: Session) -> None:
+    """
+    Usado pelos repositórios no lugar de `session.commit()`: dentro de uma
+    unidade de trabalho apenas envia as alterações (flush), deixando o commit
+    para a unidade; fora dela, confirma a transação como antes.
+    """
+    if UNIT_OF_WORK_KEY in session.info:
+        session.flush()
+    else:
+        session.commit()
+
+
+def get_unit_of_work(db: Session = Depends(get_db_session)) -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(db)
+
+
+def get_async_unit_of_work(db: AsyncSession = Depends(get_async_db_session)) -> SqlAlchemyAsyncUnitOfWork:
+    return SqlAlchemyAsyncUnitOfWork(db)
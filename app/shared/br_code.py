@@ -0,0 +1,102 @@
+import binascii
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable, List
+
+# Recebedor do PIX (BR Code estático com valor e txid por pedido)
+PIX_KEY = os.getenv("PIX_KEY", "pagamentos@fastfood.com.br")
+PIX_MERCHANT_NAME = os.getenv("PIX_MERCHANT_NAME", "FAST FOOD SELF SERVICE")
+PIX_MERCHANT_CITY = os.getenv("PIX_MERCHANT_CITY", "SAO PAULO")
+
+PIX_GUI = "br.gov.bcb.pix"
+MAX_TXID_LENGTH = 25
+MAX_MERCHANT_NAME_LENGTH = 25
+MAX_MERCHANT_CITY_LENGTH = 15
+CRC_FIELD = "6304"
+TXID_PATTERN = re.compile(r"[A-Za-z0-9]{1,%d}" % MAX_TXID_LENGTH)
+
+
+def tlv(tag: str, value: str) -> str:
+    """Codifica um campo EMV: ID (2 dígitos) + tamanho (2 dígitos) + valor."""
+    if len(value) > 99:
+        raise ValueError(f"Campo {tag} excede 99 caracteres.")
+    return f"{tag}{len(value):02d}{value}"
+
+
+def crc16_ccitt(data: bytes, crc: int = 0xFFFF) -> int:
+    """
+    CRC16-CCITT (polinômio 0x1021, valor inicial 0xFFFF) exigido no campo 63 do BR Code.
+    `binascii.crc_hqx` é a versão por tabela implementada em C; `crc` permite
+    continuar o cálculo a partir de um prefixo já processado.
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def _ascii(value: str, max_length: int) -> str:
+    # Nome e cidade sem acentos: nem todo app de banco aceita caracteres fora do ASCII
+    text = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return text.upper().strip()[:max_length]
+
+
+def order_txid(order_id: int) -> str:
+    """Identificador da cobrança (campo 62-05): alfanumérico, até 25 caracteres."""
+    return f"PEDIDO{order_id}"
+
+
+@dataclass(slots=True)
+class PixCharge:
+    amount: float
+    txid: str
+
+
+class BrCodeBuilder:
+    """
+    Monta payloads BR Code (PIX, padrão EMV MPM) de um recebedor.
+
+    Os campos fixos do recebedor são codificados uma única vez, junto com o
+    estado do CRC depois deles; cada cobrança só codifica valor e txid e
+    continua o CRC a partir desse ponto.
+    """
+
+    def __init__(self, pix_key: str = PIX_KEY, merchant_name: str = PIX_MERCHANT_NAME,
+                 merchant_city: str = PIX_MERCHANT_CITY):
+        merchant_name = _ascii(merchant_name, MAX_MERCHANT_NAME_LENGTH)
+        merchant_city = _ascii(merchant_city, MAX_MERCHANT_CITY_LENGTH)
+        if not merchant_name or not merchant_city:
+            raise ValueError("Nome e cidade do recebedor devem ter caracteres ASCII.")
+        merchant_account = tlv("00", PIX_GUI) + tlv("01", pix_key)
+        self._head = (
+            tlv("00", "01")                     # Payload Format Indicator
+            + tlv("01", "12")                   # Ponto de iniciação: QR de uso único
+            + tlv("26", merchant_account)       # Conta do recebedor (chave PIX)
+            + tlv("52", "0000")                 # Merchant Category Code
+            + tlv("53", "986")                  # Moeda: BRL
+        )
+        self._merchant = (
+            tlv("58", "BR")
+            + tlv("59", merchant_name)
+            + tlv("60", merchant_city)
+        )
+        self._head_crc = crc16_ccitt(self._head.encode())
+
+    def build(self, amount: float, txid: str) -> str:
+        if amount < 0:
+            raise ValueError("O valor da cobrança não pode ser negativo.")
+        if not TXID_PATTERN.fullmatch(txid):
+            raise ValueError("O txid deve ter de 1 a 25 caracteres alfanuméricos.")
+        value = f"{amount:.2f}"
+        # Valor zero: o campo 54 é omitido e o pagador informa o valor ("0.00" é recusado)
+        amount_field = tlv("54", value) if value != "0.00" else ""
+        tail = amount_field + self._merchant + tlv("62", tlv("05", txid)) + CRC_FIELD
+        crc = crc16_ccitt(tail.encode(), self._head_crc)
+        return f"{self._head}{tail}{crc:04X}"
+
+    def build_many(self, charges: Iterable[PixCharge]) -> List[str]:
+        """Versão em lote de `build`, para gerar as cobranças de vários pedidos de uma vez."""
+        build = self.build
+        return [build(charge.amount, charge.txid) for charge in charges]
+
+
+br_code_builder = BrCodeBuilder()
@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Callable
+
+
+class CircuitOpenError(Exception):
+    """A chamada foi recusada sem tentar: o circuito está aberto."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Circuito aberto; nova tentativa em {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Disjuntor para chamadas a um serviço externo.
+
+    Fechado: as chamadas passam e falhas consecutivas são contadas. Ao atingir
+    `failure_threshold`, abre: as chamadas falham na hora (`CircuitOpenError`)
+    durante `reset_timeout` segundos. Depois disso fica semiaberto: uma única
+    chamada de teste passa; sucesso fecha o circuito, falha abre de novo.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.rejected = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Chamado antes de cada tentativa; lança `CircuitOpenError` se ela não deve acontecer."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self.rejected += 1
+            retry_after = max(self.reset_timeout - (self.clock() - self._opened_at), 0)
+            raise CircuitOpenError(retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+                self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self.failures,
+                "rejected": self.rejected,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout,
+            }
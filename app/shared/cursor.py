@@ -0,0 +1,28 @@
+import base64
+import json
+
+
+def encode_cursor(*values) -> str:
+    """
+    Codifica os valores da chave de ordenação do último item de uma página
+    em um cursor opaco (base64 url-safe), usado na paginação keyset.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple:
+    """
+    Decodifica um cursor gerado por `encode_cursor`.
+    Lança ValueError se o cursor estiver malformado ou não tiver `size` valores inteiros.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Cursor inválido.")
+    if not isinstance(values, list) or len(values) != size or not all(
+        isinstance(v, int) and not isinstance(v, bool) for v in values
+    ):
+        raise ValueError("Cursor inválido.")
+    return tuple(values)
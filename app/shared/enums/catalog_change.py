@@ -0,0 +1,7 @@
+from enum import Enum
+
+class CatalogChange(Enum):
+    """O que a carga do catálogo fez com cada produto alterado."""
+    CREATED = "created"
+    UPDATED = "updated"
+    DEACTIVATED = "deactivated"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+class OrderEventType(Enum):
+    SNAPSHOT = "snapshot"
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    REMOVED = "removed"
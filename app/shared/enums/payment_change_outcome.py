@@ -0,0 +1,7 @@
+from enum import Enum
+
+class PaymentChangeOutcome(Enum):
+    """Resultado, por pedido, de uma notificação de pagamento."""
+    UPDATED = "updated"
+    DUPLICATE = "duplicate"
+    NOT_FOUND = "not_found"
@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dotenv import load_dotenv
 from jwt import ExpiredSignatureError, InvalidTokenError
-from passlib.context import CryptContext
+
+from app.shared.handles.password_hasher import password_hasher
 
 load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "your_secret_key")
@@ -13,9 +14,6 @@ ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Gera um JWT com dados e tempo de expiração."""
     to_encode = data.copy()
@@ -25,13 +23,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifica se a senha está correta."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verifica se a senha está correta (bcrypt no pool de `password_hasher`)."""
+    return password_hasher.verify(plain_password, hashed_password)[0]
 
 
 def get_password_hash(password: str) -> str:
-    """Gera o hash da senha."""
-    return pwd_context.hash(password)
+    """Gera o hash da senha (bcrypt no pool de `password_hasher`)."""
+    return password_hasher.hash(password)
 
 
 def verify_jwt(token: str) -> dict:
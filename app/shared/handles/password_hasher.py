@@ -0,0 +1,106 @@
+import asyncio
+import hmac
+import os
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+
+from app.core.ports.password_hasher_port import PasswordHasherPort
+
+load_dotenv()
+
+# Custo do bcrypt (2^rounds iterações). Hashes com custo diferente são refeitos no próximo login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Threads dedicadas ao bcrypt; 0 executa na própria thread da requisição.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1))))
+# Prioridade (nice) das threads do pool: com CPU disputada, as requisições passam na frente do bcrypt.
+PASSWORD_HASH_NICE = int(os.getenv("PASSWORD_HASH_NICE", "10"))
+
+
+def _lower_thread_priority(nice: int) -> None:
+    """No Linux a prioridade vale por thread; em outros sistemas (ou sem permissão) não faz nada."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+    except (AttributeError, OSError):
+        pass
+
+
+class BcryptPasswordHasher(PasswordHasherPort):
+    """
+    bcrypt (passlib) executado em um pool de threads próprio e limitado.
+
+    Cada hash custa ~100 ms de CPU com o custo padrão. No pool, no máximo `workers`
+    hashes rodam ao mesmo tempo e o restante espera na fila; as demais requisições
+    continuam com CPU disponível. O bcrypt libera o GIL, então threads bastam.
+    As rotas assíncronas usam `hash_async`/`verify_async`, que aguardam o pool sem
+    ocupar uma thread do threadpool do Starlette enquanto o hash espera ou roda.
+    As threads do pool rodam com prioridade reduzida (`nice`).
+    """
+
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, workers: int = PASSWORD_HASH_WORKERS, nice: int = PASSWORD_HASH_NICE):
+        self.rounds = rounds
+        # min = max = padrão: qualquer hash com outro custo é marcado para ser refeito
+        self.context = CryptContext(
+            schemes=["bcrypt"],
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+        # Verificado quando não há hash (CPF inexistente ou cliente sem senha): a resposta
+        # leva o mesmo tempo de uma senha errada e não revela quais CPFs existem
+        self._dummy_hash = self.context.hash(secrets.token_urlsafe(16))
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hash",
+            initializer=_lower_thread_priority,
+            initargs=(nice,),
+        ) if workers else None
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        return self._executor.submit(fn, *args).result()
+
+    async def _run_async(self, fn, *args):
+        # Aguardar o Future do pool não prende thread nenhuma enquanto o hash está na fila
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await asyncio.wrap_future(self._executor.submit(fn, *args))
+
+    def hash(self, password: str) -> str:
+        return self._run(self.context.hash, password)
+
+    def verify(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        if not hashed:
+            self._run(self.context.verify, password, self._dummy_hash)
+            return False, None
+        if self.context.identify(hashed) is None:
+            # Senha gravada em texto puro antes do hash: aceita uma vez e migra
+            if hmac.compare_digest(password.encode(), hashed.encode()):
+                return True, self.hash(password)
+            return False, None
+        return self._run(self.context.verify_and_update, password, hashed)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(self.context.hash, password)
+
+    async def verify_async(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        if not hashed:
+            await self._run_async(self.context.verify, password, self._dummy_hash)
+            return False, None
+        if self.context.identify(hashed) is None:
+            if hmac.compare_digest(password.encode(), hashed.encode()):
+                return True, await self.hash_async(password)
+            return False, None
+        return await self._run_async(self.context.verify_and_update, password, hashed)
+
+
+password_hasher = BcryptPasswordHasher()
+
+
+def get_password_hasher() -> PasswordHasherPort:
+    return password_hasher
@@ -0,0 +1,38 @@
+from typing import Sequence
+
+import numpy as np
+
+from app.shared.validates.cpf_validate import CPF_LENGTH, CPF_WEIGHTS_1, CPF_WEIGHTS_2, only_digits
+
+_WEIGHTS_1 = np.array(CPF_WEIGHTS_1, dtype=np.int32)
+_WEIGHTS_2 = np.array(CPF_WEIGHTS_2, dtype=np.int32)
+# Marcador de CPF que não tem 11 dígitos depois de removida a máscara
+_INVALID = "x" * CPF_LENGTH
+
+
+def validate_cpfs(cpfs: Sequence[str]) -> np.ndarray:
+    """
+    Valida um lote de CPFs de uma vez e retorna um array de bool, na mesma ordem.
+
+    Os CPFs viram uma matriz N x 11 de dígitos e os verificadores saem de dois
+    produtos escalares com os pesos, para todas as linhas juntas. Mesmas regras
+    de `is_cpf_valid`, mas só dígitos ASCII são aceitos.
+    """
+    if not cpfs:
+        return np.zeros(0, dtype=bool)
+
+    normalized = [
+        cpf if len(cpf) == CPF_LENGTH else (digits if len(digits := only_digits(cpf)) == CPF_LENGTH else _INVALID)
+        for cpf in cpfs
+    ]
+    # "replace" mantém um byte por caractere; o que não é ASCII vira "?" e reprova a linha
+    raw = np.frombuffer("".join(normalized).encode("ascii", "replace"), dtype=np.uint8)
+    digits = raw.reshape(len(normalized), CPF_LENGTH) - ord("0")  # uint8: abaixo de "0" dá a volta e fica > 9
+
+    numeric = (digits <= 9).all(axis=1)
+    repeated = (digits == digits[:, :1]).all(axis=1)
+    weighted = digits.astype(np.int32)
+    digito1 = (weighted[:, :9] @ _WEIGHTS_1) * 10 % 11 % 10
+    digito2 = (weighted[:, :10] @ _WEIGHTS_2) * 10 % 11 % 10
+
+    return numeric & ~repeated & (weighted[:, 9] == digito1) & (weighted[:, 10] == digito2)
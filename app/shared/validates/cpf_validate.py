@@ -1,29 +1,42 @@
+from operator import mul
+
+CPF_LENGTH = 11
+# Pesos dos dígitos verificadores: 10..2 para o primeiro, 11..2 para o segundo
+CPF_WEIGHTS_1 = tuple(range(10, 1, -1))
+CPF_WEIGHTS_2 = tuple(range(11, 1, -1))
+# Os bytes ASCII de "0".."9" são 48..57: a soma ponderada dos bytes excede a dos dígitos nestes valores
+_ASCII_OFFSET_1 = ord("0") * sum(CPF_WEIGHTS_1)
+_ASCII_OFFSET_2 = ord("0") * sum(CPF_WEIGHTS_2)
+
+
+def only_digits(cpf: str) -> str:
+    """Remove a máscara (pontos, traço, espaços); CPFs já normalizados voltam sem cópia."""
+    if cpf.isdigit():
+        return cpf
+    return "".join(c for c in cpf if c.isdigit())
+
+
 def is_cpf_valid(cpf: str) -> bool:
     """
     Valida se um CPF é válido (removendo caracteres não numéricos,
     checando length e dígitos verificadores).
     """
-    # Remove caracteres não numéricos
-    digits = "".join(c for c in cpf if c.isdigit())
+    digits = only_digits(cpf)
 
-    if len(digits) != 11:
+    if len(digits) != CPF_LENGTH:
         return False
 
-    if digits == digits[0] * 11:
+    if digits == digits[0] * CPF_LENGTH:
         return False
 
-    # Cálculo do primeiro dígito verificador
-    soma = 0
-    for i in range(9):
-        soma += int(digits[i]) * (10 - i)
-    resto = soma % 11
-    digito1 = 0 if resto < 2 else 11 - resto
-
-    # Cálculo do segundo dígito verificador
-    soma = 0
-    for i in range(10):
-        soma += int(digits[i]) * (11 - i)
-    resto = soma % 11
-    digito2 = 0 if resto < 2 else 11 - resto
-
-    return (int(digits[9]) == digito1) and (int(digits[10]) == digito2)
\ No newline at end of file
+    if not digits.isascii():
+        # isdigit também aceita sobrescritos ("²") e dígitos de outros sistemas numéricos
+        if not digits.isdecimal():
+            return False
+        digits = "".join(str(int(c)) for c in digits)
+    numbers = digits.encode()
+    # (soma * 10) % 11 % 10 é o dígito esperado: 0 quando o resto da soma por 11 é menor que 2, senão 11 - resto
+    digito1 = (sum(map(mul, numbers, CPF_WEIGHTS_1)) - _ASCII_OFFSET_1) * 10 % 11 % 10
+    digito2 = (sum(map(mul, numbers, CPF_WEIGHTS_2)) - _ASCII_OFFSET_2) * 10 % 11 % 10
+
+    return numbers[9] - 48 == digito1 and numbers[10] - 48 == digito2
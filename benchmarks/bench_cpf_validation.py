@@ -0,0 +1,91 @@
+"""
+Micro-benchmark da validação de CPFs.
+
+Compara, sobre `--count` CPFs (metade válidos, parte com máscara), o laço
+por caractere anterior, o `is_cpf_valid` atual e o `validate_cpfs` em lote
+(NumPy). Mede também a montagem de entidades `Client` como nas leituras do
+repositório, com e sem revalidar o CPF. Não usa banco.
+
+Uso:
+    python -m benchmarks.bench_cpf_validation --count 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.core.entities.client import Client
+from app.shared.validates.cpf_batch_validate import validate_cpfs
+from app.shared.validates.cpf_validate import is_cpf_valid
+
+
+def legacy_is_cpf_valid(cpf: str) -> bool:
+    """O `is_cpf_valid` anterior, para referência."""
+    digits = "".join(c for c in cpf if c.isdigit())
+    if len(digits) != 11:
+        return False
+    if digits == digits[0] * 11:
+        return False
+    soma = 0
+    for i in range(9):
+        soma += int(digits[i]) * (10 - i)
+    resto = soma % 11
+    digito1 = 0 if resto < 2 else 11 - resto
+    soma = 0
+    for i in range(10):
+        soma += int(digits[i]) * (11 - i)
+    resto = soma % 11
+    digito2 = 0 if resto < 2 else 11 - resto
+    return (int(digits[9]) == digito1) and (int(digits[10]) == digito2)
+
+
+def make_cpfs(count: int, masked_ratio: float = 0.1, seed: int = 42) -> list:
+    """Gera CPFs com dígitos verificadores corretos e estraga metade deles."""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 10, size=(count, 9))
+    d1 = (base @ np.arange(10, 1, -1)) * 10 % 11 % 10
+    d2 = (np.column_stack([base, d1]) @ np.arange(11, 1, -1)) * 10 % 11 % 10
+    digits = np.column_stack([base, d1, d2])
+    broken = rng.random(count) < 0.5
+    digits[broken, 10] = (digits[broken, 10] + 1) % 10
+    cpfs = ["".join(map(str, row)) for row in digits.tolist()]
+    for i in np.flatnonzero(rng.random(count) < masked_ratio).tolist():
+        c = cpfs[i]
+        cpfs[i] = f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}"
+    return cpfs
+
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Gerando {args.count:,} CPFs...")
+    cpfs = make_cpfs(args.count)
+    expected = validate_cpfs(cpfs)
+    assert [is_cpf_valid(c) for c in cpfs[:10000]] == expected[:10000].tolist()
+
+    valid = [c.replace(".", "").replace("-", "") for c, ok in zip(cpfs, expected.tolist()) if ok]
+    cases = {
+        "laço anterior": lambda: [legacy_is_cpf_valid(c) for c in cpfs],
+        "is_cpf_valid": lambda: [is_cpf_valid(c) for c in cpfs],
+        "validate_cpfs (lote)": lambda: validate_cpfs(cpfs),
+        "Client, validando": lambda: [Client(id=i, name="", email="", cpf=c) for i, c in enumerate(valid)],
+        "Client, do banco": lambda: [Client(id=i, name="", email="", cpf=c, check_cpf=False)
+                                     for i, c in enumerate(valid)],
+    }
+    print(f"\n{'caso':<24}{'CPFs':>10}{'total (ms)':>12}{'CPFs/s':>14}")
+    for name, run in cases.items():
+        n = len(valid) if name.startswith("Client") else len(cpfs)
+        seconds = timed(run)
+        print(f"{name:<24}{n:>10,}{seconds * 1000:>12.0f}{n / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark dos payloads BR Code (PIX) e das imagens de QR Code.
+
+Payloads: o mock antigo (uuid + texto aleatório, CRC fixo), `BrCodeBuilder.build`
+um a um e `build_many` em lote. O CRC é comparado entre uma tabela em Python puro
+e `binascii.crc_hqx` (a mesma tabela, em C), usado pelo builder.
+Imagens: renderização de PNG, SVG e matriz por pagamento e leitura do cache.
+Não usa banco.
+
+Uso:
+    python -m benchmarks.bench_qr_codes --payloads 20000 --images 300
+"""
+import argparse
+import random
+import string
+import time
+import uuid
+
+from app.adapters.presenters.payment.qr_code_presenter import QrCodePresenter
+from app.shared.br_code import BrCodeBuilder, PixCharge, crc16_ccitt, order_txid
+from app.shared.ttl_cache import TTLCache
+
+
+def _crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return table
+
+
+CRC_TABLE = _crc_table()
+
+
+def crc16_python(data: bytes, crc: int = 0xFFFF) -> int:
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC_TABLE[(crc >> 8) ^ byte]
+    return crc
+
+
+def legacy_mock_payload(order_id: int, amount: float) -> str:
+    """O `generate_qr_data` anterior, para referência."""
+    transaction_uuid = str(uuid.uuid4()).replace('-', '')
+    client_str = ''.join(random.choices(string.ascii_uppercase, k=25))
+    city_str = ''.join(random.choices(string.ascii_uppercase, k=7))
+    return (
+        "000201010212" "43650016COM.MERCADOLIBRE" "020130" + transaction_uuid[:30]
+        + "040000" + f"{order_id:06d}" + "5303" + f"{int(amount):03d}" + "5802BR"
+        + "5925" + client_str + "6007" + city_str + "6207" + "0503***" + "6304" + "0B6D"
+    )
+
+
+def rate(run, n: int) -> float:
+    run(min(n, 100))  # aquecimento
+    start = time.perf_counter()
+    run(n)
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=20000)
+    parser.add_argument("--images", type=int, default=300)
+    parser.add_argument("--scale", type=int, default=8)
+    args = parser.parse_args()
+
+    builder = BrCodeBuilder()
+    charges = [PixCharge(amount=10 + i % 90 + 0.9, txid=order_txid(i)) for i in range(args.payloads)]
+    sample = builder.build(49.9, order_txid(123456)).encode()
+
+    payload_cases = {
+        "mock antigo": lambda n: [legacy_mock_payload(i, 49.9) for i in range(n)],
+        "build (um a um)": lambda n: [builder.build(c.amount, c.txid) for c in charges[:n]],
+        "build_many (lote)": lambda n: builder.build_many(charges[:n]),
+        "crc tabela python": lambda n: [crc16_python(sample) for _ in range(n)],
+        "crc binascii": lambda n: [crc16_ccitt(sample) for _ in range(n)],
+    }
+    print(f"\n{'payload':<22}{'por segundo':>14}")
+    for name, run in payload_cases.items():
+        print(f"{name:<22}{rate(run, args.payloads):>14,.0f}")
+
+    payloads = builder.build_many(charges[:args.images])
+    cache = TTLCache(maxsize=args.images * 3, ttl=3600)
+    for i, payload in enumerate(payloads):
+        cache.set((i, "png", args.scale), QrCodePresenter.render(payload, "png", args.scale))
+
+    image_cases = {
+        f"png (escala {args.scale})": lambda n: [QrCodePresenter.render(p, "png", args.scale) for p in payloads[:n]],
+        f"svg (escala {args.scale})": lambda n: [QrCodePresenter.render(p, "svg", args.scale) for p in payloads[:n]],
+        "matriz (json)": lambda n: [QrCodePresenter.render(p, "matrix", 1) for p in payloads[:n]],
+        "png do cache": lambda n: [cache.get((i, "png", args.scale)) for i in range(n)],
+    }
+    print(f"\n{'imagem':<22}{'por segundo':>14}")
+    for name, run in image_cases.items():
+        print(f"{name:<22}{rate(run, args.images):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
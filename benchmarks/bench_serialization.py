@@ -0,0 +1,98 @@
+"""
+Micro-benchmark da serialização das listagens.
+
+Compara, por lote de 1k pedidos/produtos, o caminho antigo (presenter monta os
+modelos Pydantic e o FastAPI valida de novo contra o `response_model` antes de
+codificar com o `json` da stdlib) com o caminho pré-serializado (presenter
+codifica as entidades direto em bytes com orjson). Não usa banco.
+
+Uso:
+    python -m benchmarks.bench_serialization --batches 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.adapters.presenters.order.order_presenter import OrderPresenter
+from app.adapters.presenters.products.product_presenter import ProductPresenter
+from app.core.entities.item import OrderItem
+from app.core.entities.order import Order
+from app.core.entities.page import Page
+from app.core.entities.product import Product
+from app.core.schemas.order_schemas import OrderPageOut
+from app.core.schemas.product_schemas import ProductOut
+from app.shared.enums.categorys import CategoryEnum
+from app.shared.enums.order_status import OrderStatus
+
+BATCH_SIZE = 1000
+
+
+def make_orders(n: int) -> Page[Order]:
+    orders = [
+        Order(
+            id=i, client_id=i % 50 or None, status=OrderStatus.RECEIVED,
+            items=[OrderItem(id=j, product_id=j, quantity=1 + j % 3, price=9.9, name=f"Produto {j}")
+                   for j in range(1, 4)],
+            amount=29.7,
+        )
+        for i in range(1, n + 1)
+    ]
+    return Page(items=orders, next_cursor="cursor")
+
+
+def make_products(n: int) -> List[Product]:
+    categories = list(CategoryEnum)
+    return [
+        Product(id=i, name=f"Produto {i}", description="Descrição do produto", price=19.9,
+                category=categories[i % len(categories)], quantity_available=100)
+        for i in range(1, n + 1)
+    ]
+
+
+def fastapi_render(loop, field, content) -> bytes:
+    """O que a rota fazia: valida/serializa contra o response_model e codifica com `json` (JSONResponse)."""
+    value = loop.run_until_complete(serialize_response(field=field, response_content=content, is_coroutine=False))
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def measure(render, batches: int) -> Dict[str, float]:
+    render()  # aquecimento
+    timings = []
+    for _ in range(batches):
+        start = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"p50_ms": statistics.median(timings), "min_ms": min(timings)}
+
+
+def run(batches: int) -> None:
+    page = make_orders(BATCH_SIZE)
+    products = make_products(BATCH_SIZE)
+    order_field = create_model_field("Response", OrderPageOut, mode="serialization")
+    product_field = create_model_field("Response", List[ProductOut], mode="serialization")
+
+    loop = asyncio.new_event_loop()
+    cases = {
+        "pedidos/pydantic": lambda: fastapi_render(loop, order_field, OrderPresenter.present_page(page)),
+        "pedidos/orjson": lambda: OrderPresenter.present_page_json(page),
+        "produtos/pydantic": lambda: fastapi_render(loop, product_field, ProductPresenter.present_list(products)),
+        "produtos/orjson": lambda: ProductPresenter.present_list_json(products),
+    }
+    print(f"\n{'caso (por 1k)':<20}{'p50 (ms)':>10}{'min (ms)':>10}")
+    for name, render in cases.items():
+        result = measure(render, batches)
+        print(f"{name:<20}{result['p50_ms']:>10.2f}{result['min_ms']:>10.2f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batches", type=int, default=20)
+    args = parser.parse_args()
+    run(args.batches)
@@ -1,24 +1,49 @@
-from fastapi import FastAPI
-from app.adapters.controllers.product_controller import router as product_router
-from app.adapters.controllers.client_controller import router as client_router
-from app.adapters.controllers.coupon_controller import router as coupon_router
-from app.adapters.controllers.order_controller import router as order_router
-from app.adapters.controllers.auth_proxy_controller import router as auth_proxy_router
-from app.adapters.controllers.payment_webhook_controller import router as payment_router
-from fastapi.security import OAuth2PasswordBearer, HTTPBearer
-
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
-bearer_scheme = HTTPBearer()
-
-
-def create_app() -> FastAPI:
-    app = FastAPI(title="Fast Food Self-Service")
-    app.include_router(client_router, prefix="/api", tags=["clients"])
-    app.include_router(product_router, prefix="/api", tags=["products"])
-    app.include_router(coupon_router, prefix="/api", tags=["coupons"])
-    app.include_router(order_router, prefix="/api", tags=["orders"])
-    app.include_router(payment_router, prefix="/api", tags=["payment_webhook"])
-    app.include_router(auth_proxy_router, prefix="/api", tags=["auth_proxy"])
-    return app
-
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from app.adapters.controllers.product_controller import router as product_router
+from app.adapters.controllers.client_controller import router as client_router
+from app.adapters.controllers.coupon_controller import router as coupon_router
+from app.adapters.controllers.order_controller import router as order_router
+from app.adapters.controllers.auth_proxy_controller import router as auth_proxy_router
+from app.adapters.controllers.payment_webhook_controller import router as payment_router
+from app.adapters.controllers.async_product_controller import router as async_product_router
+from app.adapters.controllers.async_order_controller import router as async_order_router
+from app.adapters.controllers.internal_controller import router as internal_router
+from app.adapters.controllers.payment_qr_code_controller import router as payment_qr_code_router
+from app.adapters.gateways.auth_provider import auth_provider
+from app.adapters.notifiers.payment_status_notifier import payment_status_notifier
+from app.devices.db.connection import DB_ASYNC
+from fastapi.security import OAuth2PasswordBearer, HTTPBearer
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+bearer_scheme = HTTPBearer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # LISTEN dos avisos de pagamento (PAYMENT_NOTIFY_BACKEND=postgres); nada a fazer em memória
+    await payment_status_notifier.start()
+    yield
+    await payment_status_notifier.stop()
+    # Conexões mantidas (keep-alive) com o serviço de autenticação
+    await auth_provider.aclose()
+
+
+def create_app(use_async_db: bool = DB_ASYNC) -> FastAPI:
+    """
+    Com `use_async_db` (variável DB_ASYNC) as rotas de produtos e pedidos usam a
+    pilha assíncrona (asyncpg); as demais continuam síncronas.
+    """
+    app = FastAPI(title="Fast Food Self-Service", lifespan=lifespan)
+    app.include_router(client_router, prefix="/api", tags=["clients"])
+    app.include_router(async_product_router if use_async_db else product_router, prefix="/api", tags=["products"])
+    app.include_router(coupon_router, prefix="/api", tags=["coupons"])
+    app.include_router(async_order_router if use_async_db else order_router, prefix="/api", tags=["orders"])
+    app.include_router(payment_router, prefix="/api", tags=["payment_webhook"])
+    app.include_router(payment_qr_code_router, prefix="/api", tags=["payment_qrcode"])
+    app.include_router(auth_proxy_router, prefix="/api", tags=["auth_proxy"])
+    app.include_router(internal_router, prefix="/internal", tags=["internal"], include_in_schema=False)
+    return app
+
 app = create_app()
\ No newline at end of file
@@ -19,8 +19,8 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
 DB_NAME = os.getenv("DB_NAME", "fastfood")
 
-# 5) Monta a URL do banco dinamicamente
-database_url = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# 5) Monta a URL do banco dinamicamente (DATABASE_URL, se definida, tem precedência, como na aplicação)
+database_url = os.getenv("DATABASE_URL", f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}")
 
 # 6) Sobrescreve a sqlalchemy.url que está no alembic.ini
 config.set_main_option("sqlalchemy.url", database_url)
@@ -0,0 +1,48 @@
+"""Add indexes for the repository query patterns
+
+Revision ID: 25ae63ed689b
+Revises: 0b68f90eb86f
+Create Date: 2026-10-18 10:12:41.527310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '25ae63ed689b'
+down_revision: Union[str, None] = '0b68f90eb86f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nome, tabela, colunas, predicado do índice parcial)
+INDEXES = [
+    ('ix_orders_status_id_active', 'orders', ['status', 'id'], 'active'),
+    ('ix_orders_client_id_id_active', 'orders', ['client_id', 'id'], 'active'),
+    ('ix_orders_board', 'orders', ['status', 'id'], "active AND status <> 'COMPLETED'"),
+    ('ix_order_items_order_id', 'order_items', ['order_id'], None),
+    ('ix_payments_order_id', 'payments', ['order_id'], None),
+    ('ix_client_coupons_coupon_id', 'client_coupons', ['coupon_id', 'client_id'], None),
+    ('ix_coupons_expires_at_active', 'coupons', ['expires_at'], 'active'),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Add (category, active) index for the menu queries
+
+Revision ID: 7c3f1a9d2e44
+Revises: 25ae63ed689b
+Create Date: 2026-10-18 14:02:17.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f1a9d2e44'
+down_revision: Union[str, None] = '25ae63ed689b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_product_category_active', 'product', ['category', 'active'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_product_category_active', table_name='product', postgresql_concurrently=True)
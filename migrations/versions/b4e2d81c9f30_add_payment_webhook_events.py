@@ -0,0 +1,35 @@
+"""Add payment_webhook_events for idempotent webhook deliveries
+
+Revision ID: b4e2d81c9f30
+Revises: 7c3f1a9d2e44
+Create Date: 2026-10-18 18:40:52.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e2d81c9f30'
+down_revision: Union[str, None] = '7c3f1a9d2e44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'payment_webhook_events',
+        sa.Column('idempotency_key', sa.String(length=255), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+        sa.PrimaryKeyConstraint('idempotency_key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('payment_webhook_events')
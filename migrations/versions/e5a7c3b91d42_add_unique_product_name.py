@@ -0,0 +1,49 @@
+"""Unique product name, used as the key of the catalog upsert
+
+Revision ID: e5a7c3b91d42
+Revises: b4e2d81c9f30
+Create Date: 2026-10-18 19:41:06.218734
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3b91d42'
+down_revision: Union[str, None] = 'b4e2d81c9f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nomes repetidos precisam ser resolvidos por quem opera o banco (renomear ou
+    # remover): o upsert em lote usa o nome como chave e desativaria o produto
+    # que ficasse com outro nome
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT name, array_agg(id ORDER BY id) AS ids
+        FROM product
+        GROUP BY name
+        HAVING count(*) > 1
+        ORDER BY name
+    """)).all()
+    if duplicates:
+        listed = "\n".join(f"  {name!r}: ids {', '.join(map(str, ids))}" for name, ids in duplicates)
+        raise RuntimeError(
+            "Não foi possível criar o índice único em product.name: há produtos com o "
+            f"mesmo nome. Renomeie ou remova os repetidos e rode a migração de novo:\n{listed}"
+        )
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_product_name', 'product', ['name'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_product_name', table_name='product', postgresql_concurrently=True)
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.adapters.gateways.cached_client import client_id_cache
+from app.adapters.gateways.cached_product import product_catalog_cache
+from app.adapters.presenters.payment.qr_code_presenter import qr_image_cache
+from app.devices.db.connection import Base, get_db_session, get_session_factory, get_async_db_session, to_async_url
+from app.devices.db.models import *  # noqa: F401,F403 - registra todos os models no metadata
+from main import app, create_app
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Engine apontando para um Postgres de testes.
+    Usa TEST_DATABASE_URL se definida; caso contrário sobe um container via testcontainers.
+    Os testes de integração são ignorados quando nenhum dos dois está disponível.
+    """
+    url = os.getenv("TEST_DATABASE_URL")
+    container = None
+    if not url:
+        try:
+            from testcontainers.postgres import PostgresContainer
+
+            container = PostgresContainer("postgres:15")
+            container.start()
+        except Exception as e:
+            pytest.skip(f"Postgres indisponível para testes de integração: {e}")
+        url = container.get_connection_url()
+
+    test_engine = create_engine(url)
+    Base.metadata.drop_all(test_engine)
+    Base.metadata.create_all(test_engine)
+    yield test_engine
+    Base.metadata.drop_all(test_engine)
+    test_engine.dispose()
+    if container is not None:
+        container.stop()
+
+
+@pytest.fixture
+def session_factory(engine):
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Limpa os dados entre testes mantendo o schema
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+    # Os ids recomeçam; os caches por id não podem sobreviver entre testes
+    product_catalog_cache.clear()
+    client_id_cache.clear()
+    qr_image_cache.clear()
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _db_session_override(session_factory):
+    def override_get_db_session():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+    return override_get_db_session
+
+
+@pytest.fixture
+def api_client(session_factory):
+    """TestClient cujas rotas usam o banco de testes."""
+    app.dependency_overrides[get_db_session] = _db_session_override(session_factory)
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+        app.dependency_overrides.pop(get_session_factory, None)
+
+
+@pytest.fixture
+def async_api_client(engine, session_factory):
+    """
+    TestClient da aplicação com a pilha assíncrona (DB_ASYNC) apontando para o banco de testes.
+    NullPool porque o TestClient pode usar um event loop diferente a cada requisição.
+    """
+    async_engine = create_async_engine(to_async_url(engine.url.render_as_string(hide_password=False)),
+                                       poolclass=NullPool)
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db_session():
+        async with async_session_factory() as session:
+            yield session
+
+    async_app = create_app(use_async_db=True)
+    async_app.dependency_overrides[get_async_db_session] = override_get_async_db_session
+    async_app.dependency_overrides[get_db_session] = _db_session_override(session_factory)
+    async_app.dependency_overrides[get_session_factory] = lambda: session_factory
+    yield TestClient(async_app)
+
+
+class QueryCounter:
+    """Conta os statements SQL enviados ao banco enquanto estiver ativo."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+@pytest.fixture
+def count_queries(engine):
+    return lambda: QueryCounter(engine)
@@ -0,0 +1,51 @@
+import pytest
+
+from app.adapters.dependencies.auth import get_current_user_async
+from app.devices.db.models import OrderModel, PaymentModel, ProductModel
+from tests.integration.factories import seed_catalog, seed_orders
+
+
+@pytest.mark.parametrize("url", [
+    "/api/orders?limit=5",
+    "/api/orders/status/Recebido?limit=5",
+    "/api/orders/client/1",
+    "/api/orders/1",
+    "/api/orders/1/payment_status",
+    "/api/products",
+])
+def test_async_routes_answer_like_sync_routes(api_client, async_api_client, db_session, url):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=8)
+
+    sync_response = api_client.get(url)
+    async_response = async_api_client.get(url)
+
+    assert async_response.status_code == sync_response.status_code == 200
+    assert async_response.json() == sync_response.json()
+
+
+def test_async_create_order_commits_order_payment_and_stock_together(async_api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    async_api_client.app.dependency_overrides[get_current_user_async] = lambda: {"user_id": client_id}
+
+    response = async_api_client.post(
+        "/api/orders", json={"items": [{"product_id": product_ids[0], "quantity": 2}]}
+    )
+
+    assert response.status_code == 201, response.text
+    order_id = response.json()["id"]
+    assert db_session.get(OrderModel, order_id).client_id == client_id
+    assert db_session.query(PaymentModel).filter_by(order_id=order_id).count() == 1
+    assert db_session.get(ProductModel, product_ids[0]).quantity_available == 98
+
+
+def test_async_create_order_rolls_back_on_insufficient_stock(async_api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    async_api_client.app.dependency_overrides[get_current_user_async] = lambda: {"user_id": client_id}
+
+    response = async_api_client.post(
+        "/api/orders", json={"items": [{"product_id": product_ids[0], "quantity": 1000}]}
+    )
+
+    assert response.status_code == 400
+    assert db_session.query(OrderModel).count() == 0
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.adapters.dependencies import auth
+from app.adapters.dependencies.auth import get_current_user, token_cache
+from app.adapters.gateways.cached_client import client_id_cache
+from app.adapters.gateways.client import AsyncClientRepository, ClientRepository
+from app.devices.db.connection import to_async_url
+from app.shared.handles.jwt_user import create_access_token
+from tests.integration.factories import seed_catalog
+
+CPF = "52998224725"
+
+
+def test_repeated_token_is_resolved_without_database_or_jwt_decode(db_session, count_queries, mocker):
+    client_id, _ = seed_catalog(db_session, n_products=0)
+    token = create_access_token({"cpf": CPF, "name": "Cliente"})
+    verify = mocker.spy(auth, "verify_jwt")
+    token_cache.clear()
+
+    first = get_current_user(token=token, db=db_session)
+    with count_queries() as counter:
+        second = get_current_user(token=token, db=db_session)
+
+    assert first["user_id"] == second["user_id"] == client_id
+    assert counter.count == 0
+    assert verify.call_count == 1
+
+
+def test_client_update_invalidates_cached_id(db_session, count_queries):
+    client_id, _ = seed_catalog(db_session, n_products=0)
+    repository = ClientRepository(db_session)
+    client = auth._new_client({"cpf": CPF, "name": "Cliente"})
+    assert repository.get_or_create_id(client) == client_id
+    with count_queries() as counter:
+        assert repository.get_or_create_id(client) == client_id
+    assert counter.count == 0
+
+    stored = repository.find_by_id(client_id)
+    stored.active = False
+    repository.update(stored)
+
+    with count_queries() as counter:
+        assert repository.get_or_create_id(client) == client_id
+    assert counter.count == 1
+
+
+def test_async_get_or_create_id_counts_a_single_cache_miss(engine, db_session):
+    client_id, _ = seed_catalog(db_session, n_products=0)
+    client = auth._new_client({"cpf": CPF, "name": "Cliente"})
+    client_id_cache.clear()
+    misses = client_id_cache.stats()["misses"]
+
+    async def resolve():
+        async_engine = create_async_engine(to_async_url(engine.url.render_as_string(hide_password=False)),
+                                           poolclass=NullPool)
+        try:
+            async with AsyncSession(async_engine) as session:
+                return await AsyncClientRepository(session).get_or_create_id(client)
+        finally:
+            await async_engine.dispose()
+
+    resolved = asyncio.run(resolve())
+
+    assert resolved == client_id
+    assert client_id_cache.stats()["misses"] == misses + 1
+
+
+def test_token_entry_does_not_outlive_token_expiration(db_session):
+    seed_catalog(db_session, n_products=0)
+    token_cache.clear()
+    token = create_access_token({"cpf": CPF}, expires_delta=timedelta(seconds=30))
+
+    get_current_user(token=token, db=db_session)
+
+    (expires_at, _), = token_cache._entries.values()
+    assert expires_at - token_cache.clock() <= 30 < auth.AUTH_TOKEN_CACHE_TTL_SECONDS
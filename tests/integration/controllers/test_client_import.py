@@ -0,0 +1,136 @@
+import csv
+import io
+import tempfile
+
+import pytest
+
+from app.adapters.gateways.client import ClientRepository
+from app.adapters.gateways.client_import import ClientCopyImporter
+from app.core.usecases.clients.import_clients_service import ImportClientsService
+from app.devices.db.models import ClientModel
+from tests.integration.factories import seed_catalog
+
+SEEDED_CPF = "52998224725"
+
+
+def make_cpf(base: int) -> str:
+    digits = [int(c) for c in f"{base:09d}"]
+    for weights in (range(10, 1, -1), range(11, 1, -1)):
+        digits.append(sum(d * w for d, w in zip(digits, weights)) * 10 % 11 % 10)
+    return "".join(map(str, digits))
+
+
+def read_report(text: str):
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def test_import_creates_clients_and_reports_rejected_rows(api_client, db_session):
+    seed_catalog(db_session, 0)
+    first, second = make_cpf(100000001), make_cpf(100000002)
+    body = "\n".join([
+        "CPF,Name,Email",
+        f"{first[:3]}.{first[3:6]}.{first[6:9]}-{first[9:]},Ana,ANA@example.com",
+        f"{second},Bruno,bruno@example.com",
+        "12345678900,Carla,carla@example.com",
+        f"{first},Ana de novo,outra@example.com",
+        f"{make_cpf(100000003)},Duda,bruno@example.com",
+        f"{SEEDED_CPF},Eva,eva@example.com",
+        f"{make_cpf(100000004)},Fabio,cliente@example.com",
+        f"{make_cpf(100000005)},,gabi@example.com",
+        f"{make_cpf(100000006)},Hugo,sem-arroba",
+    ]) + "\n"
+
+    response = api_client.post("/api/clients/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["X-Import-Received"] == "9"
+    assert response.headers["X-Import-Imported"] == "2"
+    assert response.headers["X-Import-Rejected"] == "7"
+    assert {(r["line"], r["error"]) for r in read_report(response.text)} == {
+        ("4", "CPF inválido."),
+        ("5", "CPF repetido no arquivo."),
+        ("6", "E-mail repetido no arquivo."),
+        ("7", "CPF já cadastrado no sistema."),
+        ("8", "E-mail já cadastrado no sistema."),
+        ("9", "Nome obrigatório."),
+        ("10", "E-mail inválido."),
+    }
+
+    ana = ClientRepository(db_session).find_by_cpf(first)
+    assert ana.name == "Ana" and ana.email == "ana@example.com" and ana.password is None
+    assert db_session.query(ClientModel).count() == 3
+
+
+def test_row_rejected_for_its_email_does_not_block_its_cpf(api_client, db_session):
+    first, second = make_cpf(100000001), make_cpf(100000002)
+    body = "\n".join([
+        "cpf,name,email",
+        f"{first},Ana,ana@example.com",
+        f"{second},Bruno,ana@example.com",
+        f"{second},Bruno,bruno@example.com",
+        f"{second},Bruno de novo,outro@example.com",
+    ]) + "\n"
+
+    response = api_client.post("/api/clients/import", content=body.encode())
+
+    assert response.headers["X-Import-Imported"] == "2"
+    assert {(r["line"], r["error"]) for r in read_report(response.text)} == {
+        ("3", "E-mail repetido no arquivo."),
+        ("5", "CPF repetido no arquivo."),
+    }
+    assert ClientRepository(db_session).find_by_cpf(second).email == "bruno@example.com"
+
+
+def test_import_rejects_file_without_required_columns(api_client):
+    response = api_client.post("/api/clients/import", content=b"cpf,name\n52998224725,Ana\n")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Colunas obrigatórias ausentes: email."
+
+
+def test_import_rejects_malformed_csv(api_client, db_session):
+    field = "x" * (csv.field_size_limit() + 1)
+    body = f"cpf,name,email\n{make_cpf(100000001)},{field},ana@example.com\n"
+
+    response = api_client.post("/api/clients/import", content=body.encode())
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("CSV malformado")
+    assert db_session.query(ClientModel).count() == 0
+
+
+def test_import_closes_both_spools_on_unexpected_errors(api_client, monkeypatch):
+    spools = []
+
+    class RecordingSpool(tempfile.SpooledTemporaryFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            spools.append(self)
+
+    def fail(self, csv_file, report):
+        raise RuntimeError("conexão perdida")
+
+    monkeypatch.setattr(tempfile, "SpooledTemporaryFile", RecordingSpool)
+    monkeypatch.setattr(ImportClientsService, "execute", fail)
+
+    with pytest.raises(RuntimeError):
+        api_client.post("/api/clients/import", content=b"cpf,name,email\n")
+
+    assert len(spools) == 2
+    assert all(spool.closed for spool in spools)
+
+
+def test_import_reads_the_file_in_chunks(db_session):
+    rows = ["cpf,name,email"] + [f"{make_cpf(200000000 + i)},Cliente {i},c{i}@example.com" for i in range(25)]
+    report = io.StringIO()
+
+    service = ImportClientsService(ClientCopyImporter(db_session), chunk_size=10)
+    chunk_sizes = [len(chunk) for chunk in service._chunks(csv.DictReader(io.StringIO("\n".join(rows))))]
+    summary = service.execute(io.StringIO("\n".join(rows)), report)
+
+    assert chunk_sizes == [10, 10, 5]
+
+    assert (summary.received, summary.imported, summary.rejected) == (25, 25, 0)
+    assert report.getvalue().strip() == "line,cpf,email,error"
+    assert db_session.query(ClientModel).count() == 25
@@ -0,0 +1,21 @@
+from app.adapters.gateways.client import ClientRepository
+from app.shared.handles.password_hasher import BcryptPasswordHasher, get_password_hasher
+
+CPF = "52998224725"
+
+
+def test_password_is_stored_hashed_and_login_issues_token(api_client, db_session):
+    api_client.app.dependency_overrides[get_password_hasher] = lambda: BcryptPasswordHasher(rounds=4, workers=1)
+    try:
+        created = api_client.post("/api/clients", json={
+            "cpf": CPF, "name": "Cliente", "email": "cliente@example.com", "password": "segredo",
+        })
+        wrong = api_client.post("/api/clients/login", json={"cpf": CPF, "password": "errada"})
+        login = api_client.post("/api/clients/login", json={"cpf": CPF, "password": "segredo"})
+    finally:
+        api_client.app.dependency_overrides.pop(get_password_hasher, None)
+
+    assert created.status_code == 201
+    assert ClientRepository(db_session).find_by_cpf(CPF).password.startswith("$2b$04$")
+    assert wrong.status_code == 401
+    assert login.status_code == 200 and login.json()["jwt"]
@@ -0,0 +1,53 @@
+import pytest
+
+from tests.integration.factories import seed_catalog, seed_orders
+
+
+@pytest.mark.parametrize("url", [
+    "/api/products",
+    "/api/products/category/Lanche",
+    "/api/coupons",
+    "/api/orders/1",
+])
+def test_matching_etag_returns_304_without_body(api_client, db_session, url):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=1)
+
+    first = api_client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = api_client.get(url, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+    by_date = api_client.get(url, headers={"If-Modified-Since": first.headers["Last-Modified"]})
+    assert by_date.status_code == 304
+
+
+def test_not_modified_skips_the_listing_query(api_client, db_session, count_queries):
+    seed_catalog(db_session)
+    etag = api_client.get("/api/products").headers["ETag"]
+
+    with count_queries() as counter:
+        response = api_client.get("/api/products", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert counter.count == 1
+
+
+def test_order_status_change_changes_etag(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=1)
+    etag = api_client.get("/api/orders/1").headers["ETag"]
+
+    assert api_client.patch("/api/orders/1/status?new_status=Em%20Prepara%C3%A7%C3%A3o").status_code == 200
+
+    response = api_client.get("/api/orders/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_unknown_order_is_404_before_loading(api_client):
+    assert api_client.get("/api/orders/999").status_code == 404
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from app.adapters.controllers.order_controller import order_board_feed
+from app.adapters.notifiers.order_board_feed import OrderBoardFeed
+from app.core.entities.order import Order
+from app.shared.enums.order_event_type import OrderEventType
+from app.shared.enums.order_status import OrderStatus
+from tests.integration.factories import seed_catalog, seed_orders
+
+
+class ConnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+def parse_sse(chunk: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return {"id": int(fields["id"]), "event": fields["event"], "data": json.loads(fields["data"])}
+
+
+def read_events(feed, session_factory, n_events: int, last_event_id=None, publish=()):
+    async def scenario():
+        response = await order_board_feed(ConnectedRequest(), last_event_id, feed, session_factory)
+        body = response.body_iterator
+        events = [parse_sse(await body.__anext__())]
+        for event_type, order in publish:
+            feed.publish(event_type, order)
+        while len(events) < n_events:
+            events.append(parse_sse(await body.__anext__()))
+        await body.aclose()
+        return events
+
+    return asyncio.run(scenario())
+
+
+def test_feed_sends_sorted_snapshot_then_deltas(db_session, session_factory):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=3)
+    feed = OrderBoardFeed()
+
+    events = read_events(feed, session_factory, n_events=3, publish=[
+        (OrderEventType.STATUS_CHANGED, Order(id=2, status=OrderStatus.READY)),
+        (OrderEventType.REMOVED, Order(id=1, status=OrderStatus.COMPLETED)),
+    ])
+
+    snapshot, changed, removed = events
+    assert snapshot["event"] == "snapshot" and snapshot["id"] == 0
+    assert [order["id"] for order in snapshot["data"]["orders"]] == [1, 2, 3]
+    assert (changed["id"], changed["event"], changed["data"]["status"]) == (1, "status_changed", "Pronto")
+    assert (removed["id"], removed["event"], removed["data"]) == (2, "removed", {"id": 1})
+
+
+def test_feed_resumes_without_snapshot(session_factory):
+    feed = OrderBoardFeed()
+    for order_id in (1, 2, 3):
+        feed.publish(OrderEventType.CREATED, Order(id=order_id))
+
+    events = read_events(feed, session_factory, n_events=2, last_event_id="1")
+
+    assert [(event["id"], event["event"]) for event in events] == [(2, "created"), (3, "created")]
@@ -0,0 +1,57 @@
+import pytest
+
+from app.shared.enums.order_status import OrderStatus
+from tests.integration.factories import seed_catalog, seed_orders
+
+# SELECT dos pedidos + SELECT ... IN dos itens (com JOIN em produtos)
+MAX_READ_QUERIES = 2
+# Leituras condicionais consultam antes a versão do recurso (ETag)
+VERSION_QUERIES = 1
+
+
+def get_query_count(api_client, count_queries, method: str, url: str) -> int:
+    with count_queries() as counter:
+        response = api_client.request(method, url)
+    assert response.status_code == 200, response.text
+    return counter.count
+
+
+@pytest.mark.parametrize("url", [
+    "/api/orders",
+    "/api/orders/status/Recebido",
+    "/api/orders/client/{client_id}",
+])
+def test_order_listing_query_count_is_constant(api_client, db_session, count_queries, url):
+    client_id, product_ids = seed_catalog(db_session)
+    url = url.format(client_id=client_id)
+
+    seed_orders(db_session, client_id, product_ids, n_orders=2)
+    small = get_query_count(api_client, count_queries, "GET", url)
+
+    seed_orders(db_session, client_id, product_ids, n_orders=20)
+    large = get_query_count(api_client, count_queries, "GET", url)
+
+    assert small == large
+    assert large <= MAX_READ_QUERIES
+
+
+def test_get_order_by_id_does_not_lazy_load_items(api_client, db_session, count_queries):
+    client_id, product_ids = seed_catalog(db_session, n_products=10)
+    seed_orders(db_session, client_id, product_ids, n_orders=1)
+
+    assert get_query_count(api_client, count_queries, "GET", "/api/orders/1") <= MAX_READ_QUERIES + VERSION_QUERIES
+
+
+def test_update_order_status_does_not_lazy_load_items(api_client, db_session, count_queries):
+    client_id, product_ids = seed_catalog(db_session, n_products=10)
+    seed_orders(db_session, client_id, product_ids, n_orders=1)
+
+    with count_queries() as counter:
+        response = api_client.patch("/api/orders/1/status", params={"new_status": "Em Preparação"})
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == OrderStatus.IN_PROGRESS.value
+    assert all(item["name"].startswith("Produto") for item in response.json()["items"])
+
+    # find_by_id + pagamento + releitura do pedido para atualização
+    selects = [s for s in counter.statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) <= 2 * MAX_READ_QUERIES + 1
@@ -0,0 +1,60 @@
+import json
+
+from app.devices.db.models import OrderModel
+from app.shared.enums.order_status import OrderStatus
+from tests.integration.factories import seed_catalog, seed_orders
+
+
+def collect_pages(api_client, url: str, limit: int) -> list:
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = api_client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert len(body["items"]) <= limit
+        ids.extend(order["id"] for order in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def test_active_orders_keyset_pages_follow_board_order(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=7)
+    statuses = {2: OrderStatus.READY, 5: OrderStatus.IN_PROGRESS, 6: OrderStatus.COMPLETED}
+    for order_id, status in statuses.items():
+        db_session.get(OrderModel, order_id).status = status
+    db_session.commit()
+
+    assert collect_pages(api_client, "/api/orders", limit=2) == [2, 5, 1, 3, 4, 7]
+
+
+def test_status_and_client_pages_cover_every_order_once(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=5)
+
+    assert collect_pages(api_client, "/api/orders/status/Recebido", limit=2) == [1, 2, 3, 4, 5]
+    assert collect_pages(api_client, f"/api/orders/client/{client_id}", limit=3) == [1, 2, 3, 4, 5]
+
+
+def test_invalid_cursor_returns_400(api_client):
+    response = api_client.get("/api/orders", params={"cursor": "não-é-um-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor inválido."
+
+
+def test_ndjson_stream_returns_one_order_per_line(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session)
+    seed_orders(db_session, client_id, product_ids, n_orders=4)
+
+    response = api_client.get(f"/api/orders/client/{client_id}", params={"stream": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    orders = [json.loads(line) for line in response.text.splitlines()]
+    assert [order["id"] for order in orders] == [1, 2, 3, 4]
+    assert all(len(order["items"]) == len(product_ids) for order in orders)
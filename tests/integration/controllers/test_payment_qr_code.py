@@ -0,0 +1,46 @@
+from app.devices.db.models import OrderModel, PaymentModel
+from app.shared.enums.order_status import OrderStatus
+from app.shared.enums.payment_status import PaymentStatus
+from app.shared.generate_qr_data import generate_qr_data
+from tests.integration.factories import seed_catalog
+
+
+def seed_payment(db_session) -> int:
+    client_id, _ = seed_catalog(db_session, n_products=1)
+    order = OrderModel(client_id=client_id, status=OrderStatus.RECEIVED, amount=25.0)
+    db_session.add(order)
+    db_session.flush()
+    db_session.add(PaymentModel(order_id=order.id, status=PaymentStatus.PENDING, amount=25.0,
+                                qr_code=generate_qr_data(order.id, 25.0)))
+    db_session.commit()
+    return order.id
+
+
+def test_qr_code_is_rendered_once_and_served_from_cache(api_client, db_session, count_queries):
+    order_id = seed_payment(db_session)
+
+    first = api_client.get(f"/api/orders/{order_id}/payment_qrcode")
+    with count_queries() as counter:
+        second = api_client.get(f"/api/orders/{order_id}/payment_qrcode")
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "image/png"
+    assert "immutable" in first.headers["cache-control"]
+    assert second.content == first.content
+    assert counter.count == 0
+
+
+def test_matching_etag_returns_304(api_client, db_session):
+    order_id = seed_payment(db_session)
+    etag = api_client.get(f"/api/orders/{order_id}/payment_qrcode", params={"format": "svg"}).headers["etag"]
+
+    response = api_client.get(f"/api/orders/{order_id}/payment_qrcode", params={"format": "svg"},
+                              headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_unknown_order_and_format(api_client):
+    assert api_client.get("/api/orders/999/payment_qrcode").status_code == 404
+    assert api_client.get("/api/orders/1/payment_qrcode", params={"format": "gif"}).status_code == 422
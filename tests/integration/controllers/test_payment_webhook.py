@@ -0,0 +1,169 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.adapters.gateways.payment import PaymentRepository
+from app.core.usecases.payment.update_payment_status_service import build_status_change
+from app.devices.db.models import OrderModel, PaymentModel, PaymentWebhookEventModel
+from app.shared.enums.order_status import OrderStatus
+from app.shared.enums.payment_change_outcome import PaymentChangeOutcome
+from app.shared.enums.payment_status import PaymentStatus
+from tests.integration.factories import seed_catalog
+
+
+def seed_pending_payments(db_session, n_orders: int) -> list:
+    client_id, _ = seed_catalog(db_session, n_products=1)
+    order_ids = []
+    for _ in range(n_orders):
+        order = OrderModel(client_id=client_id, status=OrderStatus.RECEIVED, amount=10.0)
+        db_session.add(order)
+        db_session.flush()
+        db_session.add(PaymentModel(order_id=order.id, status=PaymentStatus.PENDING, amount=10.0))
+        order_ids.append(order.id)
+    db_session.commit()
+    return order_ids
+
+
+def payment_of(db_session, order_id: int) -> PaymentModel:
+    db_session.expire_all()
+    return db_session.query(PaymentModel).filter(PaymentModel.order_id == order_id).one()
+
+
+def test_webhook_updates_payment_in_a_single_statement(api_client, db_session, count_queries):
+    [order_id] = seed_pending_payments(db_session, 1)
+
+    with count_queries() as counter:
+        response = api_client.post("/api/webhooks/payment", json={
+            "order_id": order_id, "payment_status": "Pago", "idempotency_key": "evt-1",
+        })
+
+    assert response.status_code == 200
+    assert response.json()["payment_status"] == "Pago"
+    assert counter.count == 1
+    payment = payment_of(db_session, order_id)
+    assert payment.status == PaymentStatus.PAID and payment.payment_date is not None
+
+
+def test_redelivered_webhook_is_not_reapplied(api_client, db_session):
+    [order_id] = seed_pending_payments(db_session, 1)
+    headers = {"Idempotency-Key": "evt-1"}
+
+    api_client.post("/api/webhooks/payment", json={"order_id": order_id, "payment_status": "Pago"}, headers=headers)
+    paid_at = payment_of(db_session, order_id).payment_date
+    # Entrega atrasada de uma notificação antiga com a mesma chave
+    response = api_client.post("/api/webhooks/payment", headers=headers, json={
+        "order_id": order_id, "payment_status": "Falha",
+    })
+
+    assert response.status_code == 200
+    assert response.json()["payment_status"] == "Pago"
+    payment = payment_of(db_session, order_id)
+    assert payment.status == PaymentStatus.PAID and payment.payment_date == paid_at
+    assert db_session.query(PaymentWebhookEventModel).count() == 1
+
+
+def test_webhook_for_order_without_payment_is_404_and_does_not_store_the_key(api_client, db_session):
+    response = api_client.post("/api/webhooks/payment", json={
+        "order_id": 999, "payment_status": "Pago", "idempotency_key": "evt-1",
+    })
+
+    assert response.status_code == 404
+    assert db_session.query(PaymentWebhookEventModel).count() == 0
+
+
+def test_batch_applies_all_changes_in_one_statement_and_reports_each_order(api_client, db_session, count_queries):
+    first, second, third = seed_pending_payments(db_session, 3)
+    api_client.post("/api/webhooks/payment", json={"order_id": third, "payment_status": "Pago", "idempotency_key": "evt-3"})
+
+    with count_queries() as counter:
+        response = api_client.post("/api/webhooks/payment/batch", json={"notifications": [
+            {"order_id": first, "payment_status": "Pago", "idempotency_key": "evt-1"},
+            {"order_id": second, "payment_status": "Falha", "description": "Cartão recusado"},
+            {"order_id": third, "payment_status": "Falha", "idempotency_key": "evt-3"},
+            {"order_id": 999, "payment_status": "Pago", "idempotency_key": "evt-999"},
+        ]})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"order_id": first, "result": "updated", "payment_status": "Pago"},
+        {"order_id": second, "result": "updated", "payment_status": "Falha"},
+        {"order_id": third, "result": "duplicate", "payment_status": "Pago"},
+        {"order_id": 999, "result": "not_found", "payment_status": None},
+    ]
+    assert counter.count == 1
+    assert payment_of(db_session, second).description == "Cartão recusado"
+    assert payment_of(db_session, second).payment_date is None
+    assert payment_of(db_session, third).status == PaymentStatus.PAID
+
+
+def test_batch_rejects_repeated_orders(api_client, db_session):
+    [order_id] = seed_pending_payments(db_session, 1)
+
+    response = api_client.post("/api/webhooks/payment/batch", json={"notifications": [
+        {"order_id": order_id, "payment_status": "Pago"},
+        {"order_id": order_id, "payment_status": "Falha"},
+    ]})
+
+    assert response.status_code == 400
+    assert payment_of(db_session, order_id).status == PaymentStatus.PENDING
+
+
+def test_batch_rejects_repeated_idempotency_keys(api_client, db_session):
+    first, second = seed_pending_payments(db_session, 2)
+
+    response = api_client.post("/api/webhooks/payment/batch", json={"notifications": [
+        {"order_id": first, "payment_status": "Pago", "idempotency_key": "evt-1"},
+        {"order_id": second, "payment_status": "Pago", "idempotency_key": "evt-1"},
+    ]})
+
+    assert response.status_code == 400
+    assert payment_of(db_session, second).status == PaymentStatus.PENDING
+
+
+def test_idempotency_key_only_applies_to_the_order_it_was_stored_for(db_session):
+    first, second = seed_pending_payments(db_session, 2)
+
+    results = PaymentRepository(db_session).apply_status_changes([
+        build_status_change(first, PaymentStatus.PAID, None, "evt-1"),
+        build_status_change(second, PaymentStatus.PAID, None, "evt-1"),
+    ])
+
+    assert [r.outcome for r in results] == [PaymentChangeOutcome.UPDATED, PaymentChangeOutcome.DUPLICATE]
+    assert payment_of(db_session, first).status == PaymentStatus.PAID
+    assert payment_of(db_session, second).status == PaymentStatus.PENDING
+
+
+def test_long_poll_returns_when_webhook_changes_the_status(api_client, db_session):
+    [order_id] = seed_pending_payments(db_session, 1)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        started = time.monotonic()
+        waiting = executor.submit(api_client.get, f"/api/orders/{order_id}/payment_status", params={"wait": 10})
+        time.sleep(0.2)
+        api_client.post("/api/webhooks/payment", json={"order_id": order_id, "payment_status": "Pago"})
+        response = waiting.result(timeout=10)
+
+    assert response.status_code == 200
+    assert response.json()["payment_status"] == "Pago"
+    assert time.monotonic() - started < 5
+
+
+def test_long_poll_times_out_with_pending_status(api_client, db_session):
+    [order_id] = seed_pending_payments(db_session, 1)
+
+    response = api_client.get(f"/api/orders/{order_id}/payment_status", params={"wait": 0.2})
+
+    assert response.status_code == 200
+    assert response.json()["payment_status"] == "Pendente"
+    assert api_client.get("/api/orders/999/payment_status", params={"wait": 1}).status_code == 404
+
+
+def test_long_poll_on_async_stack(async_api_client, db_session):
+    [order_id] = seed_pending_payments(db_session, 1)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        waiting = executor.submit(async_api_client.get, f"/api/orders/{order_id}/payment_status", params={"wait": 10})
+        time.sleep(0.2)
+        async_api_client.post("/api/webhooks/payment", json={"order_id": order_id, "payment_status": "Falha"})
+        response = waiting.result(timeout=10)
+
+    assert response.json()["payment_status"] == "Falha"
@@ -0,0 +1,64 @@
+from app.adapters.dependencies import internal
+from app.adapters.dependencies.auth import get_current_user
+from app.devices.db.models import ProductModel
+from tests.integration.factories import seed_catalog
+
+
+def test_product_update_invalidates_cached_catalog(api_client, db_session, monkeypatch):
+    _, product_ids = seed_catalog(db_session, n_products=1)
+    assert api_client.get("/api/products").json()[0]["price"] == 10.0
+    assert api_client.get("/api/products").status_code == 200
+
+    response = api_client.put(f"/api/products/{product_ids[0]}", json={
+        "name": "Produto 0", "description": "", "price": 12.5, "category": "Lanche", "quantity_available": 100,
+    })
+    assert response.status_code == 200, response.text
+
+    assert api_client.get("/api/products").json()[0]["price"] == 12.5
+    monkeypatch.setattr(internal, "INTERNAL_API_TOKEN", "segredo-interno")
+    stats = api_client.get("/internal/cache/products", headers={"X-Internal-Token": "segredo-interno"}).json()
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 2
+
+
+def test_orders_use_current_price_and_stock_not_the_cached_catalog(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session, n_products=1)
+    product = db_session.get(ProductModel, product_ids[0])
+    product.quantity_available = 0
+    db_session.commit()
+    assert api_client.get("/api/products").json()[0]["quantity_available"] == 0
+
+    # Reposição e reajuste feitos por outro processo: o cache deste não é limpo
+    product.quantity_available = 3
+    product.price = 15.0
+    db_session.commit()
+
+    api_client.app.dependency_overrides[get_current_user] = lambda: {"user_id": client_id}
+    try:
+        response = api_client.post("/api/orders", json={"items": [{"product_id": product_ids[0], "quantity": 2}]})
+    finally:
+        api_client.app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 201, response.text
+    assert response.json()["amount"] == 30.0
+
+
+def test_sales_keep_the_catalog_version_until_a_product_sells_out(api_client, db_session):
+    client_id, product_ids = seed_catalog(db_session, n_products=1)
+    product = db_session.get(ProductModel, product_ids[0])
+    product.quantity_available = 3
+    db_session.commit()
+    etag = api_client.get("/api/products").headers["ETag"]
+
+    api_client.app.dependency_overrides[get_current_user] = lambda: {"user_id": client_id}
+    try:
+        order = {"items": [{"product_id": product_ids[0], "quantity": 1}]}
+        assert api_client.post("/api/orders", json=order).status_code == 201
+        assert api_client.get("/api/products", headers={"If-None-Match": etag}).status_code == 304
+
+        order["items"][0]["quantity"] = 2
+        assert api_client.post("/api/orders", json=order).status_code == 201
+    finally:
+        api_client.app.dependency_overrides.pop(get_current_user, None)
+
+    assert api_client.get("/api/products", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,95 @@
+import json
+
+from app.devices.db.models import ProductModel
+from tests.integration.factories import seed_catalog
+
+
+def product(name: str, price: float = 10.0, quantity: int = 100, category: str = "Lanche") -> dict:
+    return {"name": name, "description": "", "price": price, "category": category, "quantity_available": quantity}
+
+
+def test_bulk_upsert_creates_updates_and_deactivates_in_one_statement(api_client, db_session, count_queries):
+    seed_catalog(db_session, n_products=3)
+    unchanged_at = db_session.query(ProductModel.updated_at).filter(ProductModel.name == "Produto 0").scalar()
+    catalog = [product("Produto 0"), product("Produto 1", price=12.5), product("Suco", category="Bebida")]
+
+    with count_queries() as counter:
+        response = api_client.post("/api/products/bulk", json=catalog)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert {key: body[key] for key in ("received", "created", "updated", "unchanged", "deactivated")} == {
+        "received": 3, "created": 1, "updated": 1, "unchanged": 1, "deactivated": 1,
+    }
+    assert sorted((c["name"], c["change"]) for c in body["changes"]) == [
+        ("Produto 1", "updated"), ("Produto 2", "deactivated"), ("Suco", "created"),
+    ]
+    assert counter.count == 1
+
+    db_session.expire_all()
+    rows = {p.name: p for p in db_session.query(ProductModel)}
+    assert rows["Produto 1"].price == 12.5
+    assert rows["Produto 2"].active is False
+    assert rows["Produto 0"].updated_at == unchanged_at
+    assert rows["Suco"].active is True
+
+
+def test_bulk_upsert_reactivates_and_refreshes_cached_catalog(api_client, db_session):
+    seed_catalog(db_session, n_products=2)
+    assert len(api_client.get("/api/products").json()) == 2
+
+    api_client.post("/api/products/bulk", json=[product("Produto 0")])
+    assert [p["name"] for p in api_client.get("/api/products").json()] == ["Produto 0"]
+
+    response = api_client.post("/api/products/bulk?deactivate_missing=false", json=[product("Produto 1", price=9.0)])
+    assert response.json()["changes"][0]["change"] == "updated"
+    assert sorted(p["name"] for p in api_client.get("/api/products").json()) == ["Produto 0", "Produto 1"]
+
+
+def test_bulk_upsert_accepts_ndjson_stream(api_client, db_session):
+    lines = [json.dumps(product(f"Item {i}")) for i in range(50)]
+
+    def body():
+        for i in range(0, len(lines), 7):
+            yield ("\n".join(lines[i:i + 7]) + "\n").encode()
+
+    response = api_client.post("/api/products/bulk", content=body(), headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 50
+    assert db_session.query(ProductModel).count() == 50
+
+
+def test_bulk_upsert_reports_invalid_ndjson_line(api_client):
+    body = json.dumps(product("Ok")) + "\n" + json.dumps({"name": "Sem preço", "category": "Lanche"}) + "\n"
+
+    response = api_client.post("/api/products/bulk", content=body, headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.status_code == 422
+    assert {tuple(error["loc"]) for error in response.json()["detail"]} >= {("body", 2, "price")}
+
+
+def test_bulk_upsert_rejects_repeated_names(api_client, db_session):
+    response = api_client.post("/api/products/bulk", json=[product("Suco"), product("Suco", price=5.0)])
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Produto repetido no catálogo: Suco."
+    assert db_session.query(ProductModel).count() == 0
+
+
+def test_async_bulk_upsert(async_api_client, db_session):
+    seed_catalog(db_session, n_products=1)
+
+    response = async_api_client.post("/api/products/bulk", json=[product("Produto 0", quantity=3), product("Suco")])
+
+    assert response.status_code == 200, response.text
+    assert (response.json()["created"], response.json()["updated"], response.json()["deactivated"]) == (1, 1, 0)
+
+
+def test_create_product_rejects_existing_name(api_client, db_session):
+    seed_catalog(db_session, n_products=1)
+
+    response = api_client.post("/api/products", json=product("Produto 0"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Já existe um produto com este nome."
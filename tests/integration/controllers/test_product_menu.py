@@ -0,0 +1,37 @@
+from app.devices.db.models import ProductModel
+from app.shared.enums.categorys import CategoryEnum
+
+
+def add_products(db_session):
+    db_session.add_all([
+        ProductModel(name="X-Burger", description="", price=20.0, category=CategoryEnum.LUNCH, quantity_available=5),
+        ProductModel(name="Antigo", description="", price=15.0, category=CategoryEnum.LUNCH,
+                     quantity_available=5, active=False),
+        ProductModel(name="Batata", description="", price=8.0, category=CategoryEnum.SIDES, quantity_available=5),
+    ])
+    db_session.commit()
+
+
+def test_category_listing_excludes_inactive_products(api_client, db_session):
+    add_products(db_session)
+
+    response = api_client.get("/api/products/category/Lanche")
+
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == ["X-Burger"]
+
+
+def test_menu_groups_active_products_in_one_query(api_client, db_session, count_queries):
+    add_products(db_session)
+
+    with count_queries() as counter:
+        response = api_client.get("/api/products/menu")
+
+    assert response.status_code == 200
+    # Versão do catálogo (ETag) + o SELECT do cardápio
+    assert counter.count == 2
+    menu = response.json()
+    assert list(menu) == [category.value for category in CategoryEnum]
+    assert [p["name"] for p in menu["Lanche"]] == ["X-Burger"]
+    assert [p["name"] for p in menu["Acompanhamento"]] == ["Batata"]
+    assert menu["Bebida"] == menu["Sobremesa"] == []
@@ -0,0 +1,32 @@
+from app.devices.db.models import ClientModel, OrderItemModel, OrderModel, PaymentModel, ProductModel
+from app.shared.enums.categorys import CategoryEnum
+from app.shared.enums.order_status import OrderStatus
+from app.shared.enums.payment_status import PaymentStatus
+
+
+def seed_catalog(db_session, n_products: int = 3):
+    """Cria um cliente e `n_products` produtos. Retorna (client_id, product_ids)."""
+    client = ClientModel(name="Cliente", email="cliente@example.com", cpf="52998224725")
+    products = [
+        ProductModel(name=f"Produto {i}", description="", price=10.0,
+                     category=CategoryEnum.LUNCH, quantity_available=100)
+        for i in range(n_products)
+    ]
+    db_session.add(client)
+    db_session.add_all(products)
+    db_session.commit()
+    return client.id, [p.id for p in products]
+
+
+def seed_orders(db_session, client_id: int, product_ids: list, n_orders: int) -> None:
+    """Cria `n_orders` pedidos pagos com um item para cada produto informado."""
+    for _ in range(n_orders):
+        order = OrderModel(client_id=client_id, status=OrderStatus.RECEIVED, amount=30.0)
+        db_session.add(order)
+        db_session.flush()
+        db_session.add_all(
+            OrderItemModel(order_id=order.id, product_id=product_id, quantity=1, price=10.0)
+            for product_id in product_ids
+        )
+        db_session.add(PaymentModel(order_id=order.id, status=PaymentStatus.PAID, amount=30.0))
+    db_session.commit()
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func
+
+from app.adapters.dependencies.auth import get_current_user
+from app.adapters.gateways.cached_client import client_id_cache
+from app.adapters.gateways.client import ClientRepository
+from app.core.entities.client import Client
+from app.devices.db.models import BaseUserModel, ClientModel
+from app.shared.enums.user_type import UserType
+from app.shared.handles.jwt_user import create_access_token
+
+CPF = "52998224725"
+THREADS = 16
+
+
+def new_client(cpf: str = CPF) -> Client:
+    return Client(id=None, name="Cliente", email=f"{cpf}@example.com", cpf=cpf)
+
+
+def test_first_access_creates_client_in_one_statement(db_session, count_queries):
+    repository = ClientRepository(db_session)
+
+    with count_queries() as counter:
+        client_id = repository.get_or_create_id(new_client())
+
+    assert counter.count == 1
+    client_id_cache.clear()
+    assert repository.get_or_create_id(new_client()) == client_id
+    assert repository.find_by_cpf(CPF).id == client_id
+
+
+def test_cpf_of_non_client_user_is_rejected(db_session):
+    db_session.add(BaseUserModel(name="Admin", email="admin@example.com", cpf=CPF, user_type=UserType.ADMIN))
+    db_session.commit()
+
+    with pytest.raises(ValueError):
+        ClientRepository(db_session).get_or_create_id(new_client())
+
+
+def test_concurrent_first_requests_create_a_single_client(db_session, session_factory):
+    token = create_access_token({"cpf": CPF, "name": "Cliente", "email": "cliente@example.com"})
+    user_ids, errors = [], []
+    lock, start = threading.Lock(), threading.Barrier(THREADS)
+
+    def authenticate():
+        session = session_factory()
+        try:
+            start.wait()
+            user_id = get_current_user(token=token, db=session)["user_id"]
+            with lock:
+                user_ids.append(user_id)
+        except (Exception, HTTPException) as e:
+            with lock:
+                errors.append(e)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=authenticate) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(user_ids) == THREADS and len(set(user_ids)) == 1
+    assert db_session.query(func.count(BaseUserModel.id)).scalar() == 1
+    assert db_session.query(func.count(ClientModel.id)).scalar() == 1
@@ -0,0 +1,30 @@
+from app.adapters.gateways.order import OrderRepository
+from app.core.entities.item import OrderItem
+from app.core.entities.order import Order
+from app.devices.db.models import OrderItemModel
+from tests.integration.factories import seed_catalog
+
+# INSERT do pedido + INSERT de várias linhas dos itens (+ COMMIT, que não passa pelo cursor)
+MAX_CREATE_QUERIES = 2
+
+
+def test_create_order_with_many_items_uses_constant_queries(db_session, count_queries):
+    client_id, product_ids = seed_catalog(db_session, n_products=150)
+    order = Order(
+        client_id=client_id,
+        amount=1500.0,
+        items=[OrderItem(product_id=pid, quantity=i + 1, price=10.0) for i, pid in enumerate(product_ids)],
+    )
+
+    with count_queries() as counter:
+        created = OrderRepository(db_session).create(order)
+
+    assert counter.count <= MAX_CREATE_QUERIES
+    assert created.id is not None
+    assert [item.product_id for item in created.items] == product_ids
+
+    stored = {
+        item.id: (item.product_id, item.quantity)
+        for item in db_session.query(OrderItemModel).filter_by(order_id=created.id)
+    }
+    assert stored == {item.id: (item.product_id, item.quantity) for item in created.items}
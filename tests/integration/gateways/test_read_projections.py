@@ -0,0 +1,38 @@
+from app.adapters.gateways.client import ClientRepository
+from app.adapters.gateways.order import OrderRepository
+from app.adapters.gateways.product import ProductRepository
+from tests.integration.factories import seed_catalog, seed_orders
+
+# SELECT dos pedidos + SELECT ... IN dos itens com o nome do produto
+ORDER_LIST_QUERIES = 2
+
+
+def test_list_queries_map_rows_without_loading_models(db_session, count_queries):
+    client_id, product_ids = seed_catalog(db_session, n_products=3)
+    seed_orders(db_session, client_id, product_ids, n_orders=5)
+    db_session.expunge_all()
+
+    with count_queries() as counter:
+        orders = OrderRepository(db_session).find_all()
+    products = ProductRepository(db_session).find_all()
+    clients = ClientRepository(db_session).find_all()
+
+    assert counter.count == ORDER_LIST_QUERIES
+    assert len(orders) == 5
+    assert [item.name for item in orders[0].items] == ["Produto 0", "Produto 1", "Produto 2"]
+    assert [p.id for p in products] == product_ids
+    assert [c.cpf for c in clients] == ["52998224725"]
+    # Nenhum model entrou no identity map e as entidades não carregam __dict__
+    assert len(db_session.identity_map) == 0
+    assert not hasattr(orders[0], "__dict__") and not hasattr(orders[0].items[0], "__dict__")
+
+
+def test_stream_loads_items_per_batch(db_session):
+    client_id, product_ids = seed_catalog(db_session, n_products=2)
+    seed_orders(db_session, client_id, product_ids, n_orders=7)
+
+    orders = list(OrderRepository(db_session).stream_by_client(client_id, batch_size=3))
+
+    assert [order.id for order in orders] == sorted(order.id for order in orders)
+    assert len(orders) == 7
+    assert all(len(order.items) == 2 for order in orders)
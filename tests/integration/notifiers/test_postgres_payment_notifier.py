@@ -0,0 +1,64 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.adapters.notifiers import payment_status_notifier as notifier_module
+from app.adapters.notifiers.payment_status_notifier import PostgresPaymentStatusNotifier
+
+
+def test_notify_from_another_process_wakes_local_waiters(engine):
+    url = engine.url.render_as_string(hide_password=False)
+    listener = PostgresPaymentStatusNotifier(url, engine)
+    # Outra réplica: publica sem escutar
+    publisher = PostgresPaymentStatusNotifier(url, engine)
+
+    async def scenario():
+        await listener.start()
+        try:
+            subscription, other = listener.subscribe(7), listener.subscribe(8)
+            await asyncio.get_running_loop().run_in_executor(None, publisher.publish, [7, 9])
+            return await subscription.wait(5), await other.wait(0.2), listener.stats()["listening"]
+        finally:
+            await listener.stop()
+
+    assert asyncio.run(scenario()) == (True, False, True)
+
+
+def test_raw_notify_payload_is_parsed(engine):
+    listener = PostgresPaymentStatusNotifier(engine.url.render_as_string(hide_password=False), engine)
+
+    async def scenario():
+        await listener.start()
+        try:
+            subscription = listener.subscribe(42)
+            with engine.begin() as conn:
+                conn.execute(text("SELECT pg_notify('payment_status', '41,42')"))
+            return await subscription.wait(5)
+        finally:
+            await listener.stop()
+
+    assert asyncio.run(scenario()) is True
+
+
+def test_listener_reconnects_after_the_connection_is_killed(engine, monkeypatch):
+    monkeypatch.setattr(notifier_module, "PAYMENT_NOTIFY_RETRY_MIN_SECONDS", 0.05)
+    listener = PostgresPaymentStatusNotifier(engine.url.render_as_string(hide_password=False), engine)
+
+    async def scenario():
+        await listener.start()
+        try:
+            waiting = listener.subscribe(5)
+            pid = listener._listener.get_server_pid()
+            with engine.begin() as conn:
+                conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+            # Quem esperava durante a queda é acordado para reler o banco
+            woken_on_reconnect = await waiting.wait(5)
+
+            subscription = listener.subscribe(6)
+            with engine.begin() as conn:
+                conn.execute(text("SELECT pg_notify('payment_status', '6')"))
+            return woken_on_reconnect, await subscription.wait(5), listener.stats()["reconnects"]
+        finally:
+            await listener.stop()
+
+    assert asyncio.run(scenario()) == (True, True, 1)
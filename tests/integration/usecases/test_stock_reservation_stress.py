@@ -0,0 +1,71 @@
+import threading
+import time
+
+from sqlalchemy import func
+
+from app.adapters.gateways.coupon import CouponRepository
+from app.adapters.gateways.order import OrderRepository
+from app.adapters.gateways.product import ProductRepository
+from app.core.schemas.order_schemas import OrderIn, OrderItemIn
+from app.core.usecases.orders.create_order_service import CreateOrderService
+from app.devices.db.models import OrderItemModel, OrderModel, ProductModel
+from app.shared.enums.categorys import CategoryEnum
+
+HOT_STOCK = 60
+SIDE_STOCK = 1000
+THREADS = 12
+ATTEMPTS_PER_THREAD = 10
+
+
+def place_orders(session_factory, hot_id: int, side_id: int, results: dict, lock: threading.Lock, start: threading.Barrier):
+    order_in = OrderIn(items=[OrderItemIn(product_id=hot_id, quantity=1), OrderItemIn(product_id=side_id, quantity=1)])
+    start.wait()
+    for _ in range(ATTEMPTS_PER_THREAD):
+        session = session_factory()
+        try:
+            service = CreateOrderService(OrderRepository(session), ProductRepository(session), CouponRepository(session))
+            service.execute(order_in, client_id=None)
+            outcome = "created"
+        except ValueError:
+            session.rollback()
+            outcome = "rejected"
+        except Exception:
+            session.rollback()
+            outcome = "errors"
+        finally:
+            session.close()
+        with lock:
+            results[outcome] += 1
+
+
+def test_concurrent_orders_never_oversell_hot_product(db_session, session_factory, record_property):
+    hot = ProductModel(name="X-Burger", description="", price=20.0, category=CategoryEnum.LUNCH, quantity_available=HOT_STOCK)
+    side = ProductModel(name="Batata", description="", price=8.0, category=CategoryEnum.SIDES, quantity_available=SIDE_STOCK)
+    db_session.add_all([hot, side])
+    db_session.commit()
+
+    results = {"created": 0, "rejected": 0, "errors": 0}
+    lock, start = threading.Lock(), threading.Barrier(THREADS)
+    threads = [
+        threading.Thread(target=place_orders, args=(session_factory, hot.id, side.id, results, lock, start))
+        for _ in range(THREADS)
+    ]
+    started_at = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started_at
+
+    db_session.expire_all()
+    sold = db_session.query(func.sum(OrderItemModel.quantity)).filter(OrderItemModel.product_id == hot.id).scalar()
+    assert results == {"created": HOT_STOCK, "rejected": THREADS * ATTEMPTS_PER_THREAD - HOT_STOCK, "errors": 0}
+    assert db_session.query(OrderModel).count() == HOT_STOCK
+    assert sold == HOT_STOCK
+    assert db_session.get(ProductModel, hot.id).quantity_available == 0
+    # Pedidos rejeitados não deixam baixa parcial nos demais itens
+    assert db_session.get(ProductModel, side.id).quantity_available == SIDE_STOCK - HOT_STOCK
+
+    orders_per_second = THREADS * ATTEMPTS_PER_THREAD / elapsed
+    record_property("orders_per_second", round(orders_per_second, 1))
+    print(f"\n{THREADS} threads, {THREADS * ATTEMPTS_PER_THREAD} tentativas em {elapsed:.2f}s: {orders_per_second:.1f} pedidos/s")
@@ -1,13 +1,13 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from app.core.schemas.client_schemas import ClientIn, ClientUpdateIn
 from main import app
 
 client = TestClient(app)
 
 # 🔹 POST /api/clients - sucesso
-@patch("app.adapters.controllers.client_controller.CreateClientService")
+@patch("app.adapters.controllers.client_controller.AsyncCreateClientService")
 def test_create_client_success(mock_service):
     mock_instance = mock_service.return_value
 
@@ -18,7 +18,7 @@ def test_create_client_success(mock_service):
     mock_client.cpf = "12345678900"
     mock_client.active = True
 
-    mock_instance.execute.return_value = mock_client
+    mock_instance.execute = AsyncMock(return_value=mock_client)
 
     response = client.post("/api/clients", json={
         "cpf": "12345678900",
@@ -31,10 +31,10 @@ def test_create_client_success(mock_service):
     assert response.json()["cpf"] == "123.456.789-00"
 
 # 🔹 POST /api/clients - CPF duplicado
-@patch("app.adapters.controllers.client_controller.CreateClientService")
+@patch("app.adapters.controllers.client_controller.AsyncCreateClientService")
 def test_create_client_cpf_duplicado(mock_service):
     mock_instance = mock_service.return_value
-    mock_instance.execute.side_effect = ValueError("CPF já cadastrado no sistema.")
+    mock_instance.execute = AsyncMock(side_effect=ValueError("CPF já cadastrado no sistema."))
 
     response = client.post("/api/clients", json={
         "cpf": "12345678900",
@@ -58,7 +58,7 @@ def test_get_client_by_cpf(mock_service):
     assert response.json()["jwt"] == "fake-jwt-token"
 
 # 🔹 PUT /api/clients/{cpf} - atualizar cliente
-@patch("app.adapters.controllers.client_controller.UpdateClientService")
+@patch("app.adapters.controllers.client_controller.AsyncUpdateClientService")
 def test_update_client_success(mock_service):
     mock_instance = mock_service.return_value
 
@@ -69,7 +69,7 @@ def test_update_client_success(mock_service):
     mock_client.cpf = "12345678900"
     mock_client.active = True
 
-    mock_instance.execute.return_value = mock_client
+    mock_instance.execute = AsyncMock(return_value=mock_client)
 
     response = client.put("/api/clients/12345678900", json={
         "name": "John Atualizado"
@@ -0,0 +1,37 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.dependencies import internal
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def internal_token(monkeypatch):
+    monkeypatch.setattr(internal, "INTERNAL_API_TOKEN", "segredo-interno")
+    return "segredo-interno"
+
+
+def test_db_pool_stats_are_exposed_for_both_engines(internal_token):
+    response = client.get("/internal/db/pool", headers={"X-Internal-Token": internal_token})
+
+    assert response.status_code == 200
+    body = response.json()
+    for stack in ("sync", "async"):
+        assert {"size", "checked_out", "overflow", "checkout_wait_ms", "connection_lifetime_s"} <= body[stack].keys()
+
+
+def test_internal_routes_require_the_internal_token(internal_token):
+    assert client.get("/internal/cache/products").status_code == 401
+    assert client.get("/internal/cache/products", headers={"X-Internal-Token": "errado"}).status_code == 401
+
+
+def test_internal_routes_are_disabled_without_a_configured_token(monkeypatch):
+    monkeypatch.setattr(internal, "INTERNAL_API_TOKEN", None)
+
+    assert client.get("/internal/db/pool", headers={"X-Internal-Token": ""}).status_code == 404
+
+
+def test_internal_routes_are_not_in_public_docs():
+    assert not any(path.startswith("/internal") for path in app.openapi()["paths"])
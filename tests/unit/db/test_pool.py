@@ -0,0 +1,35 @@
+from sqlalchemy import create_engine
+
+from app.devices.db.pool import Histogram, InstrumentedQueuePool, pool_stats
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == {"1": 2, "10": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == 56.5
+
+
+def test_instrumented_pool_reports_checkouts_and_lifetimes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=1, max_overflow=1)
+
+    first, second = engine.connect(), engine.connect()
+    stats = pool_stats(engine.pool)
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkout_wait_ms"]["count"] == 2
+
+    first.close()
+    second.close()
+    engine.dispose()
+
+    # Métricas sobrevivem à recriação do pool pelo dispose
+    stats = pool_stats(engine.pool)
+    assert stats["checked_out"] == 0
+    assert stats["connection_lifetime_s"]["count"] == 2
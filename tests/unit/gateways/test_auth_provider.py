@@ -0,0 +1,189 @@
+import asyncio
+import time
+
+import httpx
+import jwt
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.adapters.gateways.auth_provider import HttpAuthProvider, get_auth_provider
+from app.core.ports.auth_provider_port import AuthProviderUnavailableError
+from app.shared.circuit_breaker import CircuitBreaker
+
+CPF = "52998224725"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubAuthServer:
+    """Serviço de autenticação falso servido via ASGI (sem rede)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.status_code = 200
+        self.delay = 0.0
+        self.expires_in = 3600
+        self.app = FastAPI()
+
+        @self.app.post("/auth")
+        async def issue(body: dict):
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            if self.status_code != 200:
+                raise HTTPException(self.status_code, "stub")
+            payload = {"sub": body["cpf"], "exp": int(time.time()) + self.expires_in}
+            return {"token": jwt.encode(payload, "stub-secret", algorithm="HS256")}
+
+    def provider(self, **kwargs) -> HttpAuthProvider:
+        return HttpAuthProvider(
+            endpoint="http://auth.local/auth",
+            transport=httpx.ASGITransport(app=self.app),
+            **kwargs,
+        )
+
+
+@pytest.fixture
+def stub():
+    return StubAuthServer()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_issued_tokens_are_cached_per_cpf(stub):
+    provider = stub.provider()
+
+    async def scenario():
+        first = await provider.fetch_token(CPF)
+        second = await provider.fetch_token(CPF)
+        await provider.aclose()
+        return first, second
+
+    first, second = run(scenario())
+
+    assert first == second
+    assert stub.calls == 1
+
+
+def test_cache_ttl_never_outlives_the_token(stub):
+    stub.expires_in = 20
+    provider = stub.provider()
+
+    async def scenario():
+        await provider.fetch_token(CPF)
+        await provider.aclose()
+
+    run(scenario())
+
+    expires_at, _ = provider.cache._entries[CPF]
+    assert expires_at - provider.cache.clock() <= 20
+
+
+def test_concurrent_requests_for_same_cpf_share_one_upstream_call(stub):
+    stub.delay = 0.05
+    provider = stub.provider()
+
+    async def scenario():
+        tokens = await asyncio.gather(*(provider.fetch_token(CPF) for _ in range(10)))
+        await provider.aclose()
+        return tokens
+
+    tokens = run(scenario())
+
+    assert len(set(tokens)) == 1
+    assert stub.calls == 1
+
+
+def test_rejected_cpf_is_a_value_error_and_keeps_circuit_closed(stub):
+    stub.status_code = 404
+    provider = stub.provider(breaker=CircuitBreaker(failure_threshold=1))
+
+    async def scenario():
+        with pytest.raises(ValueError, match="não encontrado"):
+            await provider.fetch_token(CPF)
+        await provider.aclose()
+
+    run(scenario())
+
+    assert provider.breaker.state == "closed"
+
+
+def test_circuit_opens_on_upstream_errors_and_recovers(stub):
+    clock = FakeClock()
+    stub.status_code = 503
+    provider = stub.provider(breaker=CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock))
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(AuthProviderUnavailableError) as exc:
+                await provider.fetch_token(CPF)
+            assert exc.value.retry_after is None
+
+        # Aberto: falha sem chamar o serviço
+        with pytest.raises(AuthProviderUnavailableError) as exc:
+            await provider.fetch_token(CPF)
+        assert exc.value.retry_after == 30
+        assert stub.calls == 3
+
+        clock.now = 30
+        stub.status_code = 200
+        token = await provider.fetch_token(CPF)
+        await provider.aclose()
+        return token
+
+    assert run(scenario())
+    assert stub.calls == 4
+    assert provider.breaker.state == "closed"
+
+
+def test_unexpected_error_during_half_open_probe_does_not_wedge_the_circuit(stub):
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 30
+
+    def closed_client(request):
+        raise RuntimeError("Cannot send a request, as the client has been closed.")
+
+    failing = HttpAuthProvider(endpoint="http://auth.local/auth", transport=httpx.MockTransport(closed_client),
+                               breaker=breaker)
+    with pytest.raises(RuntimeError):
+        run(failing.fetch_token(CPF))
+    assert breaker.state == "open"
+
+    clock.now = 60
+    provider = stub.provider(breaker=breaker)
+
+    async def scenario():
+        token = await provider.fetch_token(CPF)
+        await provider.aclose()
+        return token
+
+    assert run(scenario())
+    assert breaker.state == "closed"
+
+
+def test_auth_route_returns_503_with_retry_after_while_circuit_is_open(stub):
+    from main import app
+
+    stub.status_code = 500
+    provider = stub.provider(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30))
+    app.dependency_overrides[get_auth_provider] = lambda: provider
+    try:
+        with TestClient(app) as client:
+            assert client.get(f"/api/clients/auth/{CPF}").status_code == 502
+            response = client.get(f"/api/clients/auth/{CPF}")
+    finally:
+        app.dependency_overrides.pop(get_auth_provider)
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) > 0
+    assert stub.calls == 1
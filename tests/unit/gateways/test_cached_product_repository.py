@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+from app.adapters.gateways.cached_product import CachedProductRepository
+from app.core.entities.product import Product
+from app.shared.enums.categorys import CategoryEnum
+from app.shared.ttl_cache import TTLCache
+
+
+def product(product_id: int) -> Product:
+    return Product(id=product_id, name=f"Produto {product_id}", description="", price=10.0,
+                   category=CategoryEnum.LUNCH, quantity_available=5)
+
+
+def make_repository():
+    inner = MagicMock()
+    inner.find_all.return_value = [product(1), product(2)]
+    inner.find_by_ids.side_effect = lambda ids: [product(i) for i in ids]
+    return CachedProductRepository(inner, TTLCache(maxsize=100, ttl=60)), inner
+
+
+def test_listing_is_served_from_memory_after_first_read():
+    repository, inner = make_repository()
+
+    repository.find_all()
+    products = repository.find_all()
+
+    assert [p.id for p in products] == [1, 2]
+    inner.find_all.assert_called_once()
+    assert (repository.cache.hits, repository.cache.misses) == (1, 1)
+
+
+def test_id_lookups_only_fetch_products_not_in_cache():
+    repository, inner = make_repository()
+    repository.find_all()
+
+    products = repository.find_by_ids([1, 3])
+
+    assert sorted(p.id for p in products) == [1, 3]
+    inner.find_by_ids.assert_called_once_with([3])
+    inner.find_by_id.assert_not_called()
+    assert repository.find_by_id(3).id == 3
+
+
+def test_callers_get_copies_of_cached_products():
+    repository, _ = make_repository()
+
+    repository.find_by_ids([1])[0].quantity_available -= 5
+
+    assert repository.find_by_id(1).quantity_available == 5
+
+
+def test_reserving_stock_drops_cached_id_entries():
+    repository, inner = make_repository()
+    inner.reserve_stock.return_value = []
+    repository.find_by_ids([1, 2])
+
+    repository.reserve_stock({1: 2})
+    repository.find_by_ids([1, 2])
+
+    assert inner.find_by_ids.call_args_list[-1].args == ([1],)
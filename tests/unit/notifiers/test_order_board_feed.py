@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+from app.adapters.notifiers.order_board_feed import OrderBoardFeed, RESYNC
+from app.core.entities.item import OrderItem
+from app.core.entities.order import Order
+from app.shared.enums.order_event_type import OrderEventType
+from app.shared.enums.order_status import OrderStatus
+
+
+def make_order(order_id: int, status: OrderStatus = OrderStatus.RECEIVED) -> Order:
+    return Order(id=order_id, status=status, amount=10.0,
+                 items=[OrderItem(product_id=1, quantity=1, price=10.0, name="X-Burger")])
+
+
+def test_publish_delivers_events_with_increasing_versions():
+    async def scenario():
+        feed = OrderBoardFeed()
+        subscription, version, missed = feed.subscribe()
+        feed.publish(OrderEventType.CREATED, make_order(1))
+        feed.publish(OrderEventType.STATUS_CHANGED, make_order(1, OrderStatus.IN_PROGRESS))
+        feed.publish(OrderEventType.REMOVED, make_order(1, OrderStatus.COMPLETED))
+        return version, missed, [await subscription.get(1) for _ in range(3)]
+
+    version, missed, events = asyncio.run(scenario())
+
+    assert version == 0 and missed is None
+    assert [(v, t) for v, t, _ in events] == [(1, "created"), (2, "status_changed"), (3, "removed")]
+    assert json.loads(events[1][2])["status"] == OrderStatus.IN_PROGRESS.value
+    assert json.loads(events[2][2]) == {"id": 1}
+
+
+def test_subscribe_resumes_from_last_version():
+    async def scenario():
+        feed = OrderBoardFeed()
+        for order_id in range(1, 6):
+            feed.publish(OrderEventType.CREATED, make_order(order_id))
+        return feed.subscribe(last_version=3), feed.subscribe(last_version=5)
+
+    (_, current, missed), (_, _, up_to_date) = asyncio.run(scenario())
+
+    assert current == 5
+    assert [event[0] for event in missed] == [4, 5]
+    assert up_to_date == []
+
+
+def test_subscribe_requires_snapshot_when_history_was_evicted_or_version_unknown():
+    async def scenario():
+        feed = OrderBoardFeed(history_size=2)
+        for order_id in range(1, 6):
+            feed.publish(OrderEventType.CREATED, make_order(order_id))
+        return feed.subscribe(last_version=1)[2], feed.subscribe(last_version=3)[2], feed.subscribe(last_version=99)[2]
+
+    evicted, resumable, unknown = asyncio.run(scenario())
+
+    assert evicted is None
+    assert [event[0] for event in resumable] == [4, 5]
+    assert unknown is None
+
+
+def test_slow_subscriber_is_asked_to_resync():
+    async def scenario():
+        feed = OrderBoardFeed(max_pending=2)
+        subscription, _, _ = feed.subscribe()
+        for order_id in range(1, 5):
+            feed.publish(OrderEventType.CREATED, make_order(order_id))
+        await asyncio.sleep(0)
+        return await subscription.get(1)
+
+    assert asyncio.run(scenario()) is RESYNC
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+from app.adapters.notifiers.payment_status_notifier import PaymentStatusNotifier, _notify_payloads
+
+
+def test_publish_wakes_only_subscribers_of_the_order():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        paid, other = notifier.subscribe(1), notifier.subscribe(2)
+        notifier.publish([1])
+        return await paid.wait(1), await other.wait(0.01)
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_publish_from_another_thread_wakes_the_event_loop():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        subscription = notifier.subscribe(1)
+        threading.Timer(0.05, notifier.publish, args=([1],)).start()
+        return await subscription.wait(2)
+
+    assert asyncio.run(scenario()) is True
+
+
+def test_unsubscribe_removes_the_waiter():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        subscription = notifier.subscribe(1)
+        during = notifier.stats()["waiting"]
+        notifier.unsubscribe(subscription)
+        return during, notifier.stats()
+
+    during, after = asyncio.run(scenario())
+
+    assert during == 1
+    assert after == {"backend": "memory", "orders": 0, "waiting": 0}
+
+
+def test_notify_payloads_stay_under_the_postgres_limit():
+    payloads = _notify_payloads(list(range(10**9, 10**9 + 1200)))
+
+    assert len(payloads) == 3
+    assert all(len(payload) < 8000 for payload in payloads)
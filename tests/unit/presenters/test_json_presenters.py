@@ -0,0 +1,63 @@
+import json
+from datetime import date
+
+from app.adapters.presenters.coupon.coupon_presenter import CouponPresenter
+from app.adapters.presenters.order.order_presenter import OrderPresenter
+from app.adapters.presenters.products.product_presenter import ProductPresenter
+from app.core.entities.coupon import Coupon
+from app.core.entities.item import OrderItem
+from app.core.entities.order import Order
+from app.core.entities.page import Page
+from app.core.entities.product import Product
+from app.shared.enums.categorys import CategoryEnum
+from app.shared.enums.order_status import OrderStatus
+
+
+def order(order_id: int) -> Order:
+    return Order(
+        id=order_id, client_id=None, status=OrderStatus.IN_PROGRESS, coupon_hash="PROMO",
+        items=[OrderItem(id=1, product_id=7, quantity=2, price=10, name="X-Burger")], amount=20,
+    )
+
+
+def product(product_id: int, category=CategoryEnum.LUNCH) -> Product:
+    return Product(id=product_id, name=f"Produto {product_id}", description=None, price=12.5,
+                   category=category, quantity_available=3)
+
+
+def test_order_page_json_matches_pydantic_output():
+    page = Page(items=[order(1), order(2)], next_cursor="abc")
+
+    expected = OrderPresenter.present_page(page).model_dump(mode="json")
+
+    assert json.loads(OrderPresenter.present_page_json(page)) == expected
+    # Inteiros vindos da entidade saem como float, igual ao schema
+    assert b'"amount":20.0' in OrderPresenter.present_page_json(page)
+
+
+def test_order_ndjson_line_matches_pydantic_output():
+    line = OrderPresenter.present_ndjson(order(1))
+
+    assert line.endswith(b"\n")
+    assert json.loads(line) == OrderPresenter.present(order(1)).model_dump(mode="json")
+
+
+def test_product_list_and_menu_json_match_pydantic_output():
+    products = [product(1), product(2)]
+    menu = {category: [] for category in CategoryEnum}
+    menu[CategoryEnum.LUNCH] = products
+
+    assert json.loads(ProductPresenter.present_list_json(products)) == \
+        [p.model_dump(mode="json") for p in ProductPresenter.present_list(products)]
+    assert json.loads(ProductPresenter.present_menu_json(menu)) == {
+        category.value: [p.model_dump(mode="json") for p in items]
+        for category, items in ProductPresenter.present_menu(menu).items()
+    }
+
+
+def test_coupon_list_json_matches_pydantic_output():
+    coupons = [Coupon(hash="PROMO", descricao="10%", discount_percentage=10, max_discount=5,
+                      expires_at=date(2030, 1, 31), active=True)]
+
+    assert json.loads(CouponPresenter.present_list_json(coupons)) == \
+        [c.model_dump(mode="json") for c in CouponPresenter.present_list(coupons)]
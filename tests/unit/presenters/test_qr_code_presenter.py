@@ -0,0 +1,30 @@
+import orjson
+import pytest
+
+from app.adapters.presenters.payment.qr_code_presenter import QrCodePresenter
+from app.shared.br_code import br_code_builder
+
+PAYLOAD = br_code_builder.build(42.0, "PEDIDO7")
+
+
+def test_png_and_svg_are_rendered():
+    png = QrCodePresenter.render(PAYLOAD, "png", 4)
+    svg = QrCodePresenter.render(PAYLOAD, "svg", 4)
+
+    assert png.media_type == "image/png" and png.body.startswith(b"\x89PNG")
+    assert svg.media_type == "image/svg+xml" and svg.body.startswith(b"<svg")
+
+
+def test_matrix_is_square_with_finder_pattern():
+    rows = orjson.loads(QrCodePresenter.render(PAYLOAD, "matrix", 1).body)["rows"]
+
+    assert len(rows) == len(rows[0])
+    assert rows[0].startswith("1111111") and rows[6].startswith("1111111")
+
+
+@pytest.mark.parametrize("fmt", ["png", "svg", "matrix"])
+def test_etag_is_strong_and_stable(fmt):
+    first, second = QrCodePresenter.render(PAYLOAD, fmt, 4), QrCodePresenter.render(PAYLOAD, fmt, 4)
+
+    assert first.etag == second.etag and not first.etag.startswith("W/")
+    assert first.body == second.body
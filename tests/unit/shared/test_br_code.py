@@ -0,0 +1,65 @@
+import pytest
+
+from app.shared.br_code import BrCodeBuilder, PixCharge, crc16_ccitt, order_txid
+
+# Exemplo do Manual de Padrões para Iniciação do Pix (BCB), com o CRC publicado
+BCB_EXAMPLE = (
+    "00020126580014br.gov.bcb.pix0136123e4567-e12b-12d1-a456-426655440000"
+    "5204000053039865802BR5913Fulano de Tal6008BRASILIA62070503***63041D3D"
+)
+
+
+def parse_tlv(payload: str) -> dict:
+    fields, i = {}, 0
+    while i < len(payload):
+        tag, size = payload[i:i + 2], int(payload[i + 2:i + 4])
+        fields[tag] = payload[i + 4:i + 4 + size]
+        i += 4 + size
+    return fields
+
+
+def test_crc_matches_reference_values():
+    assert crc16_ccitt(b"123456789") == 0x29B1
+    assert f"{crc16_ccitt(BCB_EXAMPLE[:-4].encode()):04X}" == BCB_EXAMPLE[-4:]
+
+
+def test_payload_fields_and_checksum():
+    builder = BrCodeBuilder("chave@exemplo.com", "Lanchonete São João", "São Paulo")
+
+    payload = builder.build(30.5, order_txid(123))
+    fields = parse_tlv(payload)
+
+    assert payload.startswith("000201")
+    assert parse_tlv(fields["26"]) == {"00": "br.gov.bcb.pix", "01": "chave@exemplo.com"}
+    assert fields["54"] == "30.50"
+    assert fields["59"] == "LANCHONETE SAO JOAO"
+    assert fields["60"] == "SAO PAULO"
+    assert parse_tlv(fields["62"]) == {"05": "PEDIDO123"}
+    assert fields["63"] == f"{crc16_ccitt(payload[:-4].encode()):04X}"
+
+
+def test_build_many_matches_single_builds():
+    builder = BrCodeBuilder()
+    charges = [PixCharge(amount=10.0 + i, txid=order_txid(i)) for i in range(1, 50)]
+
+    assert builder.build_many(charges) == [builder.build(c.amount, c.txid) for c in charges]
+
+
+@pytest.mark.parametrize("txid", ["", "PEDIDO-1", "X" * 26])
+def test_invalid_txid_is_rejected(txid):
+    with pytest.raises(ValueError):
+        BrCodeBuilder().build(10.0, txid)
+
+
+def test_zero_amount_omits_amount_field():
+    payload = BrCodeBuilder().build(0, order_txid(1))
+    fields = parse_tlv(payload)
+
+    assert "54" not in fields
+    assert fields["63"] == f"{crc16_ccitt(payload[:-4].encode()):04X}"
+
+
+@pytest.mark.parametrize("name, city", [("", "SAO PAULO"), ("Lanchonete", "   "), ("東京食堂", "SAO PAULO")])
+def test_merchant_without_ascii_characters_is_rejected(name, city):
+    with pytest.raises(ValueError):
+        BrCodeBuilder("chave@exemplo.com", name, city)
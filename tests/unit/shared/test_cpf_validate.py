@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from app.core.entities.client import Client
+from app.shared.validates.cpf_batch_validate import validate_cpfs
+from app.shared.validates.cpf_validate import is_cpf_valid
+
+
+@pytest.mark.parametrize("cpf, expected", [
+    ("52998224725", True),
+    ("529.982.247-25", True),
+    ("52998224724", False),
+    ("11111111111", False),
+    ("5299822472", False),
+    ("5299822472a", False),
+    ("5299822472²", False),
+    ("", False),
+])
+def test_scalar_validation(cpf, expected):
+    assert is_cpf_valid(cpf) is expected
+
+
+def test_batch_agrees_with_scalar_validation():
+    rng = random.Random(7)
+    cpfs = [str(rng.randrange(10**10, 10**11)) for _ in range(5000)]
+    cpfs += ["52998224725", "529.982.247-25", " 529 982 247 25 ", "00000000000", "123", "abcdefghijk", "5299822472²", ""]
+
+    result = validate_cpfs(cpfs)
+
+    assert result.dtype == bool and len(result) == len(cpfs)
+    assert result.tolist() == [is_cpf_valid(cpf) for cpf in cpfs]
+    assert 0 < result.sum() < len(cpfs)
+
+
+def test_empty_batch():
+    assert validate_cpfs([]).tolist() == []
+
+
+def test_client_rows_from_database_skip_revalidation():
+    assert Client(id=1, name="A", email="a@example.com", cpf="529.982.247-25").cpf == "52998224725"
+    with pytest.raises(ValueError):
+        Client(id=1, name="A", email="a@example.com", cpf="52998224724")
+
+    trusted = Client(id=1, name="A", email="a@example.com", cpf="52998224725", check_cpf=False)
+    assert trusted.cpf == "52998224725"
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.entities.product import Product
+from app.core.schemas.order_schemas import OrderIn, OrderItemIn
+from app.core.usecases.orders.create_order_service import CreateOrderService
+from app.shared.enums.categorys import CategoryEnum
+
+
+def make_service(products):
+    order_repo, product_repo, coupon_repo = MagicMock(), MagicMock(), MagicMock()
+    product_repo.find_by_ids.return_value = products
+    product_repo.reserve_stock.return_value = []
+    order_repo.create.side_effect = lambda order: order
+    return CreateOrderService(order_repo, product_repo, coupon_repo), product_repo
+
+
+def test_products_are_loaded_once_per_order():
+    burger = Product(id=1, name="X-Burger", description="", price=20.0, category=CategoryEnum.LUNCH, quantity_available=10)
+    soda = Product(id=2, name="Refrigerante", description="", price=5.0, category=CategoryEnum.DRINK, quantity_available=10)
+    service, product_repo = make_service([burger, soda])
+
+    order = service.execute(OrderIn(items=[
+        OrderItemIn(product_id=1, quantity=2),
+        OrderItemIn(product_id=2, quantity=1),
+        OrderItemIn(product_id=1, quantity=1),
+    ]), client_id=None)
+
+    product_repo.find_by_ids.assert_called_once_with([1, 2, 1])
+    product_repo.find_by_id.assert_not_called()
+    product_repo.reserve_stock.assert_called_once_with({1: 3, 2: 1})
+    product_repo.update.assert_not_called()
+    assert order.amount == 65.0
+    assert [item.name for item in order.items] == ["X-Burger", "Refrigerante", "X-Burger"]
+    assert burger.quantity_available == 7
+
+
+def test_missing_product_is_rejected():
+    service, _ = make_service([])
+
+    with pytest.raises(ValueError, match="Produto com ID 9 não encontrado."):
+        service.execute(OrderIn(items=[OrderItemIn(product_id=9, quantity=1)]), client_id=None)
+
+
+def test_order_is_rejected_when_reservation_loses_the_race():
+    burger = Product(id=1, name="X-Burger", description="", price=20.0, category=CategoryEnum.LUNCH, quantity_available=1)
+    service, product_repo = make_service([burger])
+    product_repo.reserve_stock.return_value = [1]
+
+    with pytest.raises(ValueError, match="Estoque insuficiente para o produto X-Burger."):
+        service.execute(OrderIn(items=[OrderItemIn(product_id=1, quantity=1)]), client_id=None)
+
+    service.order_repository.create.assert_not_called()
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.entities.client import Client
+from app.core.usecases.clients.login_client_service import AsyncLoginClientService, LoginClientService
+from app.shared.handles.password_hasher import BcryptPasswordHasher
+
+CPF = "52998224725"
+
+
+def make_service(stored_password: str, rounds: int = 4):
+    repository = MagicMock()
+    repository.find_by_cpf.return_value = Client(id=1, name="Cliente", email="c@example.com", cpf=CPF,
+                                                 password=stored_password)
+    repository.update.side_effect = lambda client: client
+    return LoginClientService(repository, BcryptPasswordHasher(rounds=rounds, workers=1)), repository
+
+
+def test_login_rehashes_when_cost_changes():
+    old_hash = BcryptPasswordHasher(rounds=4, workers=0).hash("segredo")
+    service, repository = make_service(old_hash, rounds=5)
+
+    assert service.execute(CPF, "segredo")
+
+    stored = repository.update.call_args.args[0].password
+    assert stored.startswith("$2b$05$")
+
+
+def test_login_with_current_cost_does_not_write():
+    service, repository = make_service(BcryptPasswordHasher(rounds=4, workers=0).hash("segredo"))
+
+    service.execute(CPF, "segredo")
+
+    repository.update.assert_not_called()
+
+
+def test_plaintext_password_is_migrated_and_wrong_password_rejected():
+    service, repository = make_service("segredo")
+
+    with pytest.raises(ValueError):
+        service.execute(CPF, "errada")
+    service.execute(CPF, "segredo")
+
+    assert repository.update.call_args.args[0].password.startswith("$2b$04$")
+
+
+def test_hashing_never_exceeds_pool_size():
+    hasher = BcryptPasswordHasher(rounds=4, workers=2)
+    running, peak, lock, thread_names = 0, 0, threading.Lock(), set()
+    original = hasher.context.hash
+
+    def tracked_hash(password):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+            thread_names.add(threading.current_thread().name)
+        try:
+            return original(password)
+        finally:
+            with lock:
+                running -= 1
+
+    hasher.context.hash = tracked_hash
+    threads = [threading.Thread(target=hasher.hash, args=("segredo",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak <= 2
+    assert all(name.startswith("password-hash") for name in thread_names)
+
+
+def test_async_login_awaits_the_pool_and_rehashes():
+    old_hash = BcryptPasswordHasher(rounds=4, workers=0).hash("segredo")
+    repository = AsyncMock()
+    repository.find_by_cpf.return_value = Client(id=1, name="Cliente", email="c@example.com", cpf=CPF,
+                                                 password=old_hash)
+    repository.update.side_effect = lambda client: client
+    service = AsyncLoginClientService(repository, BcryptPasswordHasher(rounds=5, workers=1))
+
+    assert asyncio.run(service.execute(CPF, "segredo"))
+    assert repository.update.call_args.args[0].password.startswith("$2b$05$")
+
+
+def test_async_hashes_queue_in_the_pool_without_extra_threads():
+    hasher = BcryptPasswordHasher(rounds=4, workers=2)
+    thread_names = set()
+    original = hasher.context.hash
+
+    def tracked_hash(password):
+        thread_names.add(threading.current_thread().name)
+        return original(password)
+
+    hasher.context.hash = tracked_hash
+
+    async def burst():
+        return await asyncio.gather(*(hasher.hash_async("segredo") for _ in range(8)))
+
+    threads_before = threading.active_count()
+    hashes = asyncio.run(burst())
+
+    assert len(hashes) == 8 and all(h.startswith("$2b$04$") for h in hashes)
+    assert all(name.startswith("password-hash") for name in thread_names)
+    assert threading.active_count() <= threads_before + 2
+
+
+def test_unknown_cpf_pays_for_a_bcrypt_verify():
+    hasher = BcryptPasswordHasher(rounds=4, workers=1)
+    verified = []
+    original = hasher.context.verify
+    hasher.context.verify = lambda password, hashed: verified.append(hashed) or original(password, hashed)
+    repository = MagicMock()
+    repository.find_by_cpf.return_value = None
+    async_repository = AsyncMock()
+    async_repository.find_by_cpf.return_value = None
+
+    with pytest.raises(ValueError, match="CPF ou senha inválidos"):
+        LoginClientService(repository, hasher).execute(CPF, "segredo")
+    with pytest.raises(ValueError, match="CPF ou senha inválidos"):
+        asyncio.run(AsyncLoginClientService(async_repository, hasher).execute(CPF, "segredo"))
+
+    assert len(verified) == 2 and all(h.startswith("$2b$04$") for h in verified)
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.entities.order import Order
+from app.core.ports.unit_of_work_port import UnitOfWorkPort
+from app.core.schemas.order_schemas import OrderIn, OrderItemIn
+from app.core.usecases.orders.place_order_service import PlaceOrderService
+from app.shared.enums.order_event_type import OrderEventType
+
+
+class FakeUnitOfWork(UnitOfWorkPort):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+
+def make_service(calls):
+    create_order, payment, publisher = MagicMock(), MagicMock(), MagicMock()
+    create_order.execute.side_effect = lambda *args, **kwargs: calls.append("order") or Order(id=1)
+    payment.execute.side_effect = lambda order: calls.append("payment")
+    publisher.publish.side_effect = lambda event_type, order: calls.append("publish")
+    return PlaceOrderService(FakeUnitOfWork(calls), create_order, payment, publisher), payment, publisher
+
+
+def order_in():
+    return OrderIn(items=[OrderItemIn(product_id=1, quantity=1)])
+
+
+def test_order_and_payment_commit_once_before_publishing():
+    calls = []
+    service, _, publisher = make_service(calls)
+
+    order = service.execute(order_in(), client_id=None)
+
+    assert calls == ["order", "payment", "commit", "publish"]
+    publisher.publish.assert_called_once_with(OrderEventType.CREATED, order)
+
+
+def test_payment_failure_rolls_back_the_order():
+    calls = []
+    service, payment, publisher = make_service(calls)
+    payment.execute.side_effect = ValueError("falha no pagamento")
+
+    with pytest.raises(ValueError):
+        service.execute(order_in(), client_id=None)
+
+    assert calls == ["order", "rollback"]
+    publisher.publish.assert_not_called()
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.entities.order import Order
+from app.core.entities.payment import Payment
+from app.core.usecases.orders.update_order_service import UpdateOrderStatusService
+from app.shared.enums.order_event_type import OrderEventType
+from app.shared.enums.order_status import OrderStatus
+from app.shared.enums.payment_status import PaymentStatus
+
+
+@pytest.mark.parametrize("new_status, expected_event", [
+    (OrderStatus.READY, OrderEventType.STATUS_CHANGED),
+    (OrderStatus.COMPLETED, OrderEventType.REMOVED),
+])
+def test_status_change_is_published_to_board(new_status, expected_event):
+    order_repo, payment_repo, publisher = MagicMock(), MagicMock(), MagicMock()
+    order_repo.find_by_id.return_value = Order(id=1)
+    order_repo.update.side_effect = lambda order: order
+    payment_repo.get_by_order_id.return_value = Payment(id=1, order_id=1, status=PaymentStatus.PAID)
+
+    updated = UpdateOrderStatusService(order_repo, payment_repo, publisher).execute(1, new_status)
+
+    publisher.publish.assert_called_once_with(expected_event, updated)
+
+
+def test_rejected_status_change_is_not_published():
+    order_repo, payment_repo, publisher = MagicMock(), MagicMock(), MagicMock()
+    order_repo.find_by_id.return_value = Order(id=1)
+    payment_repo.get_by_order_id.return_value = Payment(id=1, order_id=1, status=PaymentStatus.PENDING)
+
+    with pytest.raises(ValueError):
+        UpdateOrderStatusService(order_repo, payment_repo, publisher).execute(1, OrderStatus.READY)
+
+    publisher.publish.assert_not_called()
@@ -0,0 +1,89 @@
+import asyncio
+
+from app.adapters.notifiers.payment_status_notifier import PaymentStatusNotifier
+from app.core.entities.payment import Payment
+from app.core.usecases.payment.wait_payment_status_service import WaitPaymentStatusService
+from app.shared.enums.payment_status import PaymentStatus
+
+
+class FakePayments:
+    def __init__(self, *statuses: PaymentStatus):
+        self.statuses = list(statuses)
+        self.reads = 0
+
+    async def get(self, order_id: int) -> Payment:
+        status = self.statuses[min(self.reads, len(self.statuses) - 1)]
+        self.reads += 1
+        return Payment(id=1, order_id=order_id, status=status)
+
+
+def test_returns_as_soon_as_the_payment_is_notified():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        payments = FakePayments(PaymentStatus.PENDING, PaymentStatus.PAID)
+        service = WaitPaymentStatusService(payments.get, notifier)
+        asyncio.get_running_loop().call_later(0.05, notifier.publish, [7])
+        return await service.execute(7, timeout=5), payments.reads
+
+    payment, reads = asyncio.run(scenario())
+
+    assert payment.status == PaymentStatus.PAID
+    assert reads == 2
+
+
+def test_rereads_once_when_a_real_wait_times_out():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        payments = FakePayments(PaymentStatus.PENDING)
+        payment = await WaitPaymentStatusService(payments.get, notifier).execute(7, timeout=0.05)
+        return payment, payments.reads, notifier.stats()["waiting"]
+
+    payment, reads, waiting = asyncio.run(scenario())
+
+    assert payment.status == PaymentStatus.PENDING
+    assert reads == 2
+    assert waiting == 0
+
+
+def test_zero_timeout_reads_the_payment_once():
+    async def scenario():
+        payments = FakePayments(PaymentStatus.PENDING, PaymentStatus.PAID)
+        payment = await WaitPaymentStatusService(payments.get, PaymentStatusNotifier()).execute(7, timeout=0)
+        return payment, payments.reads
+
+    payment, reads = asyncio.run(scenario())
+
+    assert payment.status == PaymentStatus.PENDING
+    assert reads == 1
+
+
+def test_timeout_returns_a_change_whose_notification_was_lost():
+    async def scenario():
+        payments = FakePayments(PaymentStatus.PENDING, PaymentStatus.PAID)
+        return await WaitPaymentStatusService(payments.get, PaymentStatusNotifier()).execute(7, timeout=0.05)
+
+    assert asyncio.run(scenario()).status == PaymentStatus.PAID
+
+
+def test_notification_during_first_read_is_not_lost():
+    async def scenario():
+        notifier = PaymentStatusNotifier()
+        payments = FakePayments(PaymentStatus.PENDING, PaymentStatus.PAID)
+
+        async def read_racing_with_webhook(order_id):
+            payment = await payments.get(order_id)
+            if payments.reads == 1:
+                notifier.publish([order_id])
+            return payment
+
+        return await WaitPaymentStatusService(read_racing_with_webhook, notifier).execute(7, timeout=5)
+
+    assert asyncio.run(scenario()).status == PaymentStatus.PAID
+
+
+def test_settled_payment_returns_immediately():
+    async def scenario():
+        payments = FakePayments(PaymentStatus.FAILED)
+        return await WaitPaymentStatusService(payments.get, PaymentStatusNotifier()).execute(7, timeout=5)
+
+    assert asyncio.run(scenario()).status == PaymentStatus.FAILED